@@ -1,11 +1,22 @@
 """
 지역 매핑 스크립트
 입력: medm_reg.txt (중기예보 지역 코드), tidedata-station_info_rows.csv (조위 관측소 정보)
+      marine_zones.geojson (선택, 해상 예보구역 경계 - 있으면 marine_reg_name이 없는 관측소를 좌표로 판정)
 출력: tide-medm_reg.md (TypeScript 매핑 객체)
+      ../supabase/functions/get-medm-weather/medm_mapping.json (Edge Function이 로드하는 지역 정보/매핑 데이터)
 """
 
 import csv
+import os
 import re
+import sys
+from functools import lru_cache
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from aho_corasick import AhoCorasick
+from kma_typ01 import iter_typ01
+from marine_zones import load_marine_zones
+from medm_artifact import build_artifact, decode_artifact, load_artifact, write_artifact
 
 # REG_SP='H'인 해상 지역 매핑 (medm_reg.txt에서 추출)
 marine_regions_map = {
@@ -20,116 +31,172 @@ marine_regions_map = {
     '동해북부': '12C30000',
 }
 
+# 주소로 도시 지역을 찾지 못하거나 주소 판정과 다르게 둘 관측소 (기존 get-medm-weather temperMapping 기준)
+temper_overrides = {
+    'DT_0001': '11B20201',  # 인천 - AddressB "중구"만으로는 인천을 알 수 없음
+    'AD_0009': '11B20201',  # 자월도 - 인천 옹진군
+    'AD_0042': '11H20201',  # 다대포항 - 부산 사하구 (주소에 "부산"이 없음)
+    'DT_0022': '11G00101',  # 성산포 - 서귀포시 성산읍, 서귀포보다 성산 예보가 가까움
+}
+
+# 해상 예보구역 경계 파일 (GeoJSON, properties: REG_ID, REG_NAME)
+MARINE_ZONES_PATH = 'marine_zones.geojson'
+
+# get-medm-weather Edge Function 매핑 데이터 (medm_artifact.py 형식)
+MEDM_ARTIFACT_PATH = os.path.join('..', 'supabase', 'functions', 'get-medm-weather', 'medm_mapping.json')
+
+# 육상 광역 지역 별칭 (예: "서울.인천.경기" <- "서울특별시", "인천광역시", "경기도")
+# AddressA가 빈 관측소는 AddressB(시/군)로 찾으므로 시/군 이름도 포함 (예: "옹진군", "김포시")
+land_region_aliases = {
+    '서울.인천.경기': ('서울', '인천', '경기', '옹진', '김포'),
+    '충청도': ('충청',),
+    '전라도': ('전라', '전북'),
+    '경상도': ('경상', '부산', '울산', '대구'),
+    '경상북도': ('울진', '영덕'),
+}
+
 def read_medm_reg(txt_path):
     """medm_reg.txt에서 지역 코드 읽기"""
     city_regions = {}  # REG_SP='C'
     land_regions = {}  # REG_SP='A'
 
-    with open(txt_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('#'):
-                continue
+    for row in iter_typ01(txt_path):
+        reg_id = row['REG_ID']
+        reg_sp = row['REG_SP']
+        reg_name = row['REG_NAME']
 
-            parts = line.split()
-            if len(parts) >= 5:
-                reg_id = parts[0]
-                reg_sp = parts[3]
-                reg_name = ' '.join(parts[4:])
-
-                if reg_sp == 'C':
-                    city_regions[reg_name] = reg_id
-                elif reg_sp == 'A':
-                    land_regions[reg_name] = reg_id
+        if reg_sp == 'C':
+            city_regions[reg_name] = reg_id
+        elif reg_sp == 'A':
+            land_regions[reg_name] = reg_id
 
     return city_regions, land_regions
 
+def read_medm_regions(txt_path):
+    """medm_reg.txt의 전체 지역 (REG_ID, REG_SP, REG_NAME) 목록"""
+    return [(row['REG_ID'], row['REG_SP'], row['REG_NAME']) for row in iter_typ01(txt_path)]
+
+def build_medm_artifact(regions, marine_mapping, temper_mapping):
+    """get-medm-weather의 getRegionInfo / getLocationCodeMapping 데이터"""
+    return build_artifact(regions, {'marine': marine_mapping, 'temperature': temper_mapping})
+
+def station_from_row(row):
+    """관측소 CSV 한 행 → 매핑용 관측소 정보"""
+    return {
+        'code': row['Code'],
+        'name': row['Name'],
+        'lat': float(row['Latitude']) if row.get('Latitude') else None,
+        'lon': float(row['Longitude']) if row.get('Longitude') else None,
+        'marine_reg_name': row['marine_reg_name'],
+        'address_a': row['AddressA'],
+        'address_b': row['AddressB'],
+        'address_c': row['AddressC'],
+    }
+
 def read_csv_stations(csv_path):
     """CSV 파일에서 관측소 정보 읽기"""
     stations = []
     with open(csv_path, 'r', encoding='utf-8-sig') as f:
         reader = csv.DictReader(f)
         for row in reader:
-            stations.append({
-                'code': row['Code'],
-                'name': row['Name'],
-                'marine_reg_name': row['marine_reg_name'],
-                'address_a': row['AddressA'],
-                'address_b': row['AddressB'],
-                'address_c': row['AddressC'],
-            })
+            stations.append(station_from_row(row))
     return stations
 
-def map_station_to_marine_region(station):
-    """관측소를 해상 중기예보 지역에 매핑"""
+def load_marine_zone_index(zones_path):
+    """해상 예보구역 경계 색인 (파일이 없으면 None - marine_reg_name으로만 매핑)"""
+    if not zones_path or not os.path.exists(zones_path):
+        return None
+    return load_marine_zones(zones_path)
+
+def map_station_to_marine_region(station, zone_index=None):
+    """관측소를 해상 중기예보 지역에 매핑 (marine_reg_name이 없으면 경계 다각형으로 좌표 판정)"""
     marine_reg = station['marine_reg_name']
-    return marine_regions_map.get(marine_reg, None)
+    if marine_reg or zone_index is None or station['lat'] is None:
+        return marine_regions_map.get(marine_reg, None)
+
+    zone = zone_index.assign(station['lat'], station['lon'])
+    return zone['REG_ID'] if zone else None
+
+def _city_matcher(city_regions):
+    """도시 지역명 검색 오토마톤 (지역 목록별로 한 번만 생성)"""
+    return _cached_matcher(tuple((name.strip(), code) for name, code in city_regions.items()))
+
+def _land_matcher(land_regions):
+    """육상 광역 지역명 + 별칭 검색 오토마톤 (지역 목록별로 한 번만 생성)"""
+    patterns = []
+    for land_name, land_code in land_regions.items():
+        land_name_clean = land_name.strip()
+        patterns.append((land_name_clean, land_code))
+        for alias in land_region_aliases.get(land_name_clean, ()):
+            patterns.append((alias, land_code))
+    return _cached_matcher(tuple(patterns))
+
+@lru_cache(maxsize=8)
+def _cached_matcher(patterns):
+    return AhoCorasick(patterns)
 
 def map_station_to_city_region(station, city_regions):
     """관측소를 도시 중기예보 지역에 매핑 (REG_SP='C')"""
     address_b = station['address_b'].strip()
     address_c = station['address_c'].strip()
+    matcher = _city_matcher(city_regions)
 
     # AddressB에서 도시 이름을 찾음 (예: "인천광역시" -> "인천")
-    # 일부 도시는 AddressB에 정확히 매칭됨
-    for city_name, city_code in city_regions.items():
-        city_name_clean = city_name.strip()
-
-        # 정확히 매칭되는 경우
-        if address_b == city_name_clean:
-            return city_code
-
-        # AddressB에 도시 이름이 포함된 경우 (예: "인천광역시" contains "인천")
-        if city_name_clean in address_b:
-            return city_code
-
-        # AddressC에서도 확인 (예: "중구" 등)
-        if city_name_clean in address_c:
-            return city_code
+    # 없으면 AddressC에서도 확인 (예: "중구" 등)
+    # 여러 지역이 포함되면 가장 긴 지역명 → 앞 위치 → medm_reg.txt 순서로 결정
+    for address in (address_b, address_c):
+        match = matcher.longest(address)
+        if match:
+            return match.value
 
     return None
 
 def map_station_to_land_region(station, land_regions):
     """관측소를 육상 광역 중기예보 지역에 매핑 (REG_SP='A')"""
     address_a = station['address_a'].strip()
-    address_b = station['address_b'].strip()
-
-    # AddressA를 기반으로 광역 지역 매핑
-    for land_name, land_code in land_regions.items():
-        land_name_clean = land_name.strip()
-
-        # 정확히 매칭
-        if land_name_clean == address_a:
-            return land_code
-
-        # 부분 매칭 (예: "서울.인천.경기" -> "서울특별시", "인천광역시", "경기도")
-        if '서울.인천.경기' == land_name_clean:
-            if '서울' in address_a or '인천' in address_a or '경기' in address_a:
-                return land_code
 
-        if '충청도' == land_name_clean:
-            if '충청' in address_a:
-                return land_code
+    # AddressA에 포함된 광역 지역명/별칭 중 가장 긴 것
+    # (예: "전라남도"는 별칭 "전라"(전라도)보다 "전라남도"가 우선)
+    # AddressA가 비어 있으면 AddressB로 찾음 (예: "인천광역시", "옹진군")
+    match = _land_matcher(land_regions).longest(address_a or station['address_b'].strip())
+    if match:
+        return match.value
+
+    # AddressA가 지역명의 일부인 경우 (예: "제주" -> "제주도"), 가장 짧은 지역명 우선
+    if address_a:
+        candidates = [(len(land_name.strip()), i, land_code)
+                      for i, (land_name, land_code) in enumerate(land_regions.items())
+                      if address_a in land_name.strip()]
+        if candidates:
+            return min(candidates)[2]
 
-        if '전라도' == land_name_clean:
-            if '전라' in address_a or '전북' in address_a:
-                return land_code
-
-        if '경상도' == land_name_clean:
-            if '경상' in address_a or '부산' in address_a or '울산' in address_a or '대구' in address_a:
-                return land_code
+    return None
 
-        # 직접 포함 관계
-        if land_name_clean in address_a or address_a in land_name_clean:
-            return land_code
+def assign_marine_regions_by_zone(stations, zone_index):
+    """marine_reg_name이 없는 관측소들을 좌표로 한 번에 판정 {code: REG_ID}"""
+    unlabeled = [s for s in stations if not s['marine_reg_name'] and s['lat'] is not None]
+    if zone_index is None or not unlabeled:
+        return {}
 
-    return None
+    zone_ids = zone_index.assign_batch([s['lat'] for s in unlabeled], [s['lon'] for s in unlabeled])
+    return {s['code']: zone_index.zones[zone_id]['REG_ID']
+            for s, zone_id in zip(unlabeled, zone_ids) if zone_id >= 0}
 
-def create_mappings(txt_path, csv_path):
+def create_mappings(txt_path, csv_path, zones_path=MARINE_ZONES_PATH):
     """매핑 생성"""
     city_regions, land_regions = read_medm_reg(txt_path)
     stations = read_csv_stations(csv_path)
 
+    zone_index = load_marine_zone_index(zones_path)
+    if zone_index is None:
+        print(f"해상 예보구역 경계 파일 없음 ({zones_path}): marine_reg_name으로만 해상 매핑")
+
+    return build_mappings(stations, city_regions, land_regions, zone_index)
+
+def build_mappings(stations, city_regions, land_regions, zone_index=None):
+    """읽어 둔 관측소/지역 목록으로 해상·도시·육상 광역 매핑 생성"""
+    zone_assigned = assign_marine_regions_by_zone(stations, zone_index)
+
     # 해상 매핑 (marineMapping)
     marine_mapping = {}
     # 도시 매핑 (temperMapping)
@@ -141,14 +208,14 @@ def create_mappings(txt_path, csv_path):
         code = station['code']
 
         # 해상 지역 매핑
-        marine_region_code = map_station_to_marine_region(station)
+        marine_region_code = map_station_to_marine_region(station) or zone_assigned.get(code)
         if marine_region_code:
             if marine_region_code not in marine_mapping:
                 marine_mapping[marine_region_code] = []
             marine_mapping[marine_region_code].append(code)
 
-        # 도시 지역 매핑
-        city_region_code = map_station_to_city_region(station, city_regions)
+        # 도시 지역 매핑 (temper_overrides 우선)
+        city_region_code = temper_overrides.get(code) or map_station_to_city_region(station, city_regions)
         if city_region_code:
             if city_region_code not in temper_mapping:
                 temper_mapping[city_region_code] = []
@@ -163,6 +230,30 @@ def create_mappings(txt_path, csv_path):
 
     return marine_mapping, temper_mapping, land_mapping
 
+def find_dropped_stations(previous_artifact_path, stations, marine_mapping, temper_mapping):
+    """이전 medm_mapping.json에서 매핑돼 있던 관측소 중 이번에 매핑되지 않은 것 {종류: [code, ...]}"""
+    if not previous_artifact_path or not os.path.exists(previous_artifact_path):
+        return {}
+    _, previous = decode_artifact(load_artifact(previous_artifact_path))
+
+    station_codes = {station['code'] for station in stations}
+    dropped = {}
+    for kind, mapping in (('marine', marine_mapping), ('temperature', temper_mapping)):
+        mapped = {code for codes in mapping.values() for code in codes}
+        before = {code for codes in previous.get(kind, {}).values() for code in codes}
+        missing = sorted((before & station_codes) - mapped)
+        if missing:
+            dropped[kind] = missing
+    return dropped
+
+def check_dropped_stations(previous_artifact_path, stations, marine_mapping, temper_mapping):
+    """이전에 매핑돼 있던 관측소가 빠지면 ValueError (temper_overrides에 추가하거나 주소를 고쳐야 함)"""
+    dropped = find_dropped_stations(previous_artifact_path, stations, marine_mapping, temper_mapping)
+    if dropped:
+        details = '; '.join(f"{kind}: {', '.join(codes)}" for kind, codes in dropped.items())
+        raise ValueError(f"이전 매핑({previous_artifact_path})에 있던 관측소가 매핑되지 않았습니다 - {details} "
+                         f"(map_regions.py의 temper_overrides 확인)")
+
 def format_typescript_object(mapping, region_names_map, indent='  '):
     """TypeScript 객체 형식으로 포맷팅"""
     lines = []
@@ -173,18 +264,12 @@ def format_typescript_object(mapping, region_names_map, indent='  '):
         lines.append(f"{indent}'{key}': [{values_str}], // {region_name}")
     return ',\n'.join(lines)
 
-def main():
-    txt_path = 'medm_reg.txt'
-    csv_path = 'tidedata-station_info_rows.csv'
-    output_path = 'tide-medm_reg.md'
-
-    marine_mapping, temper_mapping, land_mapping = create_mappings(txt_path, csv_path)
-
+def write_mapping_markdown(output_path, marine_mapping, temper_mapping, land_mapping, city_regions, land_regions):
+    """매핑 결과를 Markdown(TypeScript 매핑 객체)으로 저장"""
     # 해상 지역명 맵 (반대 방향)
     marine_names = {v: k for k, v in marine_regions_map.items()}
 
-    # 도시 및 육상 지역명 읽기
-    city_regions, land_regions = read_medm_reg(txt_path)
+    # 도시 및 육상 지역명
     city_names = {v: k for k, v in city_regions.items()}
     land_names = {v: k for k, v in land_regions.items()}
 
@@ -244,7 +329,34 @@ def main():
             region_name = land_names.get(key, key)
             f.write(f'- {key} ({region_name}): {len(stations)}개\n')
 
+def main():
+    txt_path = 'medm_reg.txt'
+    csv_path = 'tidedata-station_info_rows.csv'
+    output_path = 'tide-medm_reg.md'
+
+    marine_mapping, temper_mapping, land_mapping = create_mappings(txt_path, csv_path)
+
+    # 기존 medm_mapping.json에 있던 관측소가 빠지면 아무것도 쓰지 않고 중단
+    try:
+        check_dropped_stations(MEDM_ARTIFACT_PATH, read_csv_stations(csv_path), marine_mapping, temper_mapping)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    # 도시 및 육상 지역명 읽기
+    city_regions, land_regions = read_medm_reg(txt_path)
+
+    write_mapping_markdown(output_path, marine_mapping, temper_mapping, land_mapping, city_regions, land_regions)
+
+    artifact = build_medm_artifact(read_medm_regions(txt_path), marine_mapping, temper_mapping)
+    write_artifact(MEDM_ARTIFACT_PATH, artifact)
+
+    total_marine_stations = sum(len(v) for v in marine_mapping.values())
+    total_temper_stations = sum(len(v) for v in temper_mapping.values())
+    total_land_stations = sum(len(v) for v in land_mapping.values())
+
     print(f'매핑 완료: {output_path}')
+    print(f"Edge Function 매핑 데이터: {MEDM_ARTIFACT_PATH} (content_hash {artifact['content_hash']})")
     print(f'해상 지역: {len(marine_mapping)}개, 관측소: {total_marine_stations}개')
     print(f'도시 지역: {len(temper_mapping)}개, 관측소: {total_temper_stations}개')
     print(f'육상 광역 지역: {len(land_mapping)}개, 관측소: {total_land_stations}개')
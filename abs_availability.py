@@ -0,0 +1,257 @@
+"""
+ABS 해양관측 자료 제공률 분석 (여러 날짜의 abs_api.info 형식 덤프 일괄 처리)
+- 폴더 안의 덤프 파일을 프로세스 풀에서 파일별로 읽고(kma_columnar) 관측소별 결과를 합침
+- 관측 항목(WH, WD, WS, WS_GST, TW, TA, PA, HM)별로
+    비율:     값이 있는 시간 수 / 분석 구간 시간 수
+              (시간 = 요청 시각 기준 정시, 관측시각 -59분 ~ 00분을 같은 시간으로 봄.
+               분석 구간 시간 = 덤프 전체에서 관측 행이 하나라도 있는 시간)
+    최종관측: 값이 있는 마지막 관측시각
+    최장공백: 분석 구간 시간 중 값이 없는 가장 긴 연속 시간 수 (구간 시작/끝까지의 공백 포함,
+              비율과 같은 시간 기준이라 덤프가 없는 시간(예: 하루 한 번 받은 덤프 사이)은 세지 않음)
+- a(수온+파고), b(기온+풍향+풍속) 조합은 항목별 비율이 기준 이상일 때만 표시
+  (기존 new_analyze_abs_data.py는 값이 한 번만 있어도 제공으로 봐서
+   가끔만 보고하는 관측소가 a/b지점으로 선택됨)
+- --write-ab: match_stations.py 등이 읽는 a지점/b지점 CSV를 분석 구간 날짜로 저장
+
+사용법 (프로젝트 루트에서):
+    python3 abs_availability.py abs_dumps/
+    python3 abs_availability.py abs_dumps/ --a-threshold 0.95 --b-threshold 0.9 --max-gap-hours 24 --write-ab tide_abs_info
+"""
+
+import argparse
+import csv
+import glob
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+from kma_columnar import read_columnar
+from kma_typ01 import ABS_COLUMNS, ABS_TYPES
+
+VARIABLES = ('WH', 'WD', 'WS', 'WS_GST', 'TW', 'TA', 'PA', 'HM')
+A_FIELDS = ('TW', 'WH')          # a지점: 해수면온도 + 유의파고
+B_FIELDS = ('TA', 'WD', 'WS')    # b지점: 기온 + 풍향 + 풍속
+DEFAULT_THRESHOLD = 0.9
+DEFAULT_PATTERN = '*.info'
+DEFAULT_OUTPUT = 'abs_availability.csv'
+
+def to_hour(minutes: np.ndarray) -> np.ndarray:
+    """관측시각(분 단위 epoch) → 요청 시각 정시(시간 단위 epoch), -59분 ~ 00분은 같은 정시"""
+    return (minutes + 59) // 60
+
+def _format_time(minutes: int) -> str:
+    return str(np.datetime64(int(minutes), 'm')).replace('T', ' ')
+
+def _format_coord(value: float) -> str:
+    return format(value, '.8f').rstrip('0').rstrip('.')
+
+def scan_file(path: str) -> Dict:
+    """덤프 파일 하나의 관측소 정보와 항목별 (관측소, 관측시각) 목록"""
+    table = read_columnar(path, ABS_COLUMNS, ABS_TYPES)
+    table = table.select((table.row_lengths >= len(ABS_COLUMNS)) & table.valid('TM') & table.valid('STN_ID'))
+    minutes = table['TM'].astype(np.int64)
+    # 남은 행의 관측소만 다시 번호 매김 (categories에는 걸러진 행의 관측소도 있음)
+    present, codes = np.unique(table['STN_ID'], return_inverse=True)
+
+    # 관측소 정보는 파일에서 마지막으로 나온 행 기준
+    stn_ids, names, types = table.strings('STN_ID'), table.strings('STN_KO'), table.strings('TP')
+    info = {}
+    for i in range(len(table)):
+        info[stn_ids[i]] = (names[i], float(table['LAT'][i]), float(table['LON'][i]), types[i])
+
+    return {
+        'path': path,
+        'rows': len(table),
+        'stations': list(table.categories['STN_ID'][present]),
+        'info': info,
+        'hours': np.unique(to_hour(minutes)),
+        'valid': {var: (codes[table.valid(var)], minutes[table.valid(var)]) for var in VARIABLES},
+    }
+
+class AbsAvailability:
+    """파일별 scan_file 결과를 합쳐 관측소 × 항목 제공률 계산"""
+
+    def __init__(self):
+        self.station_ids: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.info: Dict[str, tuple] = {}
+        self.files = 0
+        self.rows = 0
+        self._hours = []
+        self._valid = {var: ([], []) for var in VARIABLES}
+
+    def _station(self, stn_id: str) -> int:
+        if stn_id not in self.index:
+            self.index[stn_id] = len(self.station_ids)
+            self.station_ids.append(stn_id)
+        return self.index[stn_id]
+
+    def add(self, scan: Dict):
+        local_to_global = np.array([self._station(stn_id) for stn_id in scan['stations']], dtype=np.int64)
+        self.info.update(scan['info'])
+        self.files += 1
+        self.rows += scan['rows']
+        self._hours.append(scan['hours'])
+        for var, (codes, minutes) in scan['valid'].items():
+            self._valid[var][0].append(local_to_global[codes] if len(codes) else np.empty(0, dtype=np.int64))
+            self._valid[var][1].append(minutes)
+
+    def window(self) -> np.ndarray:
+        """분석 구간 시간 (관측 행이 있는 정시, 시간 단위 epoch, 정렬)"""
+        return np.unique(np.concatenate(self._hours)) if self._hours else np.empty(0, dtype=np.int64)
+
+    def statistics(self) -> Dict[str, Dict[str, np.ndarray]]:
+        """항목별 {'ratio', 'last_seen'(분, 없으면 -1), 'longest_gap'(분석 구간 시간 수)} 관측소 순서 배열"""
+        window = self.window()
+        n_stations = len(self.station_ids)
+        n_hours = len(window)
+
+        stats = {}
+        for var in VARIABLES:
+            codes = np.concatenate(self._valid[var][0]) if self._valid[var][0] else np.empty(0, dtype=np.int64)
+            minutes = np.concatenate(self._valid[var][1]) if self._valid[var][1] else np.empty(0, dtype=np.int64)
+
+            last_seen = np.full(n_stations, -1, dtype=np.int64)
+            np.maximum.at(last_seen, codes, minutes)
+
+            # (관측소, 분석 구간 시간 순번) 중복 제거 후 관측소별 시간 수와 최장 공백
+            # 순번 기준이라 최장 공백도 비율 분모와 같은 시간 집합에서 빠진 시간 수
+            keys = np.unique(codes * n_hours + np.searchsorted(window, to_hour(minutes)))
+            station_of, position_of = keys // max(n_hours, 1), keys % max(n_hours, 1)
+            counts = np.bincount(station_of, minlength=n_stations)
+
+            longest_gap = np.full(n_stations, n_hours, dtype=np.int64)
+            starts = np.searchsorted(station_of, np.arange(n_stations))
+            ends = np.searchsorted(station_of, np.arange(n_stations), side='right')
+            for s in np.flatnonzero(counts):
+                positions = np.concatenate(([-1], position_of[starts[s]:ends[s]], [n_hours]))
+                longest_gap[s] = int(np.diff(positions).max()) - 1
+
+            stats[var] = {
+                'ratio': counts / n_hours if n_hours else np.zeros(n_stations),
+                'last_seen': last_seen,
+                'longest_gap': longest_gap,
+            }
+        return stats
+
+def combo_flags(stats: Dict[str, Dict[str, np.ndarray]], fields: Sequence[str], threshold: float,
+                max_gap_hours: Optional[int] = None) -> np.ndarray:
+    """
+    항목 모두 비율이 threshold 이상(및 최장 공백이 max_gap_hours 이하)인 관측소
+    값이 한 번도 없는 항목은 threshold와 관계없이 미제공 (threshold=0이면 기존 분석과 같은 기준)
+    """
+    flags = np.ones(len(stats[fields[0]]['ratio']), dtype=bool)
+    for field in fields:
+        ratio = stats[field]['ratio']
+        flags &= (ratio >= threshold) & (ratio > 0)
+        if max_gap_hours is not None:
+            flags &= stats[field]['longest_gap'] <= max_gap_hours
+    return flags
+
+def availability_rows(availability: AbsAvailability, stats: Dict, a_flags: np.ndarray, b_flags: np.ndarray) -> List[Dict]:
+    rows = []
+    for s, stn_id in enumerate(availability.station_ids):
+        name, lat, lon, tp = availability.info[stn_id]
+        row = {
+            '지역명(한글)': name,
+            'STN ID': stn_id,
+            '위도(LAT)': _format_coord(lat),
+            '경도(LON)': _format_coord(lon),
+            '관측종류': tp,
+        }
+        for var in VARIABLES:
+            last_seen = stats[var]['last_seen'][s]
+            row[f'{var}_비율'] = f"{stats[var]['ratio'][s]:.4f}"
+            row[f'{var}_최종관측'] = _format_time(last_seen) if last_seen >= 0 else ''
+            row[f'{var}_최장공백(h)'] = int(stats[var]['longest_gap'][s])
+        row['해수면온도+유의파고'] = 'a' if a_flags[s] else ''
+        row['기온+풍향+풍속'] = 'b' if b_flags[s] else ''
+        rows.append(row)
+    return rows
+
+AVAILABILITY_FIELDNAMES = ['지역명(한글)', 'STN ID', '위도(LAT)', '경도(LON)', '관측종류'] + [
+    f'{var}_{col}' for var in VARIABLES for col in ('비율', '최종관측', '최장공백(h)')
+] + ['해수면온도+유의파고', '기온+풍향+풍속']
+
+def write_ab_station_csv(path: str, prefix: str, rows: List[Dict]):
+    """a지점/b지점 CSV (a_지역명(한글), a_STN ID, a_위도(LAT), a_경도(LON), 모든 값 따옴표)"""
+    fieldnames = [f'{prefix}_지역명(한글)', f'{prefix}_STN ID', f'{prefix}_위도(LAT)', f'{prefix}_경도(LON)']
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+        writer.writerow(fieldnames)
+        for row in rows:
+            writer.writerow([row['지역명(한글)'], row['STN ID'], row['위도(LAT)'], row['경도(LON)']])
+
+def analyze_directory(paths: Sequence[str], workers: Optional[int] = None, serial: bool = False) -> AbsAvailability:
+    """덤프 파일들을 읽어 합친 결과 (파일 순서와 무관하게 같은 결과)"""
+    availability = AbsAvailability()
+    if serial or len(paths) <= 1:
+        for path in paths:
+            availability.add(scan_file(path))
+        return availability
+
+    with ProcessPoolExecutor(max_workers=workers or min(len(paths), os.cpu_count() or 1)) as executor:
+        for scan in executor.map(scan_file, paths):
+            availability.add(scan)
+    return availability
+
+def main():
+    parser = argparse.ArgumentParser(description='ABS 해양관측 자료 항목별 제공률 분석 (여러 날짜 덤프)')
+    parser.add_argument('directory', help='abs_api.info 형식 덤프 파일 폴더')
+    parser.add_argument('--pattern', default=DEFAULT_PATTERN, help=f'덤프 파일 패턴 (기본값: {DEFAULT_PATTERN})')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help=f'결과 CSV (기본값: {DEFAULT_OUTPUT})')
+    parser.add_argument('--a-threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'a(수온+파고) 항목별 최소 비율 (기본값: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--b-threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'b(기온+풍향+풍속) 항목별 최소 비율 (기본값: {DEFAULT_THRESHOLD})')
+    parser.add_argument('--max-gap-hours', type=int, help='a/b 항목별 최장 공백 상한 (분석 구간 정시 수, 기본값: 제한 없음)')
+    parser.add_argument('--write-ab', metavar='DIR', help='a지점/b지점 CSV를 저장할 폴더')
+    parser.add_argument('--workers', type=int, help='프로세스 수 (기본값: CPU 수)')
+    parser.add_argument('--serial', action='store_true', help='프로세스 풀 없이 순서대로 실행')
+    args = parser.parse_args()
+
+    paths = sorted(glob.glob(os.path.join(args.directory, args.pattern)))
+    if not paths:
+        print(f"❌ 덤프 파일이 없습니다: {os.path.join(args.directory, args.pattern)}")
+        sys.exit(1)
+
+    start = time.perf_counter()
+    availability = analyze_directory(paths, args.workers, args.serial)
+    window = availability.window()
+    if not len(window):
+        print(f"❌ ABS 관측 행이 없습니다 (파일 {len(paths)}개)")
+        sys.exit(1)
+
+    stats = availability.statistics()
+    a_flags = combo_flags(stats, A_FIELDS, args.a_threshold, args.max_gap_hours)
+    b_flags = combo_flags(stats, B_FIELDS, args.b_threshold, args.max_gap_hours)
+    rows = availability_rows(availability, stats, a_flags, b_flags)
+
+    with open(args.output, 'w', newline='', encoding='utf-8-sig') as f:
+        writer = csv.DictWriter(f, fieldnames=AVAILABILITY_FIELDNAMES)
+        writer.writeheader()
+        writer.writerows(rows)
+
+    first, last = _format_time(window[0] * 60), _format_time(window[-1] * 60)
+    print(f"📥 파일 {availability.files}개, 관측 행 {availability.rows}개, 관측소 {len(rows)}개 "
+          f"({time.perf_counter() - start:.2f}s)")
+    print(f"🕐 분석 구간: {first} ~ {last} (관측 시간 {len(window)}개)")
+    print(f"✅ a지점 {int(a_flags.sum())}개 (비율 ≥ {args.a_threshold}), b지점 {int(b_flags.sum())}개 (비율 ≥ {args.b_threshold})"
+          + (f", 최장 공백 ≤ {args.max_gap_hours}시간" if args.max_gap_hours is not None else ''))
+    print(f"💾 결과 저장: {args.output}")
+
+    if args.write_ab:
+        period = f"{first[:10]}_{last[:10]}"
+        os.makedirs(args.write_ab, exist_ok=True)
+        a_path = os.path.join(args.write_ab, f'a지점_파고수온제공_{period}.csv')
+        b_path = os.path.join(args.write_ab, f'b지점_기온풍향풍속제공_{period}.csv')
+        write_ab_station_csv(a_path, 'a', [row for row, flag in zip(rows, a_flags) if flag])
+        write_ab_station_csv(b_path, 'b', [row for row, flag in zip(rows, b_flags) if flag])
+        print(f"💾 a/b지점 CSV: {a_path}, {b_path}")
+
+if __name__ == '__main__':
+    main()
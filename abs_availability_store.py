@@ -0,0 +1,267 @@
+"""
+ABS 해양관측소 × 관측 항목 제공률 누적 저장소 (새 ABS 응답을 받을 때마다 갱신)
+- 관측소별 항목별 정시 카운터를 고정 크기 링 버퍼(기본 30일 = 720시간)에 보관
+    counts[관측소, 항목, 슬롯]: 그 정시에 값이 있는 관측 행 수 (uint8, 255에서 멈춤)
+    slot_hours[슬롯]:           슬롯에 담긴 정시 (시간 단위 epoch, -1은 비어 있음)
+  정시 h는 슬롯 h % capacity에 들어가고, 더 새로운 정시가 같은 슬롯에 오면 비우고 다시 씀
+  (창보다 오래된 응답은 버림, 같은 응답을 다시 넣어도 제공률은 같음)
+- 시간 구분은 abs_availability.py와 같음 (요청 시각 기준 정시, 관측시각 -59분 ~ 00분)
+- 제공률 = 값이 있는 정시 수 / 구간 안의 응답을 받은 정시 수 (최근 정시 기준 hours시간)
+  → "최근 7일 수온 제공률 90% 이상 관측소" 같은 조회가 저장소 읽기만으로 끝남
+- match_stations.py / tide_abs_info/new_find_closest_station.py의 --availability-store로
+  고정된 a지점/b지점 CSV 대신 사용
+
+사용법 (프로젝트 루트에서):
+    python3 abs_availability_store.py ingest abs_api.info [abs_dumps/*.info ...]
+    python3 abs_availability_store.py query --var TW WH --min-ratio 0.9 --days 7
+"""
+
+import argparse
+import os
+import sys
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from abs_availability import A_FIELDS, B_FIELDS, VARIABLES, _format_coord, to_hour
+from kma_columnar import ColumnarTable, read_columnar, read_columnar_lines
+from kma_typ01 import ABS_COLUMNS, ABS_TYPES
+
+DEFAULT_STORE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tide_abs_info',
+                                  'abs_availability_store.npz')
+DEFAULT_CAPACITY_HOURS = 30 * 24
+DEFAULT_MIN_RATIO = 0.9
+DEFAULT_DAYS = 7
+MAX_COUNT = np.iinfo(np.uint8).max
+
+# '제공 정보' 컬럼 표기 (abs_region_data_a/b.csv와 같은 형식)
+FIELD_LABELS = {
+    'WH': 'WH(유의파고)', 'WD': 'WD(풍향)', 'WS': 'WS(풍속)', 'WS_GST': 'WS_GST(GUST풍속)',
+    'TW': 'TW(해수면온도)', 'TA': 'TA(기온)', 'PA': 'PA(해면기압)', 'HM': 'HM(상대습도)'
+}
+
+class AvailabilityStore:
+    """관측소 × 항목 × 정시 링 버퍼 카운터"""
+
+    def __init__(self, capacity_hours: int = DEFAULT_CAPACITY_HOURS):
+        self.capacity = capacity_hours
+        self.station_ids: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.info: Dict[str, tuple] = {}  # STN_ID → (관측소명, 위도, 경도, 관측종류), 마지막 응답 기준
+        self.counts = np.zeros((0, len(VARIABLES), capacity_hours), dtype=np.uint8)
+        self.slot_hours = np.full(capacity_hours, -1, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.station_ids)
+
+    def __repr__(self) -> str:
+        return f"AvailabilityStore(관측소 {len(self)}개, 정시 {self.hours_stored()}/{self.capacity}개)"
+
+    @property
+    def latest_hour(self) -> int:
+        """가장 최근 정시 (없으면 -1)"""
+        return int(self.slot_hours.max())
+
+    def hours_stored(self) -> int:
+        return int((self.slot_hours >= 0).sum())
+
+    def _station(self, stn_id: str) -> int:
+        if stn_id not in self.index:
+            self.index[stn_id] = len(self.station_ids)
+            self.station_ids.append(stn_id)
+        return self.index[stn_id]
+
+    def ingest_table(self, table: ColumnarTable) -> int:
+        """ABS 응답 컬럼 배열 반영, 반영한 관측 행 수 반환"""
+        table = table.select((table.row_lengths >= len(ABS_COLUMNS)) & table.valid('TM') & table.valid('STN_ID'))
+        if not len(table):
+            return 0
+
+        hours = to_hour(table['TM'].astype(np.int64))
+        newest = max(self.latest_hour, int(hours.max()))
+        keep = hours > newest - self.capacity
+        table, hours = table.select(keep), hours[keep]
+
+        # 관측소 정보 갱신 (응답에서 마지막으로 나온 행 기준) 및 전역 번호
+        stn_ids, names, types = table.strings('STN_ID'), table.strings('STN_KO'), table.strings('TP')
+        for i in range(len(table)):
+            self.info[stn_ids[i]] = (names[i], float(table['LAT'][i]), float(table['LON'][i]), types[i])
+        present, codes = np.unique(table['STN_ID'], return_inverse=True)
+        local_to_global = np.array([self._station(stn_id) for stn_id in table.categories['STN_ID'][present]],
+                                   dtype=np.int64)
+        stations = local_to_global[codes]
+        if len(self.station_ids) > len(self.counts):
+            grow = np.zeros((len(self.station_ids) - len(self.counts),) + self.counts.shape[1:], dtype=np.uint8)
+            self.counts = np.concatenate([self.counts, grow])
+
+        # 더 새로운 정시가 들어오는 슬롯은 비움 (같은 슬롯의 기존 정시는 창 밖으로 밀려난 것)
+        for hour in np.unique(hours):
+            slot = hour % self.capacity
+            if self.slot_hours[slot] != hour:
+                self.counts[:, :, slot] = 0
+                self.slot_hours[slot] = hour
+
+        slots = hours % self.capacity
+        increments = np.zeros(self.counts.size, dtype=np.int64)
+        for v, var in enumerate(VARIABLES):
+            valid = table.valid(var)
+            flat = (stations[valid] * len(VARIABLES) + v) * self.capacity + slots[valid]
+            increments += np.bincount(flat, minlength=self.counts.size)
+        total = self.counts.reshape(-1).astype(np.int64) + increments
+        self.counts = np.minimum(total, MAX_COUNT).astype(np.uint8).reshape(self.counts.shape)
+        return len(table)
+
+    def ingest_file(self, path: str) -> int:
+        return self.ingest_table(read_columnar(path, ABS_COLUMNS, ABS_TYPES))
+
+    def ingest_lines(self, lines: Iterable[str]) -> int:
+        """이미 받은 ABS 응답 텍스트(줄 목록) 반영"""
+        return self.ingest_table(read_columnar_lines(lines, ABS_COLUMNS, ABS_TYPES))
+
+    def window_slots(self, hours: Optional[int] = None) -> np.ndarray:
+        """최근 정시 기준 hours시간 구간의 응답을 받은 슬롯 (bool 배열)"""
+        hours = min(hours or self.capacity, self.capacity)
+        latest = self.latest_hour
+        return (self.slot_hours >= 0) & (self.slot_hours > latest - hours)
+
+    def ratios(self, hours: Optional[int] = None) -> np.ndarray:
+        """관측소 × 항목 제공률 (VARIABLES 순서, 응답이 없으면 0)"""
+        slots = self.window_slots(hours)
+        provided = (self.counts[:, :, slots] > 0).sum(axis=2)
+        return provided / slots.sum() if slots.any() else np.zeros(provided.shape)
+
+    def providing(self, variables: Sequence[str], min_ratio: float = DEFAULT_MIN_RATIO,
+                  hours: Optional[int] = None) -> np.ndarray:
+        """variables 모두 제공률이 min_ratio 이상인 관측소 (bool 배열, 값이 한 번도 없는 항목은 미제공)"""
+        ratios = self.ratios(hours)
+        flags = np.ones(len(self), dtype=bool)
+        for var in variables:
+            ratio = ratios[:, VARIABLES.index(var)]
+            flags &= (ratio >= min_ratio) & (ratio > 0)
+        return flags
+
+    def abs_station_rows(self, variables: Sequence[str], min_ratio: float = DEFAULT_MIN_RATIO,
+                         hours: Optional[int] = None) -> List[Dict]:
+        """
+        variables를 제공하는 관측소를 abs_region_data_a/b.csv 행 형식으로 반환
+        ('제공 정보'는 제공률 기준을 넘는 항목을 '+'로 연결, lat_float/lon_float 포함)
+        """
+        ratios = self.ratios(hours)
+        rows = []
+        for s in np.flatnonzero(self.providing(variables, min_ratio, hours)):
+            stn_id = self.station_ids[s]
+            name, lat, lon, tp = self.info[stn_id]
+            provided = [var for v, var in enumerate(VARIABLES) if ratios[s, v] >= min_ratio and ratios[s, v] > 0]
+            rows.append({
+                '지역명(한글)': name,
+                'STN ID': stn_id,
+                '위도(LAT)': _format_coord(lat),
+                '경도(LON)': _format_coord(lon),
+                '관측종류': tp,
+                '제공 정보': '+'.join(sorted(FIELD_LABELS[var] for var in provided)),
+                'lat_float': lat,
+                'lon_float': lon,
+            })
+        return rows
+
+    def save(self, path: str):
+        """npz로 저장 (임시 파일에 쓴 뒤 교체)"""
+        infos = [self.info[stn_id] for stn_id in self.station_ids]
+        tmp_path = path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            np.savez_compressed(
+                f,
+                station_ids=np.array(self.station_ids, dtype=str),
+                names=np.array([info[0] for info in infos], dtype=str),
+                lats=np.array([info[1] for info in infos], dtype=np.float64),
+                lons=np.array([info[2] for info in infos], dtype=np.float64),
+                types=np.array([info[3] for info in infos], dtype=str),
+                variables=np.array(VARIABLES, dtype=str),
+                counts=self.counts,
+                slot_hours=self.slot_hours,
+            )
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path: str) -> 'AvailabilityStore':
+        """저장된 npz 읽기 (항목 구성이 다르면 ValueError)"""
+        with np.load(path) as data:
+            if tuple(data['variables']) != VARIABLES:
+                raise ValueError(f"관측 항목 구성이 다릅니다: {', '.join(data['variables'])}")
+            store = cls(len(data['slot_hours']))
+            store.counts = data['counts'].copy()
+            store.slot_hours = data['slot_hours'].copy()
+            for stn_id, name, lat, lon, tp in zip(data['station_ids'], data['names'], data['lats'],
+                                                  data['lons'], data['types']):
+                store._station(str(stn_id))
+                store.info[str(stn_id)] = (str(name), float(lat), float(lon), str(tp))
+        return store
+
+def open_store(path: str = DEFAULT_STORE_PATH, capacity_hours: int = DEFAULT_CAPACITY_HOURS) -> AvailabilityStore:
+    """저장소 읽기 (파일이 없으면 빈 저장소)"""
+    if os.path.exists(path):
+        return AvailabilityStore.load(path)
+    return AvailabilityStore(capacity_hours)
+
+def load_ab_stations(path: str = DEFAULT_STORE_PATH, min_ratio: float = DEFAULT_MIN_RATIO,
+                     days: float = DEFAULT_DAYS):
+    """저장소 기준 a지점(수온+파고) / b지점(기온+풍향+풍속) 관측소 행 목록"""
+    store = AvailabilityStore.load(path)
+    hours = int(days * 24)
+    return store.abs_station_rows(A_FIELDS, min_ratio, hours), store.abs_station_rows(B_FIELDS, min_ratio, hours)
+
+def _format_hour(hour: int) -> str:
+    return str(np.datetime64(int(hour), 'h')).replace('T', ' ') + ':00'
+
+def main():
+    parser = argparse.ArgumentParser(description='ABS 관측소 × 항목 제공률 누적 저장소')
+    parser.add_argument('--store', default=DEFAULT_STORE_PATH, help='저장소 파일 (npz)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    ingest_parser = subparsers.add_parser('ingest', help='ABS 응답 파일(abs_api.info 형식) 반영')
+    ingest_parser.add_argument('files', nargs='+')
+    ingest_parser.add_argument('--capacity-days', type=int, default=DEFAULT_CAPACITY_HOURS // 24,
+                               help='새 저장소를 만들 때 보관 기간(일)')
+
+    query_parser = subparsers.add_parser('query', help='항목별 제공률 기준을 넘는 관측소 조회')
+    query_parser.add_argument('--var', nargs='+', choices=VARIABLES, default=list(A_FIELDS))
+    query_parser.add_argument('--min-ratio', type=float, default=DEFAULT_MIN_RATIO)
+    query_parser.add_argument('--days', type=float, default=DEFAULT_DAYS)
+    args = parser.parse_args()
+
+    try:
+        store = open_store(args.store, getattr(args, 'capacity_days', DEFAULT_CAPACITY_HOURS // 24) * 24)
+    except (OSError, ValueError, KeyError) as e:
+        print(f"❌ 저장소를 읽을 수 없습니다: {args.store} ({e})")
+        sys.exit(1)
+
+    if args.command == 'ingest':
+        for path in args.files:
+            try:
+                rows = store.ingest_file(path)
+            except OSError as e:
+                print(f"⚠️ 건너뜀: {path} ({e})")
+                continue
+            print(f"📥 {path}: 관측 행 {rows}개 반영")
+        store.save(args.store)
+        print(f"💾 저장: {args.store} - {store}")
+        return
+
+    if not store.hours_stored():
+        print(f"❌ 저장된 응답이 없습니다: {args.store} (먼저 ingest를 실행하세요)")
+        sys.exit(1)
+
+    hours = int(args.days * 24)
+    slots = store.window_slots(hours)
+    ratios = store.ratios(hours)
+    flags = store.providing(args.var, args.min_ratio, hours)
+    print(f"📋 {store}, 최근 정시 {_format_hour(store.latest_hour)}")
+    print(f"   최근 {args.days:g}일 중 응답 정시 {int(slots.sum())}개, "
+          f"{'+'.join(args.var)} 제공률 {args.min_ratio:.0%} 이상 관측소 {int(flags.sum())}개")
+    for s in np.flatnonzero(flags):
+        stn_id = store.station_ids[s]
+        detail = ', '.join(f"{var} {ratios[s, VARIABLES.index(var)]:.0%}" for var in args.var)
+        print(f"   {stn_id:>6} {store.info[stn_id][0]}: {detail}")
+
+if __name__ == '__main__':
+    main()
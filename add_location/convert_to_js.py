@@ -5,22 +5,23 @@
 사용법: python3 convert_to_js.py
 """
 
-import xml.etree.ElementTree as ET
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from location_loader import load_locations
 
 def convert_xml_to_js():
     # XML 파일 읽기
     xml_file = 'total_locations.xml'
     js_file = '../netlify/shared/locations.js'
+    geohash_json = '../netlify/shared/locations_geohash.json'
 
     if not os.path.exists(xml_file):
         print(f"❌ 오류: {xml_file} 파일을 찾을 수 없습니다.")
         return
 
-    tree = ET.parse(xml_file)
-    root = tree.getroot()
-
-    locations = root.findall('Location')
+    locations = load_locations(xml_file)
     count = len(locations)
 
     # JavaScript 파일 생성
@@ -33,13 +34,25 @@ const locations = [
 
     # 각 관측소를 JavaScript 객체로 변환
     for location in locations:
-        code = location.find('Code').text
-        name = location.find('Name').text
-        js_content += f'    {{code: "{code}", name: "{name}"}},\n'
+        js_content += f'    {{code: "{location.code}", name: "{location.name}"}},\n'
 
-    # 배열 닫기 및 export
+    # 배열 닫기
     js_content += """];
+"""
+
+    # GPS 좌표 → 최근접 관측소 조회용 geohash 인덱스 (geohash_index.py로 생성한 JSON을 그대로 포함)
+    if os.path.exists(geohash_json):
+        with open(geohash_json, 'r', encoding='utf-8') as f:
+            geohash_index = f.read().strip()
+        js_content += f"""
+// GPS 좌표 → 최근접 관측소 geohash 인덱스
+// 자동 생성: geohash_index.py (locations_geohash.json)
+// 조회: shared/nearest_location.js의 findNearestLocation(lat, lon) → {{code, name, distanceKm}}
+const locationGeohashIndex = {geohash_index};
+"""
 
+    # export
+    js_content += """
 // Export for use in other files
 if (typeof module !== 'undefined' && module.exports) {
     module.exports = locations;
@@ -1,11 +1,127 @@
+import argparse
 import os
 import json
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
-def upload_json_to_supabase():
+TABLE_NAME = "tide_data"
+JSON_FILE_PATH = "merged_2026_tideData.json"
+BATCH_SIZE = 1000
+READ_CHUNK_SIZE = 1 << 20  # 스트리밍 모드에서 한 번에 읽는 문자 수
+
+def iter_locations(f, chunk_size=READ_CHUNK_SIZE):
+    """
+    최상위 JSON 배열의 지역 객체를 하나씩 파싱해 반환합니다. (파일 전체를 읽지 않음)
+    버퍼에는 아직 파싱하지 못한 지역 객체 하나 분량만 남깁니다.
+    """
+    decoder = json.JSONDecoder()
+    buffer, pos, eof = '', 0, False
+    state = 'start'  # start: '[' 필요, first: 값 또는 ']', value: 값, sep: ',' 또는 ']'
+
+    while True:
+        while pos < len(buffer) and buffer[pos].isspace():
+            pos += 1
+        if pos == len(buffer):
+            if eof:
+                raise json.JSONDecodeError("배열이 ']'로 끝나지 않았습니다", buffer, pos)
+            chunk = f.read(chunk_size)
+            buffer, pos, eof = chunk, 0, not chunk
+            continue
+
+        char = buffer[pos]
+        if state == 'start':
+            if char != '[':
+                raise json.JSONDecodeError("최상위 값이 배열이 아닙니다", buffer, pos)
+            pos += 1
+            state = 'first'
+            continue
+        if state == 'sep' or (state == 'first' and char == ']'):
+            if char == ']':
+                return
+            if char != ',':
+                raise json.JSONDecodeError("',' 또는 ']'가 필요합니다", buffer, pos)
+            pos += 1
+            state = 'value'
+            continue
+
+        try:
+            obj, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            end = None
+        if end is None or (end == len(buffer) and not eof):
+            # 객체가 버퍼 뒤로 이어짐: 남은 부분만큼 더 읽어 다시 시도 (큰 객체도 읽기 횟수가 로그 수준)
+            chunk = f.read(max(chunk_size, len(buffer) - pos))
+            buffer, pos, eof = buffer[pos:] + chunk, 0, not chunk
+            continue
+
+        yield obj
+        buffer, pos = buffer[end:], 0
+        state = 'sep'
+
+def tide_row(location_code, location_name, tide_entry):
+    """tideData 항목 하나를 tide_data 테이블 행으로 변환"""
+    tide_data = tide_entry.get('data', {})
+    return {
+        'obs_date': tide_entry.get('date'),
+        'obs_post_name': tide_data.get('obsPostName'),
+        'location_code': location_code,
+        'location_name': location_name,
+        'obs_lon': tide_data.get('obsLon'),
+        'obs_lat': tide_data.get('obsLat'),
+        'lvl1': tide_data.get('lvl1'),
+        'lvl2': tide_data.get('lvl2'),
+        'lvl3': tide_data.get('lvl3'),
+        'lvl4': tide_data.get('lvl4'),
+        'date_sun': tide_data.get('dateSun'),
+        'date_moon': tide_data.get('dateMoon'),
+        'mool_normal': tide_data.get('moolNormal'),
+        'mool7': tide_data.get('mool7'),
+        'mool8': tide_data.get('mool8')
+    }
+
+def iter_tide_rows(locations):
+    """지역 객체들의 tideData를 행 단위로 펼침"""
+    for location_obj in locations:
+        location_code = location_obj.get('location', {}).get('code')
+        location_name = location_obj.get('location', {}).get('name')
+
+        for tide_entry in location_obj.get('tideData', []):
+            yield tide_row(location_code, location_name, tide_entry)
+
+def iter_batches(rows, batch_size):
+    """
+    행을 batch_size개씩 묶어 바로 반환 (전체 행을 모으지 않음)
+    배치 안의 중복 키는 마지막 행만 남기고, 앞선 배치에 있던 키는 뒤 배치의 upsert가 덮어써 마지막 행이 남습니다.
+    """
+    batch = {}
+    for row in rows:
+        key = (row['obs_date'], row['location_code'])
+        batch[key] = row  # 같은 키면 덮어씀 (마지막 것이 유지됨)
+        if len(batch) >= batch_size:
+            yield list(batch.values())
+            batch = {}
+    if batch:
+        yield list(batch.values())
+
+def upsert_batch(supabase, batch, batch_num, total_batches=None):
+    progress = f"{batch_num}/{total_batches}" if total_batches else f"{batch_num}"
+    print(f"배치 {progress} 업로드 중... ({len(batch)}개)")
+
+    response = supabase.table(TABLE_NAME).upsert(batch, on_conflict='obs_date,location_code').execute()
+
+    if response.data:
+        print(f"  ✓ 배치 {batch_num} 업로드 완료")
+    else:
+        print(f"  ✗ 배치 {batch_num} 업로드 중 오류 발생")
+        print(response)
+
+def upload_json_to_supabase(json_file_path=JSON_FILE_PATH, stream=False, batch_size=BATCH_SIZE):
     """
     merged_ad_tideData.json 파일의 데이터를 Supabase의 tide_data 테이블에 업로드합니다.
+    stream=True이면 지역 객체를 하나씩 읽어 배치가 찰 때마다 바로 업로드합니다.
+    (메모리 사용량이 파일 크기가 아니라 배치 크기 + 지역 객체 하나에 비례)
     """
     # .env 파일에서 환경 변수 로드
     dotenv_path = os.path.join(os.path.dirname(__file__), '..', '.env')
@@ -22,45 +138,30 @@ def upload_json_to_supabase():
 
     supabase: Client = create_client(url, key)
 
-    table_name = "tide_data"
-    json_file_path = "merged_2026_tideData.json"
+    table_name = TABLE_NAME
 
     # JSON 파일 읽기 및 데이터 업로드
     try:
         with open(json_file_path, mode='r', encoding='utf-8') as f:
-            data = json.load(f)
+            if stream:
+                print(f"'{json_file_path}' 파일을 스트리밍으로 읽어 '{table_name}' 테이블에 업로드합니다... (배치 {batch_size}개)")
+                rows = 0
+                batch_num = 0
+                for batch in iter_batches(iter_tide_rows(iter_locations(f)), batch_size):
+                    batch_num += 1
+                    rows += len(batch)
+                    upsert_batch(supabase, batch, batch_num)
+
+                if batch_num:
+                    print(f"\n모든 데이터 업로드가 완료되었습니다. (배치 {batch_num}개, 업로드 행 {rows}개)")
+                else:
+                    print("업로드할 데이터가 없습니다.")
+                return
 
-        data_to_upload = []
+            data = json.load(f)
 
         # JSON 데이터 파싱
-        for location_obj in data:
-            location_code = location_obj.get('location', {}).get('code')
-            location_name = location_obj.get('location', {}).get('name')
-
-            for tide_entry in location_obj.get('tideData', []):
-                obs_date = tide_entry.get('date')
-                tide_data = tide_entry.get('data', {})
-
-                # 테이블 구조에 맞게 데이터 변환
-                row = {
-                    'obs_date': obs_date,
-                    'obs_post_name': tide_data.get('obsPostName'),
-                    'location_code': location_code,
-                    'location_name': location_name,
-                    'obs_lon': tide_data.get('obsLon'),
-                    'obs_lat': tide_data.get('obsLat'),
-                    'lvl1': tide_data.get('lvl1'),
-                    'lvl2': tide_data.get('lvl2'),
-                    'lvl3': tide_data.get('lvl3'),
-                    'lvl4': tide_data.get('lvl4'),
-                    'date_sun': tide_data.get('dateSun'),
-                    'date_moon': tide_data.get('dateMoon'),
-                    'mool_normal': tide_data.get('moolNormal'),
-                    'mool7': tide_data.get('mool7'),
-                    'mool8': tide_data.get('mool8')
-                }
-
-                data_to_upload.append(row)
+        data_to_upload = list(iter_tide_rows(data))
 
         # 중복 제거: 같은 obs_date + location_code 조합이 여러 개 있으면 마지막 것만 유지
         unique_data = {}
@@ -74,22 +175,13 @@ def upload_json_to_supabase():
         if data_to_upload:
             print(f"총 {len(data_to_upload)}개의 데이터를 '{table_name}' 테이블에 업로드합니다...")
 
-            # 대량 데이터는 배치로 나눠서 업로드 (1000개씩)
-            batch_size = 1000
+            # 대량 데이터는 배치로 나눠서 업로드 (batch_size개씩)
             total_batches = (len(data_to_upload) + batch_size - 1) // batch_size
 
             for i in range(0, len(data_to_upload), batch_size):
                 batch = data_to_upload[i:i + batch_size]
                 batch_num = (i // batch_size) + 1
-                print(f"배치 {batch_num}/{total_batches} 업로드 중... ({len(batch)}개)")
-
-                response = supabase.table(table_name).upsert(batch, on_conflict='obs_date,location_code').execute()
-
-                if response.data:
-                    print(f"  ✓ 배치 {batch_num} 업로드 완료")
-                else:
-                    print(f"  ✗ 배치 {batch_num} 업로드 중 오류 발생")
-                    print(response)
+                upsert_batch(supabase, batch, batch_num, total_batches)
 
             print("\n모든 데이터 업로드가 완료되었습니다.")
         else:
@@ -106,4 +198,10 @@ def upload_json_to_supabase():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    upload_json_to_supabase()
+    parser = argparse.ArgumentParser(description='조석 JSON 데이터를 Supabase tide_data 테이블에 업로드')
+    parser.add_argument('--file', default=JSON_FILE_PATH, help='업로드할 JSON 파일')
+    parser.add_argument('--stream', action='store_true',
+                        help='지역 객체를 하나씩 읽어 배치가 찰 때마다 업로드 (메모리 사용량이 배치 크기에 비례)')
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE, help='upsert 배치 크기')
+    args = parser.parse_args()
+    upload_json_to_supabase(args.file, stream=args.stream, batch_size=args.batch_size)
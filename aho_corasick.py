@@ -0,0 +1,88 @@
+"""
+Aho-Corasick 다중 패턴 문자열 검색
+- 지역명/별칭 목록을 한 번 오토마톤으로 만들어 두면 주소 문자열 1회 선형 탐색으로 모든 일치 위치를 찾음
+  (지역마다 `in` 검사를 반복하는 방식은 주소 1건당 O(지역 수 × 주소 길이))
+- longest(): 일치가 여러 개일 때 결정적인 규칙으로 하나를 고름
+  가장 긴 패턴 → 가장 앞 위치 → 먼저 등록된 패턴 순
+  (예: '전라남도'에서 '전라'(전라도 별칭)와 '전라남도'가 모두 일치하면 '전라남도')
+
+사용 예:
+    matcher = AhoCorasick([('인천', '11B20201'), ('중구', '...')])
+    matcher.find_all('인천광역시 중구')  # [Match(0, 2, '인천', ...), Match(6, 8, '중구', ...)]
+"""
+
+from collections import deque, namedtuple
+from typing import Any, Iterable, List, Optional, Tuple
+
+Match = namedtuple('Match', ['start', 'end', 'pattern', 'value'])
+
+class AhoCorasick:
+    """(패턴, 값) 목록에 대한 다중 패턴 검색 오토마톤 (같은 패턴이 여러 번 나오면 먼저 등록된 값 사용)"""
+
+    def __init__(self, patterns: Iterable[Tuple[str, Any]]):
+        self._goto = [{}]       # 노드별 전이 (문자 → 노드)
+        self._fail = [0]        # 실패 링크
+        self._output = [[]]     # 노드에서 끝나는 패턴 번호 (실패 링크를 따라 모은 것 포함)
+        self.patterns: List[str] = []
+        self.values: List[Any] = []
+
+        self._order = {}
+        for pattern, value in patterns:
+            if not pattern or pattern in self._order:
+                continue
+            self._order[pattern] = len(self.patterns)
+            self._add(pattern, len(self.patterns))
+            self.patterns.append(pattern)
+            self.values.append(value)
+        self._build_links()
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def _add(self, pattern: str, pattern_id: int):
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = nxt
+        self._output[node].append(pattern_id)
+
+    def _build_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._output[nxt] = self._output[nxt] + self._output[self._fail[nxt]]
+                queue.append(nxt)
+
+    def find_all(self, text: str) -> List[Match]:
+        """text 안의 모든 패턴 일치 (끝 위치 순)"""
+        matches = []
+        node = 0
+        for i, ch in enumerate(text):
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            for pattern_id in self._output[node]:
+                pattern = self.patterns[pattern_id]
+                matches.append(Match(i + 1 - len(pattern), i + 1, pattern, self.values[pattern_id]))
+        return matches
+
+    def longest(self, text: str) -> Optional[Match]:
+        """가장 긴 일치 (같으면 앞 위치, 그다음 먼저 등록된 패턴), 없으면 None"""
+        best = None
+        best_key = None
+        for match in self.find_all(text):
+            key = (-len(match.pattern), match.start, self._order[match.pattern])
+            if best_key is None or key < best_key:
+                best, best_key = match, key
+        return best
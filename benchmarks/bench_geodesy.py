@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+geodesy 거리 계산 방식 비교 벤치마크 (실제 관측소 목록 사용)
+- 조석관측소(locations_with_addresses.xml) × 해양관측소(a/b지점 CSV) 전체 쌍
+- 방식: 스칼라 haversine 반복 / NumPy haversine 행렬 / NumPy 등장방형 근사 행렬
+- 근사 오차는 haversine 행렬 대비 최대 절대/상대 오차 (전체, 100 km 이하 구간)
+
+사용법 (프로젝트 루트에서): python3 benchmarks/bench_geodesy.py
+"""
+
+import glob
+import os
+import sys
+import time
+
+import numpy as np
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+sys.path.insert(0, ROOT_DIR)
+from geodesy import equirectangular_matrix, haversine_distance, haversine_matrix
+from match_stations import load_marine_stations, load_tide_stations
+
+REPEAT = 5
+
+def find_input(pattern):
+    """tide_abs_info 아래 입력 파일 찾기 (파일명 유니코드 정규화 차이 대비 glob 사용)"""
+    matches = sorted(glob.glob(os.path.join(ROOT_DIR, 'tide_abs_info', pattern)))
+    if not matches:
+        raise FileNotFoundError(pattern)
+    return matches[-1]
+
+def best_of(func, repeat=REPEAT):
+    """repeat회 실행 중 최소 시간(초)과 마지막 결과"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def main():
+    tide_stations = load_tide_stations(os.path.join(ROOT_DIR, 'tide_abs_info', 'locations_with_addresses.xml'))
+    marine_stations = list(load_marine_stations(
+        find_input('a*_2026-01-10_2026-01-17.csv'),
+        find_input('b*_2026-01-10_2026-01-17.csv'),
+    ).values())
+
+    tide_lats = np.array([s['lat'] for s in tide_stations])
+    tide_lons = np.array([s['lon'] for s in tide_stations])
+    marine_lats = np.array([m['lat'] for m in marine_stations])
+    marine_lons = np.array([m['lon'] for m in marine_stations])
+    n_pairs = len(tide_stations) * len(marine_stations)
+
+    def scalar():
+        return [[haversine_distance(t['lat'], t['lon'], m['lat'], m['lon']) for m in marine_stations]
+                for t in tide_stations]
+
+    scalar_time, scalar_result = best_of(scalar, repeat=1)
+    batch_time, exact = best_of(lambda: haversine_matrix(tide_lats, tide_lons, marine_lats, marine_lons))
+    fast_time, approx = best_of(lambda: equirectangular_matrix(tide_lats, tide_lons, marine_lats, marine_lons))
+
+    print(f"조석관측소 {len(tide_stations)}개 × 해양관측소 {len(marine_stations)}개 = {n_pairs}쌍")
+    print("-" * 72)
+    print(f"{'방식':<28} {'시간(ms)':>10} {'쌍당(ns)':>10} {'배속':>8}")
+    for label, elapsed in (('scalar haversine', scalar_time),
+                           ('numpy haversine', batch_time),
+                           ('numpy equirectangular', fast_time)):
+        print(f"{label:<28} {elapsed * 1000:>10.2f} {elapsed / n_pairs * 1e9:>10.1f} {scalar_time / elapsed:>7.1f}x")
+
+    scalar_error = np.max(np.abs(np.array(scalar_result) - exact))
+    abs_error = np.abs(approx - exact)
+    rel_error = abs_error / np.maximum(exact, 1e-9)
+    near = exact <= 100
+
+    print("-" * 72)
+    print(f"scalar vs numpy haversine 최대 차이: {scalar_error:.2e} km")
+    print(f"equirectangular 최대 오차 (전체):      {abs_error.max() * 1000:8.2f} m  (상대 {rel_error.max():.2e})")
+    if near.any():
+        print(f"equirectangular 최대 오차 (100km 이하): {abs_error[near].max() * 1000:8.2f} m  "
+              f"(상대 {rel_error[near].max():.2e}, {int(near.sum())}쌍)")
+
+if __name__ == '__main__':
+    main()
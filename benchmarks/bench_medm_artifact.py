@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+get-medm-weather 매핑 데이터 형식 비교 벤치마크 (실제 medm_reg.txt / 관측소 CSV 사용)
+- nested:  기존 index.ts와 같은 형태 (regionData 객체 배열 + {marine, temperature} reg_id → 코드 배열 객체)
+- compact: medm_artifact.py 형식 (정수 색인 배열, medm_mapping.json)
+- 크기: JSON 바이트 / gzip 바이트
+- 파싱: json.loads, json.loads + index.ts와 같은 형태로 복원 (repeat회 중 최소 시간)
+- node가 있으면 JSON.parse 시간도 측정 (Deno와 같은 V8 엔진)
+
+사용법 (프로젝트 루트에서): python3 benchmarks/bench_medm_artifact.py [--repeat 200]
+"""
+
+import argparse
+import glob
+import gzip
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+MEDM_DIR = sorted(glob.glob(os.path.join(ROOT_DIR, '02_kma*')))[0]
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, MEDM_DIR)
+import map_regions
+from medm_artifact import build_artifact, decode_artifact, dumps_artifact
+
+NODE_PARSE_SCRIPT = """
+const fs = require('fs');
+const [path, repeat] = [process.argv[1], Number(process.argv[2])];
+const text = fs.readFileSync(path, 'utf8');
+let best = Infinity;
+for (let i = 0; i < repeat; i++) {
+  const start = process.hrtime.bigint();
+  JSON.parse(text);
+  best = Math.min(best, Number(process.hrtime.bigint() - start) / 1e9);
+}
+console.log(best);
+"""
+
+def best_of(func, repeat):
+    """repeat회 실행 중 최소 시간(초)"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def nested_form(regions, mappings):
+    """기존 index.ts의 regionData / getLocationCodeMapping 형태"""
+    return {
+        'regionData': [{'REG_ID': reg_id, 'REG_SP': reg_sp, 'REG_NAME': reg_name} for reg_id, reg_sp, reg_name in regions],
+        'mapping': {kind: {reg_id: sorted(codes) for reg_id, codes in sorted(mapping.items())}
+                    for kind, mapping in mappings.items()},
+    }
+
+def decode_nested(data):
+    return {region['REG_ID']: region for region in data['regionData']}, data['mapping']
+
+def node_parse_time(text, repeat):
+    node = shutil.which('node')
+    if node is None:
+        return None
+    with tempfile.NamedTemporaryFile('w', suffix='.json', encoding='utf-8', delete=False) as f:
+        f.write(text)
+    try:
+        result = subprocess.run([node, '-e', NODE_PARSE_SCRIPT, f.name, str(repeat)],
+                                capture_output=True, text=True, check=True)
+        return float(result.stdout.strip())
+    except (OSError, subprocess.CalledProcessError, ValueError):
+        return None
+    finally:
+        os.unlink(f.name)
+
+def main():
+    parser = argparse.ArgumentParser(description='get-medm-weather 매핑 데이터 형식 비교')
+    parser.add_argument('--repeat', type=int, default=200, help='파싱 반복 횟수')
+    args = parser.parse_args()
+
+    txt_path = os.path.join(MEDM_DIR, 'medm_reg.txt')
+    csv_path = os.path.join(MEDM_DIR, 'tidedata-station_info_rows.csv')
+    marine_mapping, temper_mapping, _ = map_regions.create_mappings(
+        txt_path, csv_path, zones_path=os.path.join(MEDM_DIR, map_regions.MARINE_ZONES_PATH))
+    regions = map_regions.read_medm_regions(txt_path)
+    mappings = {'marine': marine_mapping, 'temperature': temper_mapping}
+
+    artifact = build_artifact(regions, mappings)
+    # 두 형식 모두 DB에 저장 가능한 지역만 (build_artifact가 제외한 REG_SP 제외)
+    regions = list(zip(artifact['regions']['id'], artifact['regions']['sp'], artifact['regions']['name']))
+    texts = {
+        'nested': json.dumps(nested_form(regions, mappings), ensure_ascii=False, separators=(',', ':')),
+        'compact': dumps_artifact(artifact),
+    }
+    decoders = {'nested': decode_nested, 'compact': decode_artifact}
+
+    assert decode_artifact(json.loads(texts['compact']))[1] == decode_nested(json.loads(texts['nested']))[1]
+
+    print(f"📋 지역 {len(regions)}개, location_code {len(artifact['locations'])}개, content_hash {artifact['content_hash']}")
+    print(f"   {'형식':<8} {'bytes':>8} {'gzip':>7} {'loads(ms)':>10} {'+decode(ms)':>12} {'node(ms)':>9}")
+    for name, text in texts.items():
+        raw = text.encode('utf-8')
+        loads = best_of(lambda: json.loads(text), args.repeat)
+        decoded = best_of(lambda: decoders[name](json.loads(text)), args.repeat)
+        node = node_parse_time(text, args.repeat)
+        node_str = f"{node * 1000:>9.3f}" if node is not None else f"{'-':>9}"
+        print(f"   {name:<8} {len(raw):>8} {len(gzip.compress(raw)):>7} {loads * 1000:>10.3f} "
+              f"{decoded * 1000:>12.3f} {node_str}")
+
+if __name__ == '__main__':
+    main()
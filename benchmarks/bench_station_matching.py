@@ -0,0 +1,286 @@
+#!/usr/bin/env python3
+"""
+관측소 매칭 규모별 벤치마크 (합성 관측소 데이터)
+- 한반도 주변 범위(위도 33.0~38.6, 경도 124.5~131.9)에 무작위 조석/해양관측소 생성
+- 규모: 10², 10³, 10⁴, 10⁵개 (조석관측소 수 = 해양관측소 수)
+- 매칭 방식별 단계 시간 측정: load / index_build / match / serialize
+  - match_stations (match_stations.match_stations, engine=index / engine=matrix)
+  - find_closest_station_and_merge_new (new_find_closest_station.merge_closest_stations, a/b 최근접)
+  match는 각 모듈의 매칭 함수를 그대로 호출한 시간 (색인 생성 + top-k 검색 포함,
+  index_build는 색인을 따로 만드는 region_matching만 기록)
+  - region_matching (match_weather_regions_v2.find_best_match, 지역명 유사도)
+- 결과는 benchmarks/results/station_matching_<시각>.json 에 저장
+
+한 단계 규모의 예상 시간(직전 규모 시간 × 증가 배율)이 --budget 초를 넘거나
+거리 행렬이 너무 큰 경우에는 실행하지 않고 skipped로 기록합니다.
+
+사용법 (프로젝트 루트에서):
+    python3 benchmarks/bench_station_matching.py
+    python3 benchmarks/bench_station_matching.py --sizes 100 1000 --budget 30
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime
+
+import numpy as np
+
+ROOT_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+sys.path.insert(0, ROOT_DIR)
+sys.path.insert(0, os.path.join(ROOT_DIR, 'tide_abs_info'))
+import match_stations
+import match_weather_regions_v2
+import new_find_closest_station
+import region_name_index as region_name_index_module
+
+KOREA_BBOX = (33.0, 38.6, 124.5, 131.9)  # (위도 최소, 위도 최대, 경도 최소, 경도 최대)
+DEFAULT_SIZES = (100, 1000, 10000, 100000)
+MAX_MATRIX_CELLS = 5 * 10 ** 7  # 거리 행렬 최대 원소 수 (약 400MB, float64)
+FORECAST_REGION_FILE = os.path.join(ROOT_DIR, 'backup', '00_etc', 'fct_medm_reg.csv')
+HANGUL_SYLLABLES = '가나다라마바사아자차카타파하거너도로모보소오조초코토포호구누두루무부수우주추'
+
+class StageTimer:
+    """단계별 실행 시간 기록"""
+
+    def __init__(self):
+        self.stages = {}
+
+    def __call__(self, stage):
+        timer = self
+
+        class _Stage:
+            def __enter__(self):
+                self.start = time.perf_counter()
+
+            def __exit__(self, *exc):
+                timer.stages[stage] = timer.stages.get(stage, 0.0) + time.perf_counter() - self.start
+
+        return _Stage()
+
+    def total(self):
+        return sum(self.stages.values())
+
+# ---------------------------------------------------------------------------
+# 합성 입력 파일 생성
+# ---------------------------------------------------------------------------
+
+def synthetic_points(n, rng):
+    lat_min, lat_max, lon_min, lon_max = KOREA_BBOX
+    return rng.uniform(lat_min, lat_max, n), rng.uniform(lon_min, lon_max, n)
+
+def write_tide_xml(path, lats, lons):
+    root = ET.Element('Locations')
+    for i, (lat, lon) in enumerate(zip(lats, lons)):
+        location = ET.SubElement(root, 'Location')
+        for tag, value in (('Code', f'SY_{i:06d}'), ('Name', f'합성{i}'), ('Latitude', f'{lat:.6f}'),
+                           ('Longitude', f'{lon:.6f}'), ('marine_reg_name', '서해중부'),
+                           ('AddressA', ''), ('AddressB', ''), ('AddressC', '')):
+            ET.SubElement(location, tag).text = value
+    ET.ElementTree(root).write(path, encoding='UTF-8', xml_declaration=True)
+
+def write_tide_info_csv(path, lats, lons):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['Code', 'Name', 'Latitude', 'Longitude', 'marine_reg_name', 'AddressA', 'AddressB', 'AddressC'])
+        for i, (lat, lon) in enumerate(zip(lats, lons)):
+            writer.writerow([f'SY_{i:06d}', f'합성{i}', f'{lat:.6f}', f'{lon:.6f}', '서해중부', '', '', ''])
+
+def write_marine_csv(path, prefix, lats, lons, id_offset=0):
+    """match_stations용 a지점/b지점 CSV 형식"""
+    with open(path, 'w', newline='', encoding='utf-8-sig') as f:
+        writer = csv.writer(f, quoting=csv.QUOTE_ALL)
+        writer.writerow([f'{prefix}_지역명(한글)', f'{prefix}_STN ID', f'{prefix}_위도(LAT)', f'{prefix}_경도(LON)'])
+        for i, (lat, lon) in enumerate(zip(lats, lons)):
+            writer.writerow([f'해양{id_offset + i}', str(900000 + id_offset + i), f'{lat:.6f}', f'{lon:.6f}'])
+
+def write_abs_region_csv(path, lats, lons, id_offset=0):
+    """find_closest 스크립트용 abs_region_data_a/b.csv 형식"""
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['지역명(한글)', 'STN ID', '위도(LAT)', '경도(LON)', '관측종류', '제공 정보'])
+        for i, (lat, lon) in enumerate(zip(lats, lons)):
+            writer.writerow([f'해양{id_offset + i}', str(900000 + id_offset + i), f'{lat:.6f}', f'{lon:.6f}', 'B',
+                             'TW(해수면온도), WH(유의파고)'])
+
+def synthetic_names(n, rng, real_names):
+    """합성 지역명 (일부는 실제 중기예보 지역명 + 접미사)"""
+    names = []
+    for i in range(n):
+        if real_names and i % 4 == 0:
+            names.append(real_names[i % len(real_names)] + '항')
+        else:
+            length = rng.integers(2, 5)
+            names.append(''.join(HANGUL_SYLLABLES[j] for j in rng.integers(0, len(HANGUL_SYLLABLES), length)))
+    return names
+
+# ---------------------------------------------------------------------------
+# 매칭 방식별 측정
+# ---------------------------------------------------------------------------
+
+def bench_match_stations(workdir, n, rng, engine):
+    tide_lats, tide_lons = synthetic_points(n, rng)
+    marine_lats, marine_lons = synthetic_points(n, rng)
+    half = n // 2
+    xml_path = os.path.join(workdir, 'tide.xml')
+    a_path = os.path.join(workdir, 'a.csv')
+    b_path = os.path.join(workdir, 'b.csv')
+    write_tide_xml(xml_path, tide_lats, tide_lons)
+    write_marine_csv(a_path, 'a', marine_lats[:half], marine_lons[:half])
+    write_marine_csv(b_path, 'b', marine_lats[half:], marine_lons[half:], id_offset=half)
+
+    timer = StageTimer()
+    with timer('load'):
+        tide_stations = match_stations.load_tide_stations(xml_path)
+        marine_stations = match_stations.load_marine_stations(a_path, b_path)
+
+    # 색인 생성 + top-k 검색 + 결과 항목 생성 (match_stations.match_stations 그대로)
+    with timer('match'):
+        result = match_stations.match_stations(tide_stations, marine_stations, top_n=10, engine=engine)
+
+    with timer('serialize'):
+        json.dumps(result, ensure_ascii=False, indent=2)
+
+    return timer
+
+def bench_find_closest(workdir, n, rng):
+    tide_lats, tide_lons = synthetic_points(n, rng)
+    marine_lats, marine_lons = synthetic_points(n, rng)
+    half = n // 2
+    tide_path = os.path.join(workdir, 'tide_info.csv')
+    a_path = os.path.join(workdir, 'abs_a.csv')
+    b_path = os.path.join(workdir, 'abs_b.csv')
+    write_tide_info_csv(tide_path, tide_lats, tide_lons)
+    write_abs_region_csv(a_path, marine_lats[:half], marine_lons[:half])
+    write_abs_region_csv(b_path, marine_lats[half:], marine_lons[half:], id_offset=half)
+
+    timer = StageTimer()
+    with timer('load'):
+        abs_a = new_find_closest_station.load_abs_stations(a_path)
+        abs_b = new_find_closest_station.load_abs_stations(b_path)
+        with open(tide_path, 'r', encoding='utf-8') as f:
+            tide_rows = list(csv.DictReader(f))
+
+    # a/b 색인 생성 + 최근접 검색 + 행 채우기 (new_find_closest_station.merge_closest_stations 그대로)
+    with timer('match'):
+        results = new_find_closest_station.merge_closest_stations(tide_rows, abs_a, abs_b, source='benchmark')
+
+    with timer('serialize'):
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=new_find_closest_station.merged_fieldnames(list(results[0].keys())),
+                                extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(results)
+
+    return timer
+
+def bench_region_matching(workdir, n, rng):
+    timer = StageTimer()
+    with timer('load'):
+        forecast_regions = match_weather_regions_v2.parse_forecast_regions(FORECAST_REGION_FILE)
+    names = synthetic_names(n, rng, list(forecast_regions.keys()))
+
+    # 색인은 프로세스 동안 캐시되므로 규모마다 비우고 새로 만드는 시간을 잼
+    region_name_index_module._cached_index.cache_clear()
+    with timer('index_build'):
+        region_name_index_module.region_name_index(forecast_regions)  # find_best_match가 이 색인을 재사용
+
+    with timer('match'):
+        matches = [match_weather_regions_v2.find_best_match(name, forecast_regions) for name in names]
+
+    with timer('serialize'):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for name, (region, criteria) in zip(names, matches):
+            writer.writerow([name, region['REG_ID'], region['REG_NAME'], criteria])
+
+    return timer
+
+# 매칭 방식: (측정 함수, 규모 대비 시간 증가 차수 - 건너뛰기 판단용 예상 시간 계산에 사용)
+MATCHERS = {
+    'match_stations[index]': (lambda workdir, n, rng: bench_match_stations(workdir, n, rng, 'index'), 1),
+    'match_stations[matrix]': (lambda workdir, n, rng: bench_match_stations(workdir, n, rng, 'matrix'), 2),
+    'find_closest_station_and_merge_new': (bench_find_closest, 1),
+    'region_matching': (bench_region_matching, 1),  # 중기예보 지역 수는 고정
+}
+
+def git_revision():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT_DIR,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def main():
+    parser = argparse.ArgumentParser(description='관측소 매칭 규모별 벤치마크')
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help='관측소 수 목록')
+    parser.add_argument('--budget', type=float, default=60.0, help='규모별 예상 실행 시간 상한 (초)')
+    parser.add_argument('--matchers', nargs='+', choices=list(MATCHERS), default=list(MATCHERS))
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', help='결과 JSON 경로 (기본값: benchmarks/results/station_matching_<시각>.json)')
+    args = parser.parse_args()
+
+    sizes = sorted(args.sizes)
+    report = {
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'git_revision': git_revision(),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'platform': platform.platform(),
+        'bbox': KOREA_BBOX,
+        'sizes': sizes,
+        'results': {},
+    }
+
+    for matcher in args.matchers:
+        print(f"\n▶ {matcher}")
+        print(f"   {'n':>8} {'load':>9} {'index':>9} {'match':>9} {'serialize':>10} {'total(s)':>9}")
+        bench, growth = MATCHERS[matcher]
+        results = []
+        previous = None
+        for n in sizes:
+            skip_reason = None
+            if matcher.endswith('[matrix]') and n * n > MAX_MATRIX_CELLS:
+                skip_reason = f'거리 행렬 {n}×{n}이 상한({MAX_MATRIX_CELLS})을 넘음'
+            elif previous is not None:
+                estimate = previous['total'] * (n / previous['n']) ** growth
+                if estimate > args.budget:
+                    skip_reason = f'예상 시간 {estimate:.1f}s가 budget({args.budget}s)을 넘음'
+
+            if skip_reason:
+                results.append({'n': n, 'skipped': skip_reason})
+                print(f"   {n:>8} 건너뜀 - {skip_reason}")
+                continue
+
+            rng = np.random.default_rng(args.seed)
+            with tempfile.TemporaryDirectory() as workdir:
+                timer = bench(workdir, n, rng)
+
+            entry = {'n': n, 'stages': {k: round(v, 6) for k, v in timer.stages.items()}, 'total': round(timer.total(), 6)}
+            results.append(entry)
+            previous = entry
+            stages = timer.stages
+            index_build = f"{stages['index_build']:>9.4f}" if 'index_build' in stages else f"{'-':>9}"
+            print(f"   {n:>8} {stages['load']:>9.4f} {index_build} {stages['match']:>9.4f} "
+                  f"{stages['serialize']:>10.4f} {timer.total():>9.4f}")
+
+        report['results'][matcher] = results
+
+    output_path = args.output or os.path.join(
+        ROOT_DIR, 'benchmarks', 'results', f"station_matching_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n💾 결과 저장: {output_path}")
+
+if __name__ == '__main__':
+    main()
@@ -1,61 +1,47 @@
 #!/usr/bin/env python3
 """
 인천(22185) 해양관측소 매칭 디버깅
+match_stations.py가 저장한 역방향 인덱스(station_matching_reverse.json)에서
+거리순 조석관측소 목록과 이 관측소를 후보로 쓰는 조석관측소를 조회
 """
 
-import math
+import sys
 
-def haversine_distance(lat1, lon1, lat2, lon2):
-    """Haversine formula로 두 지점 간 거리 계산 (km)"""
-    R = 6371  # 지구 반지름 (km)
+from match_stations import load_reverse_index, load_tide_stations
 
-    dLat = math.radians(lat2 - lat1)
-    dLon = math.radians(lon2 - lon1)
+REVERSE_PATH = 'tide_abs_info/station_matching_reverse.json'
+XML_PATH = 'tide_abs_info/locations_with_addresses.xml'
+MARINE_ID = '22185'
+TOP_N = 10
 
-    a = (math.sin(dLat/2) * math.sin(dLat/2) +
-         math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) *
-         math.sin(dLon/2) * math.sin(dLon/2))
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
+reverse_index = load_reverse_index(REVERSE_PATH)
+if reverse_index is None:
+    print(f"❌ 역방향 인덱스가 없습니다: {REVERSE_PATH} (먼저 python3 match_stations.py 실행)")
+    sys.exit(1)
+if MARINE_ID not in reverse_index:
+    print(f"❌ 역방향 인덱스에 해양관측소 {MARINE_ID}가 없습니다.")
+    sys.exit(1)
 
-    return R * c
-
-# 인천 22185 해양관측소 (A지점 또는 B지점 확인 필요)
-incheon_marine = {"name": "인천", "id": "22185", "lat": 37.0917, "lon": 125.4289}
-
-# 조석관측소 - 인천 주변
-tide_stations = [
-    {"code": "DT_0064", "name": "교동대교", "lat": 37.789611, "lon": 126.339611},
-    {"code": "DT_0001", "name": "인천", "lat": 37.451944, "lon": 126.592222},
-    {"code": "SO_0563", "name": "울도", "lat": 37.035556, "lon": 125.995},
-    {"code": "DT_0038", "name": "굴업도", "lat": 37.194444, "lon": 125.995},
-    {"code": "DT_0045", "name": "격렬비열도", "lat": 36.624369, "lon": 125.561964},
-    {"code": "DT_0065", "name": "덕적도", "lat": 37.226333, "lon": 126.156556},
-    {"code": "SO_0536", "name": "덕적도", "lat": 37.227778, "lon": 126.157778},
-    {"code": "DT_0052", "name": "인천송도", "lat": 37.3380555555556, "lon": 126.586111111111},
-    {"code": "DT_0008", "name": "안산", "lat": 37.192222, "lon": 126.647222},
-]
+incheon_marine = reverse_index[MARINE_ID]
+tide_stations = {s['code']: s for s in load_tide_stations(XML_PATH)}
 
 print("=" * 100)
-print(f"인천 해양관측소 (22185) - 위도: {incheon_marine['lat']:.4f}, 경도: {incheon_marine['lon']:.4f}")
+print(f"{incheon_marine['name']} 해양관측소 ({MARINE_ID}) - 위도: {incheon_marine['lat']:.4f}, 경도: {incheon_marine['lon']:.4f}")
 print("=" * 100)
 
-# 거리 계산
-distances = []
-for tide in tide_stations:
-    dist = haversine_distance(incheon_marine['lat'], incheon_marine['lon'], tide['lat'], tide['lon'])
-    distances.append({'tide': tide, 'distance': dist})
-
-# 거리순 정렬
-distances.sort(key=lambda x: x['distance'])
-
 print(f"\n{'순위':<5} {'조석관측소':<15} {'코드':<12} {'거리(km)':<12} {'위도':<12} {'경도':<12}")
 print("-" * 100)
 
-for idx, item in enumerate(distances, 1):
-    tide = item['tide']
-    dist = item['distance']
-    print(f"{idx:<5} {tide['name']:<15} {tide['code']:<12} {dist:>8.2f}    {tide['lat']:>10.6f}  {tide['lon']:>10.6f}")
+for idx, (code, dist) in enumerate(incheon_marine['ranked'][:TOP_N], 1):
+    tide = tide_stations.get(code, {'name': '?', 'lat': float('nan'), 'lon': float('nan')})
+    print(f"{idx:<5} {tide['name']:<15} {code:<12} {dist:>8.2f}    {tide['lat']:>10.6f}  {tide['lon']:>10.6f}")
+
+# 정방향 매칭(top10)에서 이 해양관측소를 후보로 갖는 조석관측소
+print(f"\n이 해양관측소를 후보로 쓰는 조석관측소 ({len(incheon_marine['serves'])}개):")
+for code, rank in sorted(incheon_marine['serves'].items(), key=lambda item: item[1]):
+    print(f"   {code:<12} {tide_stations.get(code, {}).get('name', '?'):<15} {rank}순위")
 
+nearest_code, nearest_dist = incheon_marine['ranked'][0]
 print("\n" + "=" * 100)
-print(f"✓ 가장 가까운 조석관측소: {distances[0]['tide']['name']} ({distances[0]['tide']['code']}) - {distances[0]['distance']:.2f} km")
+print(f"✓ 가장 가까운 조석관측소: {tide_stations[nearest_code]['name']} ({nearest_code}) - {nearest_dist:.2f} km")
 print("=" * 100)
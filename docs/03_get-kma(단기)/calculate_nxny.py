@@ -6,22 +6,30 @@ Output: ./tidedata-nxny.csv
 
 각 관측소의 위도(Latitude), 경도(Longitude)를 읽어서
 기상청 단기예보 API에서 사용하는 격자 좌표(nx, ny)로 변환합니다.
+
+투영 상수(sn, sf, ro)는 LambertGridProjection 생성 시 한 번만 계산하며,
+NumPy 배열 단위 정변환(위경도 → nx, ny)과 역변환(nx, ny → 격자 중심 위경도)을 제공합니다.
+
+사용법:
+    python3 calculate_nxny.py            # tidedata-nxny.csv 생성
+    python3 calculate_nxny.py --verify   # 기존 tidedata-nxny.csv / 스칼라 계산 결과와 비교 검증
 """
 
+import argparse
 import math
 import csv
 
-def dfs_xy_conv(lat, lon):
-    """
-    위도, 경도를 기상청 단기예보 격자 좌표(nx, ny)로 변환
+import numpy as np
 
-    Args:
-        lat (float): 위도 (degree)
-        lon (float): 경도 (degree)
+class LambertGridProjection:
+    """
+    기상청 단기예보 격자 (Lambert Conformal Conic 투영)
 
-    Returns:
-        tuple: (nx, ny) 격자 좌표
+    to_grid(lats, lons): 위도/경도 배열 → (nx 배열, ny 배열) 정수 격자 좌표
+    to_latlon(nx, ny): 격자 좌표 배열 → (위도 배열, 경도 배열) 격자 중심 좌표
+    스칼라를 넣으면 0차원 배열이 반환됨
     """
+
     # --- 기상청 투영 설정 상수 (절대 변경 금지) ---
     RE = 6371.00877  # 지구 반경(km)
     GRID = 5.0       # 격자 간격(km)
@@ -33,14 +41,77 @@ def dfs_xy_conv(lat, lon):
     YO = 136         # 기준 점 Y좌표(GRID)
     # -------------------------------------------
 
+    def __init__(self):
+        degrad = math.pi / 180.0
+
+        self.re = self.RE / self.GRID
+        slat1 = self.SLAT1 * degrad
+        slat2 = self.SLAT2 * degrad
+        self.olon = self.OLON * degrad
+        olat = self.OLAT * degrad
+
+        sn = math.tan(math.pi * 0.25 + slat2 * 0.5) / math.tan(math.pi * 0.25 + slat1 * 0.5)
+        self.sn = math.log(math.cos(slat1) / math.cos(slat2)) / math.log(sn)
+        sf = math.tan(math.pi * 0.25 + slat1 * 0.5)
+        self.sf = math.pow(sf, self.sn) * math.cos(slat1) / self.sn
+        ro = math.tan(math.pi * 0.25 + olat * 0.5)
+        self.ro = self.re * self.sf / math.pow(ro, self.sn)
+
+    def to_grid(self, lats, lons):
+        """위도, 경도(degree) → 격자 좌표 (nx, ny)"""
+        lat = np.radians(np.asarray(lats, dtype=np.float64))
+        lon = np.radians(np.asarray(lons, dtype=np.float64))
+
+        ra = self.re * self.sf / np.power(np.tan(np.pi * 0.25 + lat * 0.5), self.sn)
+        theta = lon - self.olon
+        theta = np.where(theta > np.pi, theta - 2.0 * np.pi, theta)
+        theta = np.where(theta < -np.pi, theta + 2.0 * np.pi, theta)
+        theta = theta * self.sn
+
+        # 격자 좌표 계산 (정수로 반올림)
+        nx = np.floor(ra * np.sin(theta) + self.XO + 0.5).astype(np.int64)
+        ny = np.floor(self.ro - ra * np.cos(theta) + self.YO + 0.5).astype(np.int64)
+        return nx, ny
+
+    def to_latlon(self, nx, ny):
+        """격자 좌표 (nx, ny) → 격자 중심 위도, 경도(degree)"""
+        xn = np.asarray(nx, dtype=np.float64) - self.XO
+        yn = self.ro - np.asarray(ny, dtype=np.float64) + self.YO
+
+        ra = np.hypot(xn, yn)
+        if self.sn < 0.0:
+            ra = -ra
+        lat = 2.0 * np.arctan(np.power(self.re * self.sf / ra, 1.0 / self.sn)) - np.pi * 0.5
+        theta = np.arctan2(xn, yn)
+        lon = theta / self.sn + self.olon
+        return np.degrees(lat), np.degrees(lon)
+
+KMA_GRID = LambertGridProjection()
+
+def dfs_xy_conv(lat, lon):
+    """
+    위도, 경도를 기상청 단기예보 격자 좌표(nx, ny)로 변환
+
+    Args:
+        lat (float): 위도 (degree)
+        lon (float): 경도 (degree)
+
+    Returns:
+        tuple: (nx, ny) 격자 좌표
+    """
+    nx, ny = KMA_GRID.to_grid(lat, lon)
+    return int(nx), int(ny)
+
+def _dfs_xy_conv_reference(lat, lon):
+    """기존 스칼라 구현 (--verify 비교용, 호출마다 투영 상수 계산)"""
     DEGRAD = math.pi / 180.0
-    RADDEG = 180.0 / math.pi
+    g = LambertGridProjection
 
-    re = RE / GRID
-    slat1 = SLAT1 * DEGRAD
-    slat2 = SLAT2 * DEGRAD
-    olon = OLON * DEGRAD
-    olat = OLAT * DEGRAD
+    re = g.RE / g.GRID
+    slat1 = g.SLAT1 * DEGRAD
+    slat2 = g.SLAT2 * DEGRAD
+    olon = g.OLON * DEGRAD
+    olat = g.OLAT * DEGRAD
 
     sn = math.tan(math.pi * 0.25 + slat2 * 0.5) / math.tan(math.pi * 0.25 + slat1 * 0.5)
     sn = math.log(math.cos(slat1) / math.cos(slat2)) / math.log(sn)
@@ -49,7 +120,6 @@ def dfs_xy_conv(lat, lon):
     ro = math.tan(math.pi * 0.25 + olat * 0.5)
     ro = re * sf / math.pow(ro, sn)
 
-    # 위도, 경도를 라디안으로 변환
     ra = math.tan(math.pi * 0.25 + lat * DEGRAD * 0.5)
     ra = re * sf / math.pow(ra, sn)
     theta = lon * DEGRAD - olon
@@ -61,60 +131,103 @@ def dfs_xy_conv(lat, lon):
 
     theta *= sn
 
-    # 격자 좌표 계산 (정수로 반올림)
-    x = math.floor(ra * math.sin(theta) + XO + 0.5)
-    y = math.floor(ro - ra * math.cos(theta) + YO + 0.5)
+    x = math.floor(ra * math.sin(theta) + g.XO + 0.5)
+    y = math.floor(ro - ra * math.cos(theta) + g.YO + 0.5)
 
     return int(x), int(y)
 
+def verify(csv_file, samples=200000, seed=0):
+    """
+    정변환/역변환 검증
+    1. csv_file(기존 스칼라 계산 결과)의 nx, ny와 배열 계산 결과 비교
+    2. 한반도 주변 무작위 좌표에서 기존 스칼라 구현과 배열 계산 결과 비교
+    3. 단기예보 격자 전체(1~149 × 1~253)에서 역변환한 격자 중심이 같은 격자로 돌아오는지 확인
+    """
+    ok = True
+
+    with open(csv_file, 'r', encoding='utf-8-sig') as f:
+        rows = list(csv.DictReader(f))
+    nx, ny = KMA_GRID.to_grid([float(r['Latitude']) for r in rows], [float(r['Longitude']) for r in rows])
+    mismatched = [r['Code'] for r, x, y in zip(rows, nx, ny) if (int(r['nx']), int(r['ny'])) != (x, y)]
+    print(f"1. {csv_file} 대비: {len(rows) - len(mismatched)}/{len(rows)} 일치")
+    if mismatched:
+        ok = False
+        print(f"   불일치: {', '.join(mismatched)}")
+
+    rng = np.random.default_rng(seed)
+    lats = rng.uniform(32.0, 39.5, samples)
+    lons = rng.uniform(123.0, 132.5, samples)
+    nx, ny = KMA_GRID.to_grid(lats, lons)
+    diff = sum((int(x), int(y)) != _dfs_xy_conv_reference(lat, lon)
+               for lat, lon, x, y in zip(lats, lons, nx, ny))
+    print(f"2. 무작위 {samples}개 지점 스칼라 구현 대비: 불일치 {diff}개")
+    ok = ok and diff == 0
+
+    grid_x, grid_y = np.meshgrid(np.arange(1, 150), np.arange(1, 254))
+    back_x, back_y = KMA_GRID.to_grid(*KMA_GRID.to_latlon(grid_x, grid_y))
+    diff = int(np.count_nonzero((back_x != grid_x) | (back_y != grid_y)))
+    print(f"3. 격자 {grid_x.size}개 역변환 → 정변환 왕복: 불일치 {diff}개")
+    ok = ok and diff == 0
+
+    seoul = dfs_xy_conv(37.5665, 126.9780)
+    print(f"4. 서울시청 (37.5665, 126.9780) -> nx: {seoul[0]}, ny: {seoul[1]} (기대값 60, 127)")
+    ok = ok and seoul == (60, 127)
+
+    print("\n✅ 검증 통과" if ok else "\n❌ 검증 실패")
+    return ok
+
+NXNY_FIELDNAMES = ['Code', 'Name', 'Latitude', 'Longitude', 'nx', 'ny',
+                   'marine_reg_name', 'AddressA', 'AddressB', 'AddressC']
+
+def compute_nxny_rows(rows):
+    """관측소 CSV 행들의 nx, ny 계산 (전체 관측소 한 번에) → tidedata-nxny.csv 행 목록"""
+    lats = [float(row['Latitude']) for row in rows]
+    lons = [float(row['Longitude']) for row in rows]
+    nx_list, ny_list = KMA_GRID.to_grid(lats, lons)
+
+    results = []
+    for row, lat, lon, nx, ny in zip(rows, lats, lons, nx_list.tolist(), ny_list.tolist()):
+        results.append({
+            'Code': row['Code'],
+            'Name': row['Name'],
+            'Latitude': lat,
+            'Longitude': lon,
+            'nx': nx,
+            'ny': ny,
+            'marine_reg_name': row['marine_reg_name'],
+            'AddressA': row['AddressA'],
+            'AddressB': row['AddressB'],
+            'AddressC': row['AddressC']
+        })
+    return results
+
 def main():
+    parser = argparse.ArgumentParser(description='관측소 위경도 → 기상청 단기예보 격자 좌표(nx, ny)')
+    parser.add_argument('--verify', action='store_true',
+                        help='tidedata-nxny.csv(기존 결과) 및 기존 스칼라 계산과 비교 검증만 수행')
+    args = parser.parse_args()
+
     # 입력/출력 파일 경로
     input_file = '../../02_kma(med) 중기 예보/tidedata-station_info_rows.csv'
     output_file = './tidedata-nxny.csv'
 
-    # 결과를 저장할 리스트
-    results = []
+    if args.verify:
+        raise SystemExit(0 if verify(output_file) else 1)
 
     # CSV 파일 읽기
     print(f"입력 파일 읽는 중: {input_file}")
     with open(input_file, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-
-        for row in reader:
-            code = row['Code']
-            name = row['Name']
-            lat = float(row['Latitude'])
-            lon = float(row['Longitude'])
-            marine_reg_name = row['marine_reg_name']
-            address_a = row['AddressA']
-            address_b = row['AddressB']
-            address_c = row['AddressC']
-
-            # nx, ny 계산
-            nx, ny = dfs_xy_conv(lat, lon)
-
-            # 결과 저장
-            results.append({
-                'Code': code,
-                'Name': name,
-                'Latitude': lat,
-                'Longitude': lon,
-                'nx': nx,
-                'ny': ny,
-                'marine_reg_name': marine_reg_name,
-                'AddressA': address_a,
-                'AddressB': address_b,
-                'AddressC': address_c
-            })
-
-            print(f"처리: {code} {name} (위도: {lat}, 경도: {lon}) -> nx: {nx}, ny: {ny}")
+        rows = list(csv.DictReader(f))
+
+    results = compute_nxny_rows(rows)
+    for result in results:
+        print(f"처리: {result['Code']} {result['Name']} (위도: {result['Latitude']}, 경도: {result['Longitude']}) "
+              f"-> nx: {result['nx']}, ny: {result['ny']}")
 
     # 결과를 CSV 파일로 저장
     print(f"\n결과 파일 저장 중: {output_file}")
     with open(output_file, 'w', encoding='utf-8-sig', newline='') as f:
-        fieldnames = ['Code', 'Name', 'Latitude', 'Longitude', 'nx', 'ny',
-                      'marine_reg_name', 'AddressA', 'AddressB', 'AddressC']
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer = csv.DictWriter(f, fieldnames=NXNY_FIELDNAMES)
 
         writer.writeheader()
         writer.writerows(results)
@@ -0,0 +1,135 @@
+"""
+기상청 단기예보 격자(nx, ny) 관측소 분포 지도 생성 스크립트
+
+Input: ./tidedata-nxny.csv (calculate_nxny.py 결과)
+Output: ./grid_coverage.npz     - 격자 전체 래스터 (uint8, shape (NY, NX), [ny-1, nx-1])
+                                   0: 빈 격자, 1: 관측소 격자에 인접, 2 이상: 관측소 수 + 1
+        ./grid_coverage.geojson - 관측소가 있는 격자 / 인접 격자의 경계 폴리곤
+
+격자 경계는 격자 중심(nx, ny)에서 ±0.5 격자 떨어진 네 꼭짓점을
+LambertGridProjection.to_latlon으로 역변환해 구합니다.
+- occupied 격자: 여기에 관측소를 추가하면 API 호출이 늘지 않음
+- adjacent 격자: 관측소 격자와 맞닿은 빈 격자 (여기에 추가하면 격자 1개 = 호출 1회 증가)
+
+사용법:
+    python3 grid_coverage.py
+    python3 grid_coverage.py --check 37.45 126.59   # 해당 위치에 관측소를 추가하면 새 격자인지 확인
+"""
+
+import argparse
+import csv
+import json
+
+import numpy as np
+
+from calculate_nxny import KMA_GRID
+
+# 단기예보 격자 범위 (nx 1~149, ny 1~253)
+NX = 149
+NY = 253
+
+EMPTY = 0
+ADJACENT = 1
+
+def load_station_cells(input_file):
+    """tidedata-nxny.csv → {(nx, ny): [관측소 코드, ...]}"""
+    cells = {}
+    with open(input_file, 'r', encoding='utf-8-sig') as f:
+        for row in csv.DictReader(f):
+            cells.setdefault((int(row['nx']), int(row['ny'])), []).append(row['Code'])
+    return cells
+
+def build_raster(cells):
+    """격자 전체 래스터 (0: 빈 격자, 1: 인접, 2 이상: 관측소 수 + 1)"""
+    occupied = np.zeros((NY, NX), dtype=bool)
+    counts = np.zeros((NY, NX), dtype=np.uint8)
+    for (nx, ny), codes in cells.items():
+        if 1 <= nx <= NX and 1 <= ny <= NY:
+            occupied[ny - 1, nx - 1] = True
+            counts[ny - 1, nx - 1] = min(len(codes) + 1, 255)
+
+    # 8방향 인접 격자 (패딩 후 이동 합성)
+    padded = np.pad(occupied, 1)
+    neighbour = np.zeros_like(occupied)
+    for d_y in (-1, 0, 1):
+        for d_x in (-1, 0, 1):
+            if d_y or d_x:
+                neighbour |= padded[1 + d_y:1 + d_y + NY, 1 + d_x:1 + d_x + NX]
+
+    raster = np.where(neighbour & ~occupied, ADJACENT, EMPTY).astype(np.uint8)
+    raster[occupied] = counts[occupied]
+    return raster
+
+def cell_polygons(nx, ny):
+    """격자 (nx, ny) 배열 → 경계 폴리곤 꼭짓점 위경도. shape (격자 수, 5, 2) [lon, lat], 닫힌 고리"""
+    nx = np.asarray(nx, dtype=np.float64)[:, None]
+    ny = np.asarray(ny, dtype=np.float64)[:, None]
+    corner_x = np.array([-0.5, 0.5, 0.5, -0.5, -0.5])
+    corner_y = np.array([-0.5, -0.5, 0.5, 0.5, -0.5])
+    lats, lons = KMA_GRID.to_latlon(nx + corner_x, ny + corner_y)
+    return np.stack([lons, lats], axis=-1)
+
+def coverage_geojson(raster, cells):
+    """관측소 격자(occupied)와 인접 격자(adjacent) GeoJSON FeatureCollection"""
+    ys, xs = np.nonzero(raster)
+    nx_list, ny_list = xs + 1, ys + 1
+    polygons = cell_polygons(nx_list, ny_list)
+    center_lats, center_lons = KMA_GRID.to_latlon(nx_list, ny_list)
+
+    features = []
+    for i, (nx, ny) in enumerate(zip(nx_list.tolist(), ny_list.tolist())):
+        codes = cells.get((nx, ny), [])
+        features.append({
+            'type': 'Feature',
+            'geometry': {
+                'type': 'Polygon',
+                'coordinates': [np.round(polygons[i], 6).tolist()],
+            },
+            'properties': {
+                'nx': nx,
+                'ny': ny,
+                'status': 'occupied' if codes else 'adjacent',
+                'codes': codes,
+                'center_lat': round(float(center_lats[i]), 6),
+                'center_lon': round(float(center_lons[i]), 6),
+            },
+        })
+    return {'type': 'FeatureCollection', 'features': features}
+
+def main():
+    parser = argparse.ArgumentParser(description='단기예보 격자별 관측소 분포 지도')
+    parser.add_argument('--check', nargs=2, type=float, metavar=('LAT', 'LON'),
+                        help='이 위치에 관측소를 추가할 때 기존 격자를 공유하는지 확인')
+    args = parser.parse_args()
+
+    input_file = './tidedata-nxny.csv'
+    raster_file = './grid_coverage.npz'
+    geojson_file = './grid_coverage.geojson'
+
+    print(f"입력 파일 읽는 중: {input_file}")
+    cells = load_station_cells(input_file)
+
+    if args.check:
+        lat, lon = args.check
+        nx, ny = (int(v) for v in KMA_GRID.to_grid(lat, lon))
+        if (nx, ny) in cells:
+            print(f"({lat}, {lon}) -> nx: {nx}, ny: {ny} - 기존 격자 (공유: {', '.join(cells[(nx, ny)])}), API 호출 증가 없음")
+        else:
+            print(f"({lat}, {lon}) -> nx: {nx}, ny: {ny} - 새 격자, API 호출 1회 증가")
+        return
+
+    raster = build_raster(cells)
+    np.savez_compressed(raster_file, coverage=raster)
+
+    with open(geojson_file, 'w', encoding='utf-8') as f:
+        json.dump(coverage_geojson(raster, cells), f, ensure_ascii=False, separators=(',', ':'))
+
+    n_occupied = int(np.count_nonzero(raster > ADJACENT))
+    n_adjacent = int(np.count_nonzero(raster == ADJACENT))
+    n_stations = sum(len(codes) for codes in cells.values())
+    print(f"\n관측소 {n_stations}개 → 격자 {n_occupied}개 (격자 전체 {NX}×{NY} = {NX * NY}개)")
+    print(f"관측소 격자와 맞닿은 빈 격자: {n_adjacent}개")
+    print(f"\n결과 파일: {raster_file}, {geojson_file}")
+
+if __name__ == "__main__":
+    main()
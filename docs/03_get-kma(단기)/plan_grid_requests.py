@@ -0,0 +1,98 @@
+"""
+기상청 단기예보 격자(nx, ny) 단위 요청 계획 생성 스크립트
+
+Input: ./tidedata-nxny.csv (tide_weather_region 업로드용 code, nx, ny 테이블)
+Output: ./grid_request_plan.json
+
+여러 관측소가 같은 격자를 공유하므로 API 호출과 weather_forecasts 저장을
+격자 단위로 한 번씩만 하고, 관측소별 예보는 격자 → 관측소 매핑으로 조인해 얻습니다.
+- cells: 중복 제거한 격자 목록 (nx, ny 순) 과 격자별 관측소 코드 목록(fan-out)
+- location_cell: 관측소 코드 → "nx,ny"
+- summary: 관측소 단위 대비 절감되는 API 호출 수 / 발표 1회당 저장 행 수
+
+격자 단위 저장 테이블(weather_forecasts_grid)과 관측소별 조회 뷰(weather_forecasts_by_location)는
+supabase/migrations/20260128000000_create_weather_forecasts_grid.sql 참고
+
+사용법:
+    python3 plan_grid_requests.py
+    python3 plan_grid_requests.py --hours 72
+"""
+
+import argparse
+import csv
+import json
+
+# 단기예보 1회 발표분의 예보 시각 수 (발표 시각부터 약 3일, 1시간 간격)
+DEFAULT_FORECAST_HOURS = 72
+
+def load_grid_table(input_file):
+    """tidedata-nxny.csv → [{'code', 'name', 'nx', 'ny'}, ...]"""
+    with open(input_file, 'r', encoding='utf-8-sig') as f:
+        return [
+            {'code': row['Code'], 'name': row['Name'], 'nx': int(row['nx']), 'ny': int(row['ny'])}
+            for row in csv.DictReader(f)
+        ]
+
+def plan_grid_requests(locations, forecast_hours=DEFAULT_FORECAST_HOURS):
+    """격자 단위 요청 계획 (cells, location_cell, summary)"""
+    fan_out = {}
+    for location in locations:
+        fan_out.setdefault((location['nx'], location['ny']), []).append(location['code'])
+
+    cells = [
+        {'nx': nx, 'ny': ny, 'codes': codes}
+        for (nx, ny), codes in sorted(fan_out.items())
+    ]
+    location_cell = {location['code']: f"{location['nx']},{location['ny']}" for location in locations}
+
+    n_locations = len(locations)
+    n_cells = len(cells)
+    summary = {
+        'locations': n_locations,
+        'cells': n_cells,
+        'shared_cells': sum(1 for cell in cells if len(cell['codes']) > 1),
+        'max_fan_out': max((len(cell['codes']) for cell in cells), default=0),
+        'api_calls_per_location': n_locations,
+        'api_calls_per_cell': n_cells,
+        'api_calls_saved': n_locations - n_cells,
+        'forecast_hours': forecast_hours,
+        'rows_per_location': n_locations * forecast_hours,
+        'rows_per_cell': n_cells * forecast_hours,
+        'rows_saved': (n_locations - n_cells) * forecast_hours,
+    }
+    return {'cells': cells, 'location_cell': location_cell, 'summary': summary}
+
+def main():
+    parser = argparse.ArgumentParser(description='단기예보 격자 단위 요청 계획 생성')
+    parser.add_argument('--hours', type=int, default=DEFAULT_FORECAST_HOURS,
+                        help=f'발표 1회당 예보 시각 수 (저장 행 수 계산용, 기본 {DEFAULT_FORECAST_HOURS})')
+    args = parser.parse_args()
+
+    input_file = './tidedata-nxny.csv'
+    output_file = './grid_request_plan.json'
+
+    print(f"입력 파일 읽는 중: {input_file}")
+    locations = load_grid_table(input_file)
+    plan = plan_grid_requests(locations, args.hours)
+    summary = plan['summary']
+
+    with open(output_file, 'w', encoding='utf-8') as f:
+        json.dump(plan, f, ensure_ascii=False, indent=2)
+
+    ratio = summary['api_calls_saved'] / summary['locations'] * 100 if summary['locations'] else 0.0
+    print(f"\n관측소 {summary['locations']}개 → 격자 {summary['cells']}개 "
+          f"(2개 이상 공유 격자 {summary['shared_cells']}개, 최대 {summary['max_fan_out']}개 관측소)")
+    print(f"API 호출: {summary['api_calls_per_location']}회 → {summary['api_calls_per_cell']}회 "
+          f"({summary['api_calls_saved']}회 절감, {ratio:.1f}%)")
+    print(f"발표 1회당 저장 행 ({summary['forecast_hours']}개 예보 시각): "
+          f"{summary['rows_per_location']}행 → {summary['rows_per_cell']}행 ({summary['rows_saved']}행 절감)")
+
+    print("\n여러 관측소가 공유하는 격자:")
+    for cell in plan['cells']:
+        if len(cell['codes']) > 1:
+            print(f"  ({cell['nx']}, {cell['ny']}): {', '.join(cell['codes'])}")
+
+    print(f"\n결과 파일: {output_file}")
+
+if __name__ == "__main__":
+    main()
@@ -6,37 +6,25 @@
 import csv
 import re
 from difflib import SequenceMatcher
+from kma_typ01 import iter_typ01
 
 def parse_forecast_regions(file_path):
     """중기예보 지역 파일을 파싱하여 딕셔너리로 반환"""
     regions = {}
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # #START7777과 #7777END 사이의 데이터 추출
-    start_idx = content.find('#START7777')
-    end_idx = content.find('#7777END')
-    
-    if start_idx != -1 and end_idx != -1:
-        data_section = content[start_idx:end_idx]
-        
-        # REG_ID 패턴으로 시작하는 라인들 찾기 (11로 시작하는 코드들)
-        pattern = r'(11[A-Z0-9]+)\s+(\d{12})\s+(\d{12})\s+([ACI])\s+([\w\s\(\)\.]+?)(?=\s+11[A-Z0-9]+|\s*$|#7777END)'
+    # #START7777 ~ #7777END 구간을 한 행씩 읽음 (줄바꿈이 사라진 파일도 행 단위로 분리됨)
+    for row in iter_typ01(file_path):
+        reg_id = row['REG_ID']
+        reg_sp = row['REG_SP']
+        reg_name = row['REG_NAME']
         
-        matches = re.findall(pattern, data_section, re.MULTILINE)
-        
-        for match in matches:
-            reg_id, tm_st, tm_ed, reg_sp, reg_name = match
-            reg_name = reg_name.strip()
-            
-            # 육상(A)과 도시(C) 지역만 사용
-            if reg_sp in ['A', 'C'] and reg_name:
-                regions[reg_name] = {
-                    'REG_ID': reg_id,
-                    'REG_SP': reg_sp,
-                    'REG_NAME': reg_name
-                }
+        # 11로 시작하는 코드 중 육상(A)과 도시(C) 지역만 사용
+        if reg_id.startswith('11') and reg_sp in ['A', 'C'] and reg_name:
+            regions[reg_name] = {
+                'REG_ID': reg_id,
+                'REG_SP': reg_sp,
+                'REG_NAME': reg_name
+            }
     
     return regions
 
@@ -211,8 +199,8 @@ def main():
             location_name = row['Name']
             current_criteria = row.get('MATCH_CRITERIA', '')
             
-            # 유사도 기반 매칭인 경우만 재매칭 시도
-            if current_criteria.startswith('유사도('):
+            # 유사도 기반 매칭이거나 미매칭인 경우만 재매칭 시도
+            if current_criteria.startswith('유사도(') or current_criteria == '미매칭':
                 print(f"\n재매칭 시도: {location_name} (현재: {row['REG_NAME']})")
                 
                 # 행정구역 기반 매칭 시도
@@ -0,0 +1,104 @@
+"""
+거리 계산 공용 모듈 (단위: km, 구면 지구 R = 6371 km)
+
+세 가지 방식을 제공합니다.
+- haversine_distance: 정확한 대원 거리, 두 지점 스칼라 계산
+- haversine_np / haversine_matrix: 정확한 대원 거리, NumPy 일괄 계산
+  (haversine_np는 원소별 + 브로드캐스트, haversine_matrix는 두 집합의 전체 거리 행렬)
+- equirectangular_np / equirectangular_matrix: 등장방형(equirectangular) 근사, 가장 빠름
+  두 지점 평균 위도의 cos으로 경도 차를 보정한 평면 거리
+  오차: 위도 32~39°(국내 해역)에서 100 km 이하 거리는 haversine 대비 1 m 미만
+  (상대 오차 0.001% 미만, 실측은 benchmarks/bench_geodesy.py 참고).
+  거리가 멀수록 오차가 거리 제곱에 비례해 커지므로 100 km 이상 구간이나
+  정확한 거리 값이 저장되는 결과물에는 haversine을 사용
+
+그 외 KD-tree 검색용 단위 구면 좌표 변환(to_unit_vectors, chord_to_km, km_to_chord)
+"""
+
+import math
+from typing import Sequence
+
+import numpy as np
+
+EARTH_RADIUS_KM = 6371  # 지구 반지름 (km)
+
+def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    두 지점 간의 거리를 계산 (단위: km)
+    Haversine formula 사용
+    """
+    # 라디안으로 변환
+    lat1_rad = math.radians(lat1)
+    lat2_rad = math.radians(lat2)
+    delta_lat = math.radians(lat2 - lat1)
+    delta_lon = math.radians(lon2 - lon1)
+
+    # Haversine formula
+    a = math.sin(delta_lat/2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon/2)**2
+    c = 2 * math.asin(math.sqrt(min(a, 1.0)))
+
+    return EARTH_RADIUS_KM * c
+
+def haversine_np(lats1, lons1, lats2, lons2) -> np.ndarray:
+    """Haversine 거리 일괄 계산 (입력 배열은 NumPy 브로드캐스트 규칙을 따름)"""
+    lat1 = np.radians(np.asarray(lats1, dtype=np.float64))
+    lon1 = np.radians(np.asarray(lons1, dtype=np.float64))
+    lat2 = np.radians(np.asarray(lats2, dtype=np.float64))
+    lon2 = np.radians(np.asarray(lons2, dtype=np.float64))
+
+    a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+def haversine_matrix(lats1: Sequence[float], lons1: Sequence[float],
+                     lats2: Sequence[float], lons2: Sequence[float]) -> np.ndarray:
+    """
+    두 지점 집합 간의 전체 거리 행렬 계산 (단위: km)
+    반환값 shape: (len(lats1), len(lats2))
+    """
+    return haversine_np(
+        np.asarray(lats1, dtype=np.float64)[:, None], np.asarray(lons1, dtype=np.float64)[:, None],
+        np.asarray(lats2, dtype=np.float64)[None, :], np.asarray(lons2, dtype=np.float64)[None, :]
+    )
+
+def equirectangular_np(lats1, lons1, lats2, lons2) -> np.ndarray:
+    """등장방형 근사 거리 일괄 계산 (100 km 이하에서 사용, 오차는 모듈 설명 참고)"""
+    lat1 = np.radians(np.asarray(lats1, dtype=np.float64))
+    lon1 = np.radians(np.asarray(lons1, dtype=np.float64))
+    lat2 = np.radians(np.asarray(lats2, dtype=np.float64))
+    lon2 = np.radians(np.asarray(lons2, dtype=np.float64))
+
+    x = (lon2 - lon1) * np.cos((lat1 + lat2) / 2)
+    y = lat2 - lat1
+    return EARTH_RADIUS_KM * np.hypot(x, y)
+
+def equirectangular_matrix(lats1: Sequence[float], lons1: Sequence[float],
+                           lats2: Sequence[float], lons2: Sequence[float]) -> np.ndarray:
+    """
+    등장방형 근사 거리 행렬. 반환값 shape: (len(lats1), len(lats2))
+    평균 위도의 cos을 cos(a/2)cos(b/2) - sin(a/2)sin(b/2)로 전개해
+    삼각함수는 각 지점 배열에서만 계산 (행렬 원소마다 cos을 계산하지 않음)
+    """
+    half_lat1 = np.radians(np.asarray(lats1, dtype=np.float64))[:, None] / 2
+    half_lat2 = np.radians(np.asarray(lats2, dtype=np.float64))[None, :] / 2
+    lon1 = np.radians(np.asarray(lons1, dtype=np.float64))[:, None]
+    lon2 = np.radians(np.asarray(lons2, dtype=np.float64))[None, :]
+
+    cos_mean_lat = np.cos(half_lat1) * np.cos(half_lat2) - np.sin(half_lat1) * np.sin(half_lat2)
+    x = (lon2 - lon1) * cos_mean_lat
+    y = 2 * (half_lat2 - half_lat1)
+    return EARTH_RADIUS_KM * np.sqrt(x * x + y * y)
+
+def to_unit_vectors(lats: Sequence[float], lons: Sequence[float]) -> np.ndarray:
+    """위도/경도(degree)를 단위 구면 위의 3차원 좌표로 변환. shape: (n, 3)"""
+    lat = np.radians(np.asarray(lats, dtype=np.float64))
+    lon = np.radians(np.asarray(lons, dtype=np.float64))
+    cos_lat = np.cos(lat)
+    return np.column_stack((cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)))
+
+def chord_to_km(chord) -> np.ndarray:
+    """단위 구면 현 거리를 대원 거리(km)로 변환"""
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.minimum(np.asarray(chord) / 2, 1.0))
+
+def km_to_chord(km: float) -> float:
+    """대원 거리(km)를 단위 구면 현 거리로 변환"""
+    return 2 * math.sin(min(km / EARTH_RADIUS_KM, math.pi) / 2)
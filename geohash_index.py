@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+GPS 좌표 → 가장 가까운 관측소(location code) 조회용 geohash 버킷 인덱스
+
+- 관측소 좌표(관측소 XML + tide_weather_region 격자 좌표 CSV)를 geohash 셀로 묶고,
+  셀마다 자기 셀 + 주변 8개 셀의 관측소 목록(block)을 미리 만들어 둠
+  → 조회는 geohash 계산 후 dict 1회 조회 + 후보 몇 개와의 거리 계산
+- 정밀도(precision)는 coverage_km 이내에 관측소가 있는 지점이면
+  자기 셀 + 주변 8개 셀 안에 실제 최근접 관측소가 반드시 들어오도록 선택
+  (셀 한 칸의 최소 폭(km)이 coverage_km 이상인 가장 작은 셀)
+- coverage_km 기본값은 관측소 배치에서 계산: 관측소별 최근접 관측소 거리의 95백분위수의 절반
+  (관측소 i가 최근접인 지점은 대부분 i에서 최근접 관측소 거리/2 이내,
+   이어도/독도처럼 멀리 떨어진 소수 관측소가 셀 크기를 정하지 않도록 백분위수 사용)
+- 조회 시 후보 중 최근접 거리가 질의 지점에서 block 경계까지의 거리 이하이면 정확한 결과이고,
+  그렇지 않으면(coverage_km 밖의 먼 지점 등) 전체 관측소를 다시 계산
+- 인덱스는 JSON(netlify/shared/locations_geohash.json)으로 저장하고
+  netlify/shared/locations.js에 locationGeohashIndex로 포함 (add_location/convert_to_js.py 재실행,
+  조회 함수는 netlify/shared/nearest_location.js)
+
+사용법 (프로젝트 루트에서):
+    python3 geohash_index.py                       # 인덱스 생성
+    python3 geohash_index.py --lookup 37.45 126.59  # 저장된 인덱스로 조회
+"""
+
+import argparse
+import csv
+import glob
+import json
+import math
+import os
+import subprocess
+import sys
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from geodesy import EARTH_RADIUS_KM, haversine_matrix, haversine_np
+from location_loader import load_locations
+
+BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+BASE32_INDEX = {ch: i for i, ch in enumerate(BASE32)}
+INDEX_VERSION = 1
+SPACING_PERCENTILE = 95
+MAX_PRECISION = 9
+
+XML_PATH = 'add_location/total_locations.xml'
+NXNY_GLOB = 'docs/03_get-kma*/tidedata-nxny.csv'
+JSON_PATH = 'netlify/shared/locations_geohash.json'
+LOCATIONS_JS_SCRIPT = 'add_location/convert_to_js.py'
+
+# ---------------------------------------------------------------------------
+# geohash 기본 연산
+# ---------------------------------------------------------------------------
+
+def encode(lat: float, lon: float, precision: int) -> str:
+    """위도/경도 → geohash 문자열"""
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    value = 0
+    even = True  # 짝수 번째 비트는 경도
+    while len(chars) < precision:
+        target, rng = (lon, lon_range) if even else (lat, lat_range)
+        mid = (rng[0] + rng[1]) / 2
+        if target >= mid:
+            value = (value << 1) | 1
+            rng[0] = mid
+        else:
+            value <<= 1
+            rng[1] = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            chars.append(BASE32[value])
+            bits = 0
+            value = 0
+    return ''.join(chars)
+
+def decode_bbox(geohash: str) -> Tuple[float, float, float, float]:
+    """geohash → 셀 범위 (위도 최소, 위도 최대, 경도 최소, 경도 최대)"""
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    even = True
+    for ch in geohash:
+        value = BASE32_INDEX[ch]
+        for shift in range(4, -1, -1):
+            rng = lon_range if even else lat_range
+            mid = (rng[0] + rng[1]) / 2
+            if (value >> shift) & 1:
+                rng[0] = mid
+            else:
+                rng[1] = mid
+            even = not even
+    return lat_range[0], lat_range[1], lon_range[0], lon_range[1]
+
+def cell_size_deg(precision: int) -> Tuple[float, float]:
+    """정밀도별 셀 크기 (위도 폭, 경도 폭) degree"""
+    total_bits = 5 * precision
+    lon_bits = (total_bits + 1) // 2
+    lat_bits = total_bits // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lon_bits)
+
+def neighbours(geohash: str) -> List[str]:
+    """주변 8개 셀 (극지방 바깥은 제외, 경도는 ±180°에서 순환)"""
+    lat_min, lat_max, lon_min, lon_max = decode_bbox(geohash)
+    lat_step, lon_step = lat_max - lat_min, lon_max - lon_min
+    center_lat, center_lon = (lat_min + lat_max) / 2, (lon_min + lon_max) / 2
+    result = []
+    for d_lat in (-1, 0, 1):
+        for d_lon in (-1, 0, 1):
+            if d_lat == 0 and d_lon == 0:
+                continue
+            lat = center_lat + d_lat * lat_step
+            if not -90 < lat < 90:
+                continue
+            lon = (center_lon + d_lon * lon_step + 180) % 360 - 180
+            result.append(encode(lat, lon, len(geohash)))
+    return result
+
+# ---------------------------------------------------------------------------
+# 정밀도 선택 / 정확성 판정
+# ---------------------------------------------------------------------------
+
+def _meridian_distance_km(lat: float, d_lon_deg: float) -> float:
+    """위도 lat 지점에서 경도 차 d_lon_deg인 자오선(대원)까지의 최단 거리"""
+    if d_lon_deg >= 90:
+        return math.inf
+    return EARTH_RADIUS_KM * math.asin(math.cos(math.radians(lat)) * math.sin(math.radians(d_lon_deg)))
+
+def block_margin_km(lat: float, lon: float, precision: int) -> float:
+    """
+    질의 지점에서 자기 셀 + 주변 8개 셀(block) 바깥까지의 최단 거리 (km)
+    이 거리 이내의 관측소는 반드시 block 안에 있음
+    """
+    lat_min, lat_max, lon_min, lon_max = decode_bbox(encode(lat, lon, precision))
+    lat_step, lon_step = lat_max - lat_min, lon_max - lon_min
+    margins = [_meridian_distance_km(lat, lon - (lon_min - lon_step)),
+               _meridian_distance_km(lat, (lon_max + lon_step) - lon)]
+    # 위도 방향은 위선까지의 거리 = 자오선을 따라간 거리 (극 바깥은 경계 없음)
+    if lat_min - lat_step > -90:
+        margins.append(EARTH_RADIUS_KM * math.radians(lat - (lat_min - lat_step)))
+    if lat_max + lat_step < 90:
+        margins.append(EARTH_RADIUS_KM * math.radians((lat_max + lat_step) - lat))
+    return min(margins)
+
+def cell_min_km(precision: int, max_abs_lat: float) -> float:
+    """위도 ±max_abs_lat 안에서 셀 한 칸 폭(km)의 최솟값 (block 경계까지의 최소 보장 거리)"""
+    lat_step, lon_step = cell_size_deg(precision)
+    return min(EARTH_RADIUS_KM * math.radians(lat_step), _meridian_distance_km(max_abs_lat, lon_step))
+
+def spacing_coverage_km(lats: Sequence[float], lons: Sequence[float], percentile: float = SPACING_PERCENTILE) -> float:
+    """관측소별 최근접 관측소 거리의 percentile 백분위수의 절반 (km)"""
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    if len(lats) < 2:
+        return math.inf
+    distances = haversine_matrix(lats, lons, lats, lons)
+    np.fill_diagonal(distances, np.inf)
+    return float(np.percentile(distances.min(axis=1), percentile)) / 2
+
+def choose_precision(coverage_km: float, max_abs_lat: float) -> int:
+    """셀 한 칸 폭이 coverage_km 이상인 가장 큰 정밀도 (가장 작은 셀)"""
+    precision = 1
+    for p in range(1, MAX_PRECISION + 1):
+        if cell_min_km(p, max_abs_lat) >= coverage_km:
+            precision = p
+    return precision
+
+# ---------------------------------------------------------------------------
+# 인덱스
+# ---------------------------------------------------------------------------
+
+class GeohashIndex:
+    """
+    관측소 geohash 버킷 인덱스
+
+    blocks: {geohash: [관측소 번호, ...]} - 셀 자기 자신 + 주변 8개 셀의 관측소 (번호 오름차순)
+    관측소가 block 안에 하나도 없는 셀은 저장하지 않음 (조회 시 전체 계산)
+    """
+
+    def __init__(self, codes: Sequence[str], names: Sequence[str], lats: Sequence[float], lons: Sequence[float],
+                 coverage_km: Optional[float] = None, precision: Optional[int] = None,
+                 blocks: Optional[Dict[str, List[int]]] = None):
+        self.codes = list(codes)
+        self.names = list(names)
+        self.lats = np.asarray(lats, dtype=np.float64)
+        self.lons = np.asarray(lons, dtype=np.float64)
+        if coverage_km is None:
+            coverage_km = round(spacing_coverage_km(self.lats, self.lons), 1)
+        self.coverage_km = coverage_km
+
+        if precision is None:
+            max_abs_lat = float(np.max(np.abs(self.lats))) + math.degrees(coverage_km / EARTH_RADIUS_KM)
+            precision = choose_precision(coverage_km, min(max_abs_lat, 89.0))
+        self.precision = precision
+        self.blocks = blocks if blocks is not None else self._build_blocks()
+
+    def _build_blocks(self) -> Dict[str, List[int]]:
+        buckets = {}
+        for i, (lat, lon) in enumerate(zip(self.lats, self.lons)):
+            buckets.setdefault(encode(lat, lon, self.precision), []).append(i)
+
+        blocks = {}
+        for cell, members in buckets.items():
+            for target in [cell] + neighbours(cell):
+                blocks.setdefault(target, []).extend(members)
+        return {cell: sorted(members) for cell, members in sorted(blocks.items())}
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def candidates(self, lat: float, lon: float) -> List[int]:
+        """질의 지점 셀의 block 관측소 번호 목록"""
+        return self.blocks.get(encode(lat, lon, self.precision), [])
+
+    def nearest(self, lat: float, lon: float) -> Tuple[str, float]:
+        """가장 가까운 관측소 (code, 거리 km). 동일 거리면 번호가 작은 관측소"""
+        candidates = self.candidates(lat, lon)
+        if candidates:
+            distances = haversine_np(lat, lon, self.lats[candidates], self.lons[candidates])
+            best = int(np.argmin(distances))
+            if distances[best] <= block_margin_km(lat, lon, self.precision):
+                return self.codes[candidates[best]], float(distances[best])
+
+        # block 밖에 더 가까운 관측소가 있을 수 있음 - 전체 계산
+        distances = haversine_np(lat, lon, self.lats, self.lons)
+        best = int(np.argmin(distances))
+        return self.codes[best], float(distances[best])
+
+    def to_dict(self) -> Dict:
+        return {
+            'version': INDEX_VERSION,
+            'precision': self.precision,
+            'coverage_km': self.coverage_km,
+            'codes': self.codes,
+            'names': self.names,
+            'lats': [float(v) for v in self.lats],
+            'lons': [float(v) for v in self.lons],
+            'blocks': self.blocks,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'GeohashIndex':
+        if data.get('version') != INDEX_VERSION:
+            raise ValueError(f"지원하지 않는 인덱스 버전: {data.get('version')}")
+        return cls(data['codes'], data['names'], data['lats'], data['lons'],
+                   coverage_km=data['coverage_km'], precision=data['precision'], blocks=data['blocks'])
+
+    def save(self, path: str):
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, separators=(',', ':'))
+
+    @classmethod
+    def load(cls, path: str) -> 'GeohashIndex':
+        with open(path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+# ---------------------------------------------------------------------------
+# 관측소 좌표 로드 / 내보내기
+# ---------------------------------------------------------------------------
+
+def load_station_points(xml_path: str, nxny_csv_path: Optional[str]) -> List[Dict]:
+    """관측소 XML + tide_weather_region 좌표 CSV (code 기준 병합, XML 우선)"""
+    stations = {}
+    for location in load_locations(xml_path):
+        if location.lat is not None and location.lon is not None:
+            stations[location.code] = {'code': location.code, 'name': location.name,
+                                       'lat': location.lat, 'lon': location.lon}
+
+    if nxny_csv_path:
+        with open(nxny_csv_path, 'r', encoding='utf-8-sig') as f:
+            for row in csv.DictReader(f):
+                if row['Code'] in stations:
+                    continue
+                try:
+                    stations[row['Code']] = {'code': row['Code'], 'name': row['Name'],
+                                             'lat': float(row['Latitude']), 'lon': float(row['Longitude'])}
+                except ValueError:
+                    print(f"⚠️ 좌표 오류로 제외: {row['Code']} {row['Name']}")
+
+    return list(stations.values())
+
+def update_locations_js() -> bool:
+    """netlify/shared/locations.js 재생성 (convert_to_js.py가 저장된 인덱스를 locationGeohashIndex로 포함)"""
+    script_dir, script = os.path.split(LOCATIONS_JS_SCRIPT)
+    result = subprocess.run([sys.executable, script], cwd=script_dir)
+    return result.returncode == 0
+
+def main():
+    parser = argparse.ArgumentParser(description='GPS 좌표 → 최근접 관측소 geohash 인덱스')
+    parser.add_argument('--coverage-km', type=float, default=None,
+                        help='이 거리 안에 관측소가 있는 지점은 block 조회만으로 정확히 찾도록 정밀도 선택 '
+                             f'(기본값: 관측소별 최근접 관측소 거리 {SPACING_PERCENTILE}백분위수의 절반)')
+    parser.add_argument('--lookup', nargs=2, type=float, metavar=('LAT', 'LON'),
+                        help='저장된 인덱스로 최근접 관측소 조회')
+    args = parser.parse_args()
+
+    if args.lookup:
+        if not os.path.exists(JSON_PATH):
+            print(f"❌ 인덱스 파일이 없습니다: {JSON_PATH} (먼저 python3 geohash_index.py 실행)")
+            return
+        index = GeohashIndex.load(JSON_PATH)
+        code, distance = index.nearest(*args.lookup)
+        print(f"📍 {code} ({index.names[index.codes.index(code)]}) - {distance:.2f} km")
+        return
+
+    nxny_matches = sorted(glob.glob(NXNY_GLOB))
+    stations = load_station_points(XML_PATH, nxny_matches[0] if nxny_matches else None)
+    print(f"📍 관측소 {len(stations)}개 로드 완료")
+
+    index = GeohashIndex([s['code'] for s in stations], [s['name'] for s in stations],
+                         [s['lat'] for s in stations], [s['lon'] for s in stations],
+                         coverage_km=args.coverage_km)
+    sizes = [len(members) for members in index.blocks.values()]
+    print(f"🔢 반경 {index.coverage_km}km 보장, 정밀도 {index.precision} (셀 {cell_size_deg(index.precision)[0]:.4f}° × "
+          f"{cell_size_deg(index.precision)[1]:.4f}°), 셀 {len(index.blocks)}개, "
+          f"셀당 후보 평균 {np.mean(sizes):.1f}개 / 최대 {max(sizes)}개")
+
+    index.save(JSON_PATH)
+    print(f"💾 저장: {JSON_PATH}")
+    if not update_locations_js():
+        print(f"⚠️ locations.js 갱신 실패 - {LOCATIONS_JS_SCRIPT}를 직접 실행하세요")
+
+if __name__ == '__main__':
+    main()
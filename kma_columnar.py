@@ -0,0 +1,218 @@
+"""
+기상청 typ01 덤프(ASOS 시간자료 kma_api.info, ABS 해양관측 abs_api.info 등)를 컬럼 배열로 읽기
+- kma_typ01.Typ01Reader로 행을 나눈 뒤 컬럼별로 한 번에 변환 (값마다 문자열 비교/변환 반복 없음)
+- 결과는 NumPy 구조화 배열 (컬럼 하나 = 필드 하나)
+    float: float64, 결측 표시값(-9, -99.0 등)과 빈 값은 NaN
+    time:  datetime64[m], 같은 시각 문자열은 한 번만 파싱 (여러 지점이 같은 TM을 공유), 없으면 NaT
+    str:   int32 코드 (categories[컬럼][코드] = 원문, 처음 나온 순서로 번호, 없으면 -1)
+           지점 ID/지점명처럼 반복되는 문자열은 고유값 하나만 보관, 코드 컬럼의 -9도 결측
+- 결측 표시값: -9(ASOS 대부분 요소, 지면온도 TS), -99.0(ABS, ASOS 기온/지중온도), -999
+  컬럼별 기본값은 COLUMN_MISSING_VALUES (기온/이슬점/수온/지중온도는 -9.0℃가 실제 값이므로 -99 이하만)
+  표에 없는 컬럼은 단위로 판단 (C는 -99 이하만, 그 외는 -9 포함)
+  (다르게 처리할 컬럼은 missing 인자로 지정, 예: missing={'TA': MISSING_VALUES})
+- pyarrow가 설치되어 있으면 to_arrow()로 Arrow Table 변환 (str 컬럼은 dictionary 배열)
+
+사용 예:
+    table = read_columnar('abs_api.info', ABS_COLUMNS, ABS_TYPES)
+    table['TW']                  # float64 배열 (결측 NaN)
+    table.masked('TW')           # 결측이 가려진 masked array
+    table.strings('STN_ID')      # 원문 문자열 배열
+"""
+
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from kma_typ01 import Typ01Reader, Typ01Schema
+
+MISSING_VALUES = (-9.0, -99.0, -999.0)
+TEMPERATURE_MISSING_VALUES = (-99.0, -999.0)  # 단위가 C인 컬럼 (-9.0℃는 실제 값)
+MISSING_TOKENS = ('', '-', '=')
+STR_MISSING_TOKENS = MISSING_TOKENS + ('-9', '-99')  # 코드 컬럼(WC, IX 등)의 결측
+
+STORAGE_DTYPES = {'float': np.float64, 'time': 'datetime64[m]', 'str': np.int32}
+
+# 컬럼별 기본 결측 표시값 (kma_api.info: TS는 -9.0, TE_*는 -99.0을 결측으로 씀)
+COLUMN_MISSING_VALUES = {
+    'TA': TEMPERATURE_MISSING_VALUES,      # 기온
+    'TD': TEMPERATURE_MISSING_VALUES,      # 이슬점온도
+    'TW': TEMPERATURE_MISSING_VALUES,      # 수온 (ABS)
+    'TS': MISSING_VALUES,                  # 지면온도 (-9.0이 결측)
+    'TE_005': TEMPERATURE_MISSING_VALUES,  # 5cm 지중온도
+    'TE_01': TEMPERATURE_MISSING_VALUES,   # 10cm 지중온도
+    'TE_02': TEMPERATURE_MISSING_VALUES,   # 20cm 지중온도
+    'TE_03': TEMPERATURE_MISSING_VALUES,   # 30cm 지중온도
+}
+
+def missing_values_for(column) -> Sequence[float]:
+    """컬럼의 기본 결측 표시값 (COLUMN_MISSING_VALUES, 없으면 단위 C는 -99 이하만)"""
+    if column.name in COLUMN_MISSING_VALUES:
+        return COLUMN_MISSING_VALUES[column.name]
+    return TEMPERATURE_MISSING_VALUES if column.unit.lower() == 'c' else MISSING_VALUES
+
+def _parse_time(value: str):
+    try:
+        return np.datetime64(datetime.strptime(value, '%Y%m%d%H%M'), 'm')
+    except ValueError:
+        return np.datetime64('NaT', 'm')
+
+def _to_float(token: str) -> float:
+    try:
+        return float(token)
+    except ValueError:
+        return np.nan
+
+def _float_column(tokens: List[str], missing_values: Sequence[float]) -> np.ndarray:
+    try:
+        values = np.fromiter(map(float, tokens), np.float64, len(tokens))
+    except ValueError:
+        # 빈 값이나 숫자가 아닌 값이 섞인 경우에만 값마다 확인
+        values = np.array([_to_float(token) for token in tokens], dtype=np.float64)
+    values[np.isin(values, missing_values)] = np.nan
+    return values
+
+def _intern(tokens: List[str], missing_tokens: frozenset):
+    """문자열 → 정수 코드 (처음 나온 순서로 번호, 결측은 -1)와 고유 문자열 목록"""
+    index = {}
+    codes = np.fromiter((-1 if token in missing_tokens else index.setdefault(token, len(index)) for token in tokens),
+                        np.int32, len(tokens))
+    return codes, list(index)
+
+def _time_column(tokens: List[str]) -> np.ndarray:
+    codes, uniques = _intern(tokens, frozenset(MISSING_TOKENS))
+    parsed = np.array([_parse_time(token) for token in uniques] + [np.datetime64('NaT', 'm')], dtype='datetime64[m]')
+    return parsed[codes]  # 결측(-1)은 마지막 NaT
+
+def _str_column(tokens: List[str]):
+    codes, uniques = _intern(tokens, frozenset(STR_MISSING_TOKENS))
+    return codes, np.array(uniques, dtype=str)
+
+class ColumnarTable:
+    """typ01 덤프의 컬럼 배열 (data: 구조화 배열, categories: str 컬럼의 고유 문자열)"""
+
+    def __init__(self, schema: Typ01Schema, data: np.ndarray, categories: Dict[str, np.ndarray],
+                 row_lengths: np.ndarray):
+        self.schema = schema
+        self.data = data
+        self.categories = categories
+        self.row_lengths = row_lengths  # 행별 실제 값 개수 (컬럼 수보다 적으면 뒤쪽 컬럼은 결측)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self.data[name]
+
+    def __repr__(self) -> str:
+        return f"ColumnarTable({len(self)}행, {self.schema})"
+
+    def select(self, rows) -> 'ColumnarTable':
+        """일부 행만 고른 표 (bool 배열 또는 행 번호, categories는 공유)"""
+        return ColumnarTable(self.schema, self.data[rows], self.categories, self.row_lengths[rows])
+
+    def type_of(self, name: str) -> str:
+        return self.schema.columns[self.schema.index[name]].type
+
+    def valid(self, name: str) -> np.ndarray:
+        """값이 있는 행 (결측이 아닌 행) bool 배열"""
+        values = self.data[name]
+        kind = self.type_of(name)
+        if kind == 'float':
+            return ~np.isnan(values)
+        if kind == 'time':
+            return ~np.isnat(values)
+        return values >= 0
+
+    def masked(self, name: str) -> np.ma.MaskedArray:
+        """결측을 가린 masked array (str 컬럼은 코드 배열)"""
+        return np.ma.masked_array(self.data[name], mask=~self.valid(name))
+
+    def strings(self, name: str) -> np.ndarray:
+        """str 컬럼의 원문 문자열 배열 (결측은 빈 문자열)"""
+        codes = self.data[name]
+        categories = np.append(self.categories[name], '')
+        return categories[np.where(codes >= 0, codes, len(categories) - 1)]
+
+    def to_arrow(self):
+        """pyarrow.Table로 변환 (pyarrow 필요)"""
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError("to_arrow()에는 pyarrow가 필요합니다: pip install pyarrow") from e
+
+        arrays = []
+        for name in self.schema.names:
+            values = self.data[name]
+            if self.type_of(name) == 'str':
+                indices = pa.array(values, mask=values < 0)
+                arrays.append(pa.DictionaryArray.from_arrays(indices, pa.array(self.categories[name])))
+            else:
+                arrays.append(pa.array(values, mask=~self.valid(name)))
+        return pa.table(arrays, names=self.schema.names)
+
+def columnar_from_reader(reader: Typ01Reader, missing: Optional[Dict[str, Sequence[float]]] = None) -> ColumnarTable:
+    """
+    Typ01Reader의 모든 행을 컬럼 배열로 변환
+    missing: 컬럼별 결측 표시값 지정 (기본값은 missing_values_for, 예: {'TA': MISSING_VALUES})
+    """
+    schema = reader.schema
+    n = len(schema)
+    tokens_by_column = [[] for _ in range(n)]
+    row_lengths = []
+    for values in reader.iter_values():
+        row_lengths.append(len(values))
+        if len(values) < n:
+            values = values + [''] * (n - len(values))
+        for tokens, value in zip(tokens_by_column, values):
+            tokens.append(value)
+
+    data = np.empty(len(row_lengths), dtype=[(column.name, STORAGE_DTYPES[column.type]) for column in schema.columns])
+    categories = {}
+    for column, tokens in zip(schema.columns, tokens_by_column):
+        if column.type == 'float':
+            missing_values = (missing or {}).get(column.name, missing_values_for(column))
+            data[column.name] = _float_column(tokens, missing_values)
+        elif column.type == 'time':
+            data[column.name] = _time_column(tokens)
+        else:
+            data[column.name], categories[column.name] = _str_column(tokens)
+    return ColumnarTable(schema, data, categories, np.array(row_lengths, dtype=np.int32))
+
+def read_columnar(path: str, columns: Optional[Sequence[str]] = None, types: Optional[Dict[str, str]] = None,
+                  missing: Optional[Dict[str, Sequence[float]]] = None, encoding: str = 'utf-8') -> ColumnarTable:
+    """typ01 파일을 컬럼 배열로 읽기"""
+    with open(path, 'r', encoding=encoding) as f:
+        return columnar_from_reader(Typ01Reader(f, columns, types), missing)
+
+def read_columnar_lines(lines: Iterable[str], columns: Optional[Sequence[str]] = None,
+                        types: Optional[Dict[str, str]] = None,
+                        missing: Optional[Dict[str, Sequence[float]]] = None) -> ColumnarTable:
+    """이미 받은 응답 텍스트(줄 목록)를 컬럼 배열로 읽기"""
+    return columnar_from_reader(Typ01Reader(iter(lines), columns, types), missing)
+
+if __name__ == '__main__':
+    import sys
+
+    from kma_typ01 import ABS_COLUMNS, ABS_TYPES
+
+    if len(sys.argv) < 2:
+        print("사용법: python kma_columnar.py <typ01 파일> [--abs]")
+        sys.exit(1)
+
+    if '--abs' in sys.argv[2:]:
+        table = read_columnar(sys.argv[1], ABS_COLUMNS, ABS_TYPES)
+    else:
+        table = read_columnar(sys.argv[1])
+
+    print(f"📋 {table}")
+    for column in table.schema.columns:
+        valid = table.valid(column.name)
+        values = table[column.name]
+        if column.type == 'str':
+            detail = f"고유값 {len(table.categories[column.name])}개"
+        elif valid.any():
+            detail = f"{values[valid].min()} ~ {values[valid].max()}"
+        else:
+            detail = '-'
+        print(f"   {column.name:<8} {column.type:<5} 유효 {valid.mean() * 100 if len(table) else 0:5.1f}%  {detail}")
@@ -4,7 +4,7 @@
 """
 
 # 기상청 중기예보 지역 코드 정의
-KMA_REGION_CODES = {2021
+KMA_REGION_CODES = {
     # Temperature 예보 지역 (203개) - 상세 시·군·구 단위
     'temperature': {
         # 백령도
@@ -338,6 +338,189 @@ REGION_STATS = {
     }
 }
 
+# 해상 구역 대응 (육상/기온 지역 코드 접두사 → 연안 해상 구역, 주 구역 먼저)
+# tidedata-nxny.csv 관측소의 시도(AddressA)별 marine_reg_name 분포 기준
+MARINE_ZONES_BY_PREFIX = {
+    '11A': ['12A10000'],              # 백령도 → 서해북부
+    '11B': ['12A10000'],              # 서울.인천.경기 → 서해북부
+    '11C2': ['12A20000'],             # 충청남도 → 서해중부
+    '11D2': ['12C20000', '12C10000'], # 강원영동 → 동해중부, 동해남부
+    '11E': ['12C20000'],              # 울릉도·독도 → 동해중부
+    '11F1': ['12A20000', '12A30000'], # 전북 → 서해중부, 서해남부
+    '11F2': ['12A30000', '12B10000'], # 전라남도 → 서해남부, 남해서부
+    '11G': ['12B10500', '12B10000'],  # 제주도 → 제주도해상, 남해서부
+    '11H1': ['12C10000', '12C20000'], # 경상북도 → 동해남부, 동해중부
+    '11H2': ['12B20000'],             # 경상남도(부산, 울산 포함) → 남해동부
+    '11I': ['12A10000'],              # 황해도 → 서해북부
+    '11J': ['12A10000'],              # 평안도 → 서해북부
+    '11K': ['12C30000'],              # 함경도 → 동해북부
+    '11L': ['12C30000'],              # 강원도(북) → 동해북부
+}
+
+class RegionRegistry:
+    """
+    지역 코드 색인 (import 시점이 아닌 첫 사용 시 한 번 생성, get_registry() 참고)
+
+    - REG_ID 접두사 트라이: codes_with_prefix('11B2')
+    - 지역명 → 코드 색인: codes_for_name('인천')
+    - 코드 구조로 만든 계층: 기온 지역 11B20201 → 육상 지역 11B00000 → 해상 구역 12A10000
+      (육상 코드는 끝의 0을 뗀 접두사(11B, 11C1 등)로 하위 기온 지역을 묶음,
+       21F(서남해안 특별구역)는 11F와 같은 지역으로 취급)
+    """
+
+    _TERMINAL = ''  # 트라이 노드에서 코드가 끝나는 지점 표시 (코드 문자와 겹치지 않음)
+
+    def __init__(self, region_codes=None):
+        region_codes = KMA_REGION_CODES if region_codes is None else region_codes
+
+        self._forecast_type = {}
+        self._name = {}
+        self._by_name = {}
+        self._trie = {}
+        for forecast_type, regions in region_codes.items():
+            for reg_id, name in regions.items():
+                self._forecast_type[reg_id] = forecast_type
+                self._name[reg_id] = name
+                self._by_name.setdefault(name, []).append(reg_id)
+                node = self._trie
+                for ch in reg_id:
+                    node = node.setdefault(ch, {})
+                node[self._TERMINAL] = reg_id
+
+        # 육상 지역 접두사 (11B00000 → 11B, 11C10000 → 11C1)
+        self._land_by_prefix = {
+            reg_id.rstrip('0'): reg_id
+            for reg_id in region_codes.get('land', {})
+        }
+
+        self._parent = {}
+        self._children = {}
+        for reg_id in region_codes.get('temperature', {}):
+            parent = self._longest_prefix_match(self._structural_code(reg_id), self._land_by_prefix)
+            if parent is not None:
+                self._parent[reg_id] = parent
+                self._children.setdefault(parent, []).append(reg_id)
+
+    @staticmethod
+    def _structural_code(reg_id):
+        """21F(서남해안 특별구역) 코드를 같은 지역의 11F 코드 체계로 변환"""
+        return '11' + reg_id[2:] if reg_id.startswith('21') else reg_id
+
+    @staticmethod
+    def _longest_prefix_match(code, table):
+        for end in range(len(code), 0, -1):
+            if code[:end] in table:
+                return table[code[:end]]
+        return None
+
+    def __contains__(self, reg_id):
+        return reg_id in self._name
+
+    def __len__(self):
+        return len(self._name)
+
+    def name(self, reg_id):
+        """지역 코드 → 지역명"""
+        return self._name.get(reg_id)
+
+    def forecast_type(self, reg_id):
+        """지역 코드 → 예보 유형 (temperature / land / marine)"""
+        return self._forecast_type.get(reg_id)
+
+    def codes_for_name(self, name, forecast_type=None):
+        """지역명 → 지역 코드 목록 (같은 이름이 여러 지역에 있을 수 있음, 예: 고성)"""
+        return [
+            reg_id for reg_id in self._by_name.get(name, [])
+            if forecast_type is None or self._forecast_type[reg_id] == forecast_type
+        ]
+
+    def codes_with_prefix(self, prefix, forecast_type=None):
+        """REG_ID 접두사로 시작하는 지역 코드 목록 (코드 순)"""
+        node = self._trie
+        for ch in prefix:
+            node = node.get(ch)
+            if node is None:
+                return []
+
+        result = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if self._TERMINAL in node:
+                reg_id = node[self._TERMINAL]
+                if forecast_type is None or self._forecast_type[reg_id] == forecast_type:
+                    result.append(reg_id)
+            stack.extend(node[ch] for ch in sorted((k for k in node if k != self._TERMINAL), reverse=True))
+        return result
+
+    def parent(self, reg_id):
+        """기온 지역 → 상위 육상 지역 코드 (없으면 None)"""
+        return self._parent.get(reg_id)
+
+    def children(self, reg_id):
+        """육상 지역 → 하위 기온 지역 코드 목록"""
+        return list(self._children.get(reg_id, []))
+
+    def marine_zones(self, reg_id):
+        """기온/육상 지역 → 연안 해상 구역 코드 목록 (해상 구역은 자기 자신)"""
+        if self._forecast_type.get(reg_id) == 'marine':
+            return [reg_id]
+        return list(self._longest_prefix_match(self._structural_code(reg_id).rstrip('0') or reg_id,
+                                               MARINE_ZONES_BY_PREFIX) or [])
+
+    def hierarchy(self, reg_id):
+        """지역 코드의 계층 (기온 지역, 육상 지역, 해상 구역 목록)"""
+        forecast_type = self._forecast_type.get(reg_id)
+        if forecast_type == 'temperature':
+            return {'temperature': reg_id, 'land': self.parent(reg_id), 'marine': self.marine_zones(reg_id)}
+        if forecast_type == 'land':
+            return {'temperature': None, 'land': reg_id, 'marine': self.marine_zones(reg_id)}
+        if forecast_type == 'marine':
+            return {'temperature': None, 'land': None, 'marine': [reg_id]}
+        return None
+
+    def coverage(self, reg_id):
+        """지역이 포함하는 기온 지역 코드 집합 (겹침 계산용)"""
+        forecast_type = self._forecast_type.get(reg_id)
+        if forecast_type == 'temperature':
+            return frozenset([reg_id])
+        if forecast_type == 'land':
+            return frozenset(self._children.get(reg_id, []))
+        if forecast_type == 'marine':
+            return frozenset(
+                code for code, code_type in self._forecast_type.items()
+                if code_type == 'temperature' and reg_id in self.marine_zones(code)
+            )
+        return frozenset()
+
+    def overlapping(self, type_a, type_b):
+        """두 예보 유형 사이에 포함 지역(기온 지역)이 겹치는 (코드 a, 코드 b) 쌍"""
+        coverage_b = {reg_id: self.coverage(reg_id) for reg_id in self._iter_type(type_b)}
+        return {
+            (a, b)
+            for a in self._iter_type(type_a)
+            for b, covered in coverage_b.items()
+            if self.coverage(a) & covered
+        }
+
+    def _iter_type(self, forecast_type):
+        return [reg_id for reg_id, code_type in self._forecast_type.items() if code_type == forecast_type]
+
+_REGISTRY = None
+
+def get_registry():
+    """지역 코드 색인 (처음 호출할 때 한 번만 생성)"""
+    global _REGISTRY
+    if _REGISTRY is None:
+        _REGISTRY = RegionRegistry()
+    return _REGISTRY
+
+def __getattr__(name):
+    # REGISTRY는 처음 접근할 때 생성 (색인이 필요 없는 스크립트는 비용 없음)
+    if name == 'REGISTRY':
+        return get_registry()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 def get_region_name(forecast_type, reg_id):
     """지역 코드로 지역명 조회"""
     return KMA_REGION_CODES.get(forecast_type, {}).get(reg_id)
@@ -361,17 +544,33 @@ def validate_region_code(forecast_type, reg_id):
     """지역 코드 유효성 검사"""
     return reg_id in KMA_REGION_CODES.get(forecast_type, {})
 
+def find_region_codes(name, forecast_type=None):
+    """지역명으로 지역 코드 조회 (역방향)"""
+    return get_registry().codes_for_name(name, forecast_type)
+
 def get_overlapping_regions():
-    """예보 유형간 중복 지역 확인"""
-    temp_set = set(KMA_REGION_CODES['temperature'].keys())
-    land_set = set(KMA_REGION_CODES['land'].keys())
-    marine_set = set(KMA_REGION_CODES['marine'].keys())
-    
+    """
+    예보 유형간 겹치는 지역 확인
+    각 지역이 포함하는 기온 지역 집합(RegionRegistry.coverage)의 교집합으로 판단
+    반환값: 유형 쌍별 (코드, 코드) 집합, all_three는 (기온, 육상, 해상) 집합
+    """
+    registry = get_registry()
+    temperature_land = registry.overlapping('temperature', 'land')
+    temperature_marine = registry.overlapping('temperature', 'marine')
+
+    marine_by_temperature = {}
+    for temperature, marine in temperature_marine:
+        marine_by_temperature.setdefault(temperature, set()).add(marine)
+
     return {
-        'temperature_land': temp_set & land_set,
-        'temperature_marine': temp_set & marine_set,
-        'land_marine': land_set & marine_set,
-        'all_three': temp_set & land_set & marine_set
+        'temperature_land': temperature_land,
+        'temperature_marine': temperature_marine,
+        'land_marine': registry.overlapping('land', 'marine'),
+        'all_three': {
+            (temperature, land, marine)
+            for temperature, land in temperature_land
+            for marine in marine_by_temperature.get(temperature, ())
+        }
     }
 
 if __name__ == '__main__':
@@ -386,4 +585,9 @@ if __name__ == '__main__':
     
     # 중복 지역 확인
     overlaps = get_overlapping_regions()
-    print(f"\n중복 지역: {sum(len(overlap) for overlap in overlaps.values())}개 (모두 0개)")
\ No newline at end of file
+    print("\n겹치는 지역 (포함 기온 지역 기준):")
+    for key, pairs in overlaps.items():
+        print(f"  {key}: {len(pairs)}쌍")
+
+    # 계층 예시
+    print(f"\n11B20201 계층: {get_registry().hierarchy('11B20201')}")
\ No newline at end of file
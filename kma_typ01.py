@@ -0,0 +1,273 @@
+"""
+기상청 API 허브 typ01 텍스트 형식(#START7777 ~ #7777END) 공용 파서
+
+- 파일을 한 줄씩 읽으며 행을 하나씩 돌려주므로 여러 달치 덤프도 일정한 메모리로 처리
+- 헤더 주석의 컬럼 설명("#  1. REG_ID   : 예보구역코드")에서 컬럼 스키마(이름/설명/단위/타입)를 만듦
+  타입: time(TM, TM_xx → datetime), float(단위가 m, hPa, % 등), str(그 외)
+- 행 값은 문자열 그대로 보관하고, 컬럼을 읽을 때 타입 변환 (row['TA'] → float, row.raw('TA') → '-99.0')
+- 구분자 자동 판별: 쉼표(ABS 해양관측 "B, 202301241200, ..., ,=") 또는 공백(중기예보구역, ASOS)
+- 공백 구분일 때 마지막 컬럼은 공백이 들어간 자유 문자열로 취급 (예: 지역명)
+- 줄바꿈이 공백으로 바뀐 파일(backup/00_etc/fct_medm_reg.csv처럼 전체가 한 줄)도
+  첫 행의 토큰 모양(영숫자 자리 수)으로 행 경계를 찾아 분리
+
+사용 예:
+    for row in iter_typ01('medm_reg.txt'):
+        print(row['REG_ID'], row['REG_NAME'])
+"""
+
+import re
+from collections import namedtuple
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Sequence
+
+START_MARK = '#START7777'
+END_MARK = '#7777END'
+
+# 컬럼 설명의 괄호 안 단위가 이 중 하나면 숫자 컬럼
+NUMERIC_UNITS = {
+    'm', 'm/s', 'c', 'hpa', '%', 'mm', 'mm/h', 'cm', 'deg', 'degree', '16방위',
+    '1/10', '100m', '10m', 'hr', 'mj/m2', 'km',
+}
+
+# ABS 해양관측(kma_sea_obs) 자료의 실제 컬럼 순서
+# 헤더의 번호 목록은 TP, STN_ID, STN_KO, TM 순서이고 LON/LAT이 빠져 있어 그대로 쓸 수 없음
+ABS_COLUMNS = ('TP', 'TM', 'STN_ID', 'STN_KO', 'LON', 'LAT', 'WH', 'WD', 'WS', 'WS_GST', 'TW', 'TA', 'PA', 'HM')
+ABS_TYPES = {'LON': 'float', 'LAT': 'float'}
+
+_COLUMN_LINE = re.compile(r'^#\s*(\d+)\.\s*([A-Za-z_][A-Za-z0-9_]*)\s*:\s*(.*)$')
+_UNIT = re.compile(r'\(([^)]*)\)')
+_INLINE_COMMENT = re.compile(r'\s+(?=#)')
+_ASCII_ALNUM = re.compile(r'[0-9A-Za-z]')
+
+Column = namedtuple('Column', ['name', 'description', 'unit', 'type'])
+
+def _infer_type(name: str, unit: str) -> str:
+    if name == 'TM' or name.startswith('TM_'):
+        return 'time'
+    if unit.lower() in NUMERIC_UNITS:
+        return 'float'
+    return 'str'
+
+def _convert(value: Optional[str], kind: str):
+    if value is None or value == '':
+        return None
+    if kind == 'float':
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    if kind == 'time':
+        try:
+            return datetime.strptime(value, '%Y%m%d%H%M')
+        except ValueError:
+            return None
+    return value
+
+def _token_shape(token: str) -> str:
+    """행 경계 판별용 토큰 모양 (영숫자는 x, 그 외 문자는 그대로)"""
+    return _ASCII_ALNUM.sub('x', token)
+
+class Typ01Schema:
+    """컬럼 목록과 이름 → 위치 색인"""
+
+    def __init__(self, columns: Sequence[Column]):
+        self.columns = list(columns)
+        self.names = [column.name for column in self.columns]
+        self.index = {name: i for i, name in enumerate(self.names)}
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+    def __repr__(self) -> str:
+        return f"Typ01Schema({', '.join(f'{c.name}:{c.type}' for c in self.columns)})"
+
+class Typ01Row:
+    """데이터 한 행 (값은 문자열로 보관하고 읽을 때 타입 변환)"""
+
+    __slots__ = ('schema', 'values')
+
+    def __init__(self, schema: Typ01Schema, values: List[str]):
+        self.schema = schema
+        self.values = values
+
+    def raw(self, name: str) -> Optional[str]:
+        """원문 문자열 (행에 값이 없으면 None)"""
+        i = self.schema.index[name]
+        return self.values[i] if i < len(self.values) else None
+
+    def __getitem__(self, name: str):
+        return _convert(self.raw(name), self.schema.columns[self.schema.index[name]].type)
+
+    def get(self, name: str, default=None):
+        if name not in self.schema.index:
+            return default
+        value = self[name]
+        return default if value is None else value
+
+    def as_dict(self) -> Dict:
+        return {name: self[name] for name in self.schema.names}
+
+    def __repr__(self) -> str:
+        return f"Typ01Row({dict(zip(self.schema.names, self.values))})"
+
+class Typ01Reader:
+    """
+    typ01 텍스트 스트림 파서
+    생성 시 헤더(첫 데이터 행 직전까지)만 읽어 schema를 만들고, 반복하면 행을 하나씩 돌려줌
+
+    columns: 실제 데이터 컬럼 순서 (헤더 번호 목록과 다를 때, 예: ABS_COLUMNS)
+             설명/단위는 헤더에 같은 이름이 있으면 가져옴
+    types: 컬럼별 타입 지정 ('str' / 'float' / 'time'), 추론 결과보다 우선
+    """
+
+    def __init__(self, lines: Iterator[str], columns: Optional[Sequence[str]] = None,
+                 types: Optional[Dict[str, str]] = None):
+        self._lines = self._split_inline_comments(lines)
+        self._pending: List[str] = []
+        self.header: List[str] = []
+        self.delimiter: Optional[str] = None
+        self._record_shape: Optional[List[str]] = None
+        self._ended = False
+
+        documented = self._read_header()
+        self.schema = self._build_schema(documented, columns, types or {})
+
+    @staticmethod
+    def _split_inline_comments(lines: Iterator[str]) -> Iterator[str]:
+        """한 줄에 주석 여러 개가 이어진 경우(줄바꿈이 사라진 파일) 주석 단위로 나눔"""
+        for line in lines:
+            line = line.strip()
+            if '#' in line[1:]:
+                yield from _INLINE_COMMENT.split(line)
+            else:
+                yield line
+
+    def _read_header(self) -> List[Column]:
+        documented = []
+        for line in self._lines:
+            if not line or line.startswith(START_MARK) and not line[len(START_MARK):].strip():
+                continue
+            if line.startswith(END_MARK):
+                self._ended = True
+                break
+            if not line.startswith('#'):
+                self._pending.append(line)
+                break
+
+            self.header.append(line)
+            match = _COLUMN_LINE.match(line)
+            if match:
+                _, name, description = match.groups()
+                unit = _UNIT.search(description)
+                documented.append(Column(name, description.strip(), unit.group(1).strip() if unit else '', None))
+                continue
+
+            # 컬럼명 줄 뒤에 데이터가 바로 이어진 경우 (줄바꿈이 사라진 파일)
+            tokens = line[1:].split()
+            names = [column.name for column in documented]
+            if names and len(tokens) > len(names) and tokens[:len(names)] == names:
+                self._pending.append(' '.join(tokens[len(names):]))
+                break
+        return documented
+
+    @staticmethod
+    def _build_schema(documented: List[Column], columns: Optional[Sequence[str]],
+                      types: Dict[str, str]) -> Typ01Schema:
+        by_name = {column.name: column for column in documented}
+        names = list(columns) if columns else [column.name for column in documented]
+        if not names:
+            raise ValueError("typ01 헤더에서 컬럼 목록을 찾을 수 없습니다 (columns 인자로 지정 필요)")
+
+        schema = []
+        for name in names:
+            described = by_name.get(name, Column(name, '', '', None))
+            kind = types.get(name) or _infer_type(name, described.unit)
+            schema.append(described._replace(type=kind))
+        return Typ01Schema(schema)
+
+    def _records(self, line: str) -> Iterator[List[str]]:
+        if self.delimiter is None:
+            self.delimiter = ',' if ',' in line else ' '
+
+        if self.delimiter == ',':
+            values = [value.strip() for value in line.split(',')]
+            while values and values[-1] in ('', '='):
+                values.pop()
+            yield values
+            return
+
+        n = len(self.schema)
+        tokens = line.split()
+        if self._record_shape is None and len(tokens) >= n:
+            self._record_shape = [_token_shape(token) for token in tokens[:n - 1]]
+        if len(tokens) <= n:
+            yield tokens
+            return
+
+        # 마지막 컬럼(자유 문자열)은 다음 행 시작 모양이 나올 때까지 이어 붙임
+        start = 0
+        while start < len(tokens):
+            end = min(start + n, len(tokens))
+            while end < len(tokens) and not self._is_record_start(tokens, end):
+                end += 1
+            fixed = tokens[start:start + n - 1]
+            rest = tokens[start + n - 1:end]
+            yield fixed + ([' '.join(rest)] if rest else [])
+            start = end
+
+    def _is_record_start(self, tokens: List[str], i: int) -> bool:
+        shape = self._record_shape
+        if i + len(shape) >= len(tokens):
+            return False
+        return all(_token_shape(tokens[i + k]) == shape[k] for k in range(len(shape)))
+
+    def iter_values(self) -> Iterator[List[str]]:
+        """행 값 목록(원문 문자열)을 하나씩 반환 (Typ01Row를 만들지 않음)"""
+        if self._ended:
+            return
+        while True:
+            if self._pending:
+                line = self._pending.pop()
+            else:
+                line = next(self._lines, None)
+                if line is None:
+                    return
+            if not line:
+                continue
+            if line.startswith(END_MARK):
+                return
+            if line.startswith('#'):
+                continue
+            yield from self._records(line)
+
+    def __iter__(self) -> Iterator[Typ01Row]:
+        for values in self.iter_values():
+            yield Typ01Row(self.schema, values)
+
+def iter_typ01(path: str, columns: Optional[Sequence[str]] = None, types: Optional[Dict[str, str]] = None,
+               encoding: str = 'utf-8') -> Iterator[Typ01Row]:
+    """typ01 파일의 데이터 행을 하나씩 반환"""
+    with open(path, 'r', encoding=encoding) as f:
+        yield from Typ01Reader(f, columns, types)
+
+def read_schema(path: str, columns: Optional[Sequence[str]] = None, types: Optional[Dict[str, str]] = None,
+                encoding: str = 'utf-8') -> Typ01Schema:
+    """typ01 파일 헤더의 컬럼 스키마"""
+    with open(path, 'r', encoding=encoding) as f:
+        return Typ01Reader(f, columns, types).schema
+
+if __name__ == '__main__':
+    import sys
+
+    if len(sys.argv) < 2:
+        print("사용법: python kma_typ01.py <typ01 파일> [행 수]")
+        sys.exit(1)
+
+    limit = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    print(f"📋 {read_schema(sys.argv[1])}")
+    count = 0
+    for row in iter_typ01(sys.argv[1]):
+        if count < limit:
+            print(f"   {row.as_dict()}")
+        count += 1
+    print(f"✅ 데이터 {count}행")
@@ -0,0 +1,120 @@
+"""
+관측소 위치 XML(locations_with_addresses.xml, total_locations.xml 등) 공용 로더
+- iterparse로 <Location> 단위 스트리밍 파싱 (처리한 요소는 즉시 해제)
+- 관측소 1개를 __slots__ 레코드(LocationRecord)로 보관
+- 파싱 결과를 __pycache__/<파일명>.locations.pkl 에 캐시
+  (파일 mtime/크기가 같으면 바로 사용, 다르면 내용 해시로 한 번 더 확인)
+"""
+
+import hashlib
+import os
+import pickle
+import xml.etree.ElementTree as ET
+from typing import Iterator, List, Optional
+
+CACHE_VERSION = 1
+
+class LocationRecord:
+    """관측소 1개 (XML <Location> 요소)"""
+
+    __slots__ = ('code', 'name', 'lat', 'lon', 'marine_reg_name', 'address_a', 'address_b', 'address_c')
+
+    def __init__(self, code: str, name: str, lat: Optional[float], lon: Optional[float],
+                 marine_reg_name: str = '', address_a: str = '', address_b: str = '', address_c: str = ''):
+        self.code = code
+        self.name = name
+        self.lat = lat
+        self.lon = lon
+        self.marine_reg_name = marine_reg_name
+        self.address_a = address_a
+        self.address_b = address_b
+        self.address_c = address_c
+
+    def __repr__(self) -> str:
+        return f"LocationRecord({self.code!r}, {self.name!r}, {self.lat}, {self.lon})"
+
+def _to_float(text: str) -> Optional[float]:
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return None
+
+def iter_locations(xml_path: str) -> Iterator[LocationRecord]:
+    """XML을 스트리밍으로 읽으며 관측소 레코드를 하나씩 반환"""
+    root = None
+    fields = {}
+    for event, elem in ET.iterparse(xml_path, events=('start', 'end')):
+        if event == 'start':
+            if root is None:
+                root = elem
+            continue
+
+        if elem.tag == 'Location':
+            yield LocationRecord(
+                code=fields.get('Code', ''),
+                name=fields.get('Name', ''),
+                lat=_to_float(fields.get('Latitude')),
+                lon=_to_float(fields.get('Longitude')),
+                marine_reg_name=fields.get('marine_reg_name', ''),
+                address_a=fields.get('AddressA', ''),
+                address_b=fields.get('AddressB', ''),
+                address_c=fields.get('AddressC', ''),
+            )
+            fields = {}
+            # 이미 처리한 <Location> 요소를 루트에서 떼어내 메모리 해제
+            root.clear()
+        elif elem is not root:
+            fields[elem.tag] = (elem.text or '').strip()
+
+def _file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _cache_path(xml_path: str) -> str:
+    directory, filename = os.path.split(os.path.abspath(xml_path))
+    return os.path.join(directory, '__pycache__', f'{filename}.locations.pkl')
+
+def load_locations(xml_path: str, use_cache: bool = True) -> List[LocationRecord]:
+    """관측소 목록 로드 (캐시가 유효하면 XML을 다시 파싱하지 않음)"""
+    if not use_cache:
+        return list(iter_locations(xml_path))
+
+    cache_path = _cache_path(xml_path)
+    stat = os.stat(xml_path)
+    cache = None
+    if os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'rb') as f:
+                cache = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            cache = None
+        if cache is not None and cache.get('version') != CACHE_VERSION:
+            cache = None
+
+    if cache is not None and cache['mtime_ns'] == stat.st_mtime_ns and cache['size'] == stat.st_size:
+        return cache['records']
+
+    # mtime/크기가 다르면 내용 해시로 확인 (내용이 같으면 파싱 생략)
+    sha256 = _file_sha256(xml_path)
+    if cache is not None and cache['sha256'] == sha256:
+        records = cache['records']
+    else:
+        records = list(iter_locations(xml_path))
+
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(cache_path, 'wb') as f:
+            pickle.dump({
+                'version': CACHE_VERSION,
+                'mtime_ns': stat.st_mtime_ns,
+                'size': stat.st_size,
+                'sha256': sha256,
+                'records': records,
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        print(f"경고: 관측소 캐시를 저장할 수 없습니다: {e}")
+
+    return records
@@ -0,0 +1,234 @@
+"""
+관측소 매핑 일괄 파이프라인
+관측소 CSV(Code, Name, Latitude, Longitude, marine_reg_name, AddressA/B/C)를 한 번만 읽고
+서로 독립적인 매핑 단계를 프로세스 풀에서 동시에 실행합니다.
+
+단계 (기존 스크립트의 계산 함수를 그대로 사용)
+- medm:   해상/도시/육상 광역 중기예보 지역 (02_kma(med) 중기 예보/map_regions.py)
+          → tide-medm_reg.md (TypeScript 매핑 객체), medm_mapping.json (get-medm-weather 매핑 데이터)
+- nxny:   단기예보 격자 nx, ny (docs/03_get-kma(단기)/calculate_nxny.py)
+          → tidedata-nxny.csv, upload_tide_weather_region.json (upload_nxny_to_supabase.py와 같은 행)
+- abs:    최근접 a/b 해양관측소 (tide_abs_info/new_find_closest_station.py)
+          → tide-abs_info_ab_new.csv, upload_tide_abs_region.json (new_upload_to_supabase.py와 같은 행)
+- reg_id: 중기예보 REG_ID 지역명 매칭 (match_weather_regions_v2.py)
+          → tidedata_with_criteria.csv
+
+결과는 --output-dir(기본: mapping_output/) 아래에 저장하고 단계별 소요 시간을 출력합니다.
+Supabase 업로드는 하지 않습니다 (upload_*.json을 확인 후 기존 업로드 스크립트 사용).
+
+사용법 (프로젝트 루트에서):
+    python3 mapping_pipeline.py
+    python3 mapping_pipeline.py --stages nxny abs --output-dir /tmp/mapping
+    python3 mapping_pipeline.py --csv my_stations.csv --serial   # 같은 컬럼 형식의 다른 관측소 CSV
+"""
+
+import argparse
+import csv
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def _find_dir(pattern):
+    """한글 폴더명(NFC/NFD 혼재)을 glob으로 찾음"""
+    matches = sorted(glob.glob(os.path.join(ROOT_DIR, pattern)))
+    return matches[0] if matches else os.path.join(ROOT_DIR, pattern.rstrip('*'))
+
+MEDM_DIR = _find_dir('02_kma*')
+NXNY_DIR = _find_dir(os.path.join('docs', '03_get-kma*'))
+ABS_DIR = os.path.join(ROOT_DIR, 'tide_abs_info')
+
+for path in (ROOT_DIR, MEDM_DIR, NXNY_DIR, ABS_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+import calculate_nxny
+import map_regions
+import match_weather_regions_v2
+import medm_artifact
+import new_find_closest_station
+
+DEFAULT_STATION_CSV = os.path.join(MEDM_DIR, 'tidedata-station_info_rows.csv')
+DEFAULT_OUTPUT_DIR = os.path.join(ROOT_DIR, 'mapping_output')
+
+DEFAULT_OPTIONS = {
+    'medm_reg': os.path.join(MEDM_DIR, 'medm_reg.txt'),
+    'marine_zones': os.path.join(MEDM_DIR, map_regions.MARINE_ZONES_PATH),
+    'medm_previous': os.path.normpath(os.path.join(MEDM_DIR, map_regions.MEDM_ARTIFACT_PATH)),
+    'forecast_regions': os.path.join(ROOT_DIR, 'backup', '00_etc', 'fct_medm_reg.csv'),
+    'abs_a': os.path.join(ABS_DIR, 'abs_region_data_a.csv'),
+    'abs_b': os.path.join(ABS_DIR, 'abs_region_data_b.csv'),
+    'match_mode': 'geodesic',
+}
+
+# tide_abs_region 테이블에 없는 컬럼 / 빈 문자열을 NULL로 보내는 숫자 컬럼 (new_upload_to_supabase.py 기준)
+ABS_UPLOAD_DROP_COLUMNS = ['AddressA', 'AddressB', 'AddressC', 'marine_reg_name', 'a_거리(km)', 'b_거리(km)']
+ABS_UPLOAD_NUMERIC_COLUMNS = ['Latitude', 'Longitude', 'a_위도(LAT)', 'a_경도(LON)', 'b_위도(LAT)', 'b_경도(LON)']
+
+def _write_csv(path, fieldnames, rows, encoding='utf-8-sig'):
+    with open(path, 'w', newline='', encoding=encoding) as f:
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+        writer.writeheader()
+        writer.writerows(rows)
+
+def _write_json(path, data):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+def stage_medm(rows, options, output_dir):
+    """해상/도시/육상 광역 중기예보 지역 매핑 → tide-medm_reg.md, medm_mapping.json"""
+    city_regions, land_regions = map_regions.read_medm_reg(options['medm_reg'])
+    stations = [map_regions.station_from_row(row) for row in rows]
+    zone_index = map_regions.load_marine_zone_index(options['marine_zones'])
+    marine_mapping, temper_mapping, land_mapping = map_regions.build_mappings(
+        stations, city_regions, land_regions, zone_index)
+    map_regions.check_dropped_stations(options['medm_previous'], stations, marine_mapping, temper_mapping)
+
+    output_path = os.path.join(output_dir, 'tide-medm_reg.md')
+    map_regions.write_mapping_markdown(output_path, marine_mapping, temper_mapping, land_mapping,
+                                      city_regions, land_regions)
+    artifact = map_regions.build_medm_artifact(map_regions.read_medm_regions(options['medm_reg']),
+                                               marine_mapping, temper_mapping)
+    artifact_path = os.path.join(output_dir, 'medm_mapping.json')
+    medm_artifact.write_artifact(artifact_path, artifact)
+    zone_note = '경계 다각형 사용' if zone_index is not None else '경계 파일 없음'
+    summary = (f"해상 {len(marine_mapping)}개 / 도시 {len(temper_mapping)}개 / "
+               f"육상 {len(land_mapping)}개 지역 ({zone_note}), content_hash {artifact['content_hash']}")
+    return [output_path, artifact_path], summary
+
+def stage_nxny(rows, options, output_dir):
+    """단기예보 격자 nx, ny → tidedata-nxny.csv, upload_tide_weather_region.json"""
+    results = calculate_nxny.compute_nxny_rows(rows)
+
+    csv_path = os.path.join(output_dir, 'tidedata-nxny.csv')
+    _write_csv(csv_path, calculate_nxny.NXNY_FIELDNAMES, results)
+    payload_path = os.path.join(output_dir, 'upload_tide_weather_region.json')
+    _write_json(payload_path, [{'code': r['Code'], 'nx': r['nx'], 'ny': r['ny'], 'name': r['Name']} for r in results])
+
+    cells = len({(r['nx'], r['ny']) for r in results})
+    return [csv_path, payload_path], f"{len(results)}개 관측소 / 격자 {cells}개"
+
+def stage_abs(rows, options, output_dir):
+    """최근접 a/b 해양관측소 → tide-abs_info_ab_new.csv, upload_tide_abs_region.json"""
+    abs_stations_a = new_find_closest_station.load_abs_stations(options['abs_a'])
+    abs_stations_b = new_find_closest_station.load_abs_stations(options['abs_b'])
+    if not abs_stations_a or not abs_stations_b:
+        raise ValueError("ABS 관측소 데이터 파일 중 하나 이상을 로드할 수 없거나 비어있습니다.")
+
+    results = new_find_closest_station.merge_closest_stations(
+        [dict(row) for row in rows], abs_stations_a, abs_stations_b, options['match_mode'], 'stations')
+    fieldnames = new_find_closest_station.merged_fieldnames(list(rows[0].keys()) if rows else [])
+
+    csv_path = os.path.join(output_dir, 'tide-abs_info_ab_new.csv')
+    _write_csv(csv_path, fieldnames, results)
+
+    payload = []
+    for row in results:
+        row = {key: value for key, value in row.items() if key not in ABS_UPLOAD_DROP_COLUMNS}
+        for field in ABS_UPLOAD_NUMERIC_COLUMNS:
+            if row.get(field) == '':
+                row[field] = None
+        payload.append(row)
+    payload_path = os.path.join(output_dir, 'upload_tide_abs_region.json')
+    _write_json(payload_path, payload)
+
+    matched = sum(1 for row in results if 'a_STN ID' in row)
+    return [csv_path, payload_path], f"{matched}/{len(results)}개 관측소 a/b 매칭 ({options['match_mode']})"
+
+def stage_reg_id(rows, options, output_dir):
+    """중기예보 REG_ID 지역명 매칭 → tidedata_with_criteria.csv"""
+    forecast_regions = match_weather_regions_v2.parse_forecast_regions(options['forecast_regions'])
+    matched = [match_weather_regions_v2.match_location_row(row, forecast_regions) for row in rows]
+
+    csv_path = os.path.join(output_dir, 'tidedata_with_criteria.csv')
+    _write_csv(csv_path, match_weather_regions_v2.MATCHED_FIELDNAMES, matched, encoding='utf-8')
+
+    unmatched = sum(1 for row in matched if row['MATCH_CRITERIA'] == match_weather_regions_v2.UNMATCHED_CRITERIA)
+    return [csv_path], f"{len(matched)}개 관측소 (미매칭 {unmatched}개, REG_ID 빈 값)"
+
+STAGES = {
+    'medm': stage_medm,
+    'nxny': stage_nxny,
+    'abs': stage_abs,
+    'reg_id': stage_reg_id,
+}
+
+def run_stage(name, rows, options, output_dir):
+    """단계 하나 실행 (프로세스 풀 작업 단위) → (단계명, 소요 시간, 생성 파일, 요약 또는 오류)"""
+    start = time.perf_counter()
+    try:
+        files, summary = STAGES[name](rows, options, output_dir)
+        error = None
+    except Exception as e:
+        files, summary, error = [], '', f"{type(e).__name__}: {e}"
+    return name, time.perf_counter() - start, files, summary, error
+
+def _display_path(path):
+    """프로젝트 안 파일은 루트 기준 상대 경로로 표시"""
+    path = os.path.abspath(path)
+    return os.path.relpath(path, ROOT_DIR) if path.startswith(ROOT_DIR + os.sep) else path
+
+def read_stations(csv_path):
+    with open(csv_path, 'r', encoding='utf-8-sig') as f:
+        return list(csv.DictReader(f))
+
+def run_pipeline(csv_path, stages, output_dir, options, serial=False):
+    """관측소 CSV를 한 번 읽고 단계들을 실행, 단계별 결과 목록 반환 (stages 순서)"""
+    start = time.perf_counter()
+    rows = read_stations(csv_path)
+    load_seconds = time.perf_counter() - start
+    os.makedirs(output_dir, exist_ok=True)
+
+    if serial or len(stages) == 1:
+        results = [run_stage(name, rows, options, output_dir) for name in stages]
+    else:
+        with ProcessPoolExecutor(max_workers=min(len(stages), os.cpu_count() or 1)) as executor:
+            futures = [executor.submit(run_stage, name, rows, options, output_dir) for name in stages]
+            results = [future.result() for future in futures]
+
+    return rows, load_seconds, results, time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description='관측소 매핑 일괄 파이프라인 (medm / nxny / abs / reg_id)')
+    parser.add_argument('--csv', default=DEFAULT_STATION_CSV, help='관측소 CSV (기본값: 02_kma 중기 예보/tidedata-station_info_rows.csv)')
+    parser.add_argument('--stages', nargs='+', choices=list(STAGES), default=list(STAGES), help='실행할 단계')
+    parser.add_argument('--output-dir', default=DEFAULT_OUTPUT_DIR, help='결과 폴더 (기본값: mapping_output/)')
+    parser.add_argument('--match-mode', choices=new_find_closest_station.MATCH_MODES,
+                        default=DEFAULT_OPTIONS['match_mode'], help='abs 단계 최근접 매칭 방식')
+    parser.add_argument('--marine-zones', default=DEFAULT_OPTIONS['marine_zones'],
+                        help='medm 단계 해상 예보구역 경계 GeoJSON (없으면 marine_reg_name만 사용)')
+    parser.add_argument('--serial', action='store_true', help='프로세스 풀 없이 순서대로 실행')
+    args = parser.parse_args()
+
+    if not os.path.exists(args.csv):
+        print(f"❌ 관측소 CSV를 찾을 수 없습니다: {args.csv}")
+        sys.exit(1)
+
+    options = dict(DEFAULT_OPTIONS, match_mode=args.match_mode, marine_zones=args.marine_zones)
+    mode = '순차' if args.serial else '병렬'
+    print(f"🚀 매핑 파이프라인 ({mode}): {', '.join(args.stages)}")
+
+    rows, load_seconds, results, total_seconds = run_pipeline(args.csv, args.stages, args.output_dir, options, args.serial)
+    print(f"📥 관측소 {len(rows)}개 로드: {load_seconds:.4f}s ({os.path.basename(args.csv)})\n")
+
+    print(f"   {'단계':<8} {'시간(s)':>9}  결과")
+    failed = False
+    for name, seconds, files, summary, error in results:
+        if error:
+            failed = True
+            print(f"   {name:<8} {seconds:>9.4f}  ❌ {error}")
+            continue
+        print(f"   {name:<8} {seconds:>9.4f}  ✅ {summary}")
+        for path in files:
+            print(f"   {'':<8} {'':>9}     📄 {_display_path(path)}")
+
+    print(f"\n⏱️  전체 {total_seconds:.4f}s (단계 합계 {sum(r[1] for r in results):.4f}s)")
+    if failed:
+        sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,270 @@
+"""
+해상 중기예보구역(12A10000 등) 좌표 기반 판정
+- 예보구역 경계 다각형(GeoJSON)을 읽어 각 다각형 bounding box로 R-tree(STR 일괄 적재)를 만들고
+  좌표가 들어가는 다각형을 point-in-polygon(even-odd 규칙)으로 판정
+- marine_reg_name이 없는 관측소(예: 새로 추가한 AD_ 위치)도 좌표만으로 해상 예보구역 지정 가능
+- 일괄 판정(assign_batch)은 단일 판정과 같은 R-tree 질의(query_points)로 점별 후보 다각형을 찾고,
+  다각형별로 후보 점을 모아 NumPy로 한 번에 판정
+- 구역이 겹치는 곳은 면적이 작은 구역 우선 (예: 큰 구역 안의 세부 구역)
+
+경계 파일 형식: GeoJSON FeatureCollection
+    properties: REG_ID (필수, 예: 12A10000), REG_NAME (선택, 예: 서해북부)
+    geometry: Polygon 또는 MultiPolygon (좌표 순서 [경도, 위도])
+
+사용법:
+    python marine_zones.py --zones marine_zones.geojson --csv "02_kma(med) 중기 예보/tidedata-station_info_rows.csv"
+    (CSV의 marine_reg_name이 있는 관측소는 좌표 판정 결과와 비교)
+"""
+
+import argparse
+import csv
+import json
+import math
+import sys
+from collections import Counter
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+RTREE_NODE_CAPACITY = 8
+
+def _ring_array(ring: Sequence[Sequence[float]]) -> np.ndarray:
+    ring = np.asarray(ring, dtype=np.float64)[:, :2]
+    if len(ring) > 1 and np.array_equal(ring[0], ring[-1]):
+        ring = ring[:-1]  # GeoJSON은 첫 점을 마지막에 반복
+    return ring
+
+def points_in_ring(xs: np.ndarray, ys: np.ndarray, ring: np.ndarray) -> np.ndarray:
+    """점들이 고리(ring) 안에 있는지 (even-odd 규칙, 변마다 전체 점을 한 번에 계산)"""
+    inside = np.zeros(len(xs), dtype=bool)
+    x1, y1 = ring[:, 0], ring[:, 1]
+    x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for ax, ay, bx, by in zip(x1, y1, x2, y2):
+            crosses = (ay > ys) != (by > ys)
+            if not crosses.any():
+                continue
+            x_at = ax + (ys - ay) * (bx - ax) / (by - ay)
+            inside ^= crosses & (xs < x_at)
+    return inside
+
+def points_in_polygon(xs: np.ndarray, ys: np.ndarray, rings: List[np.ndarray]) -> np.ndarray:
+    """외곽 고리 안이고 구멍(나머지 고리) 밖인 점"""
+    inside = points_in_ring(xs, ys, rings[0])
+    for hole in rings[1:]:
+        if inside.any():
+            inside &= ~points_in_ring(xs, ys, hole)
+    return inside
+
+def point_in_polygon(x: float, y: float, rings: List[np.ndarray]) -> bool:
+    """한 점이 다각형 안에 있는지 (단일 점 판정은 변 전체를 한 번에 계산)"""
+    for i, ring in enumerate(rings):
+        x1, y1 = ring[:, 0], ring[:, 1]
+        x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+        crosses = (y1 > y) != (y2 > y)
+        x_at = x1[crosses] + (y - y1[crosses]) * (x2[crosses] - x1[crosses]) / (y2[crosses] - y1[crosses])
+        inside = np.count_nonzero(x < x_at) % 2 == 1
+        if i == 0 and not inside:
+            return False
+        if i > 0 and inside:
+            return False
+    return True
+
+def ring_area(ring: np.ndarray) -> float:
+    """고리 면적 (신발끈 공식, 경위도 제곱도 단위 - 구역 간 크기 비교용)"""
+    x, y = ring[:, 0], ring[:, 1]
+    return abs(float(np.dot(x, np.roll(y, -1)) - np.dot(y, np.roll(x, -1)))) / 2
+
+def _boxes_contain(boxes: np.ndarray, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+    """boxes[i]가 점 (xs[i], ys[i])를 포함하는지 (경계 포함)"""
+    return (boxes[:, 0] <= xs) & (xs <= boxes[:, 2]) & (boxes[:, 1] <= ys) & (ys <= boxes[:, 3])
+
+class RTree:
+    """
+    bounding box R-tree (STR: Sort-Tile-Recursive 일괄 적재, 읽기 전용)
+    bboxes: (N, 4) 배열 [min_x, min_y, max_x, max_y]
+    """
+
+    def __init__(self, bboxes: np.ndarray, node_capacity: int = RTREE_NODE_CAPACITY):
+        self.bboxes = np.asarray(bboxes, dtype=np.float64).reshape(-1, 4)
+        self.node_capacity = node_capacity
+        # levels[0]은 잎 노드(자식 = 항목 번호), 마지막이 루트 (노드 bbox, 노드별 자식 번호 배열)
+        self.levels = []
+        boxes = self.bboxes
+        while len(boxes):
+            node_boxes, children = self._pack(boxes)
+            self.levels.append((node_boxes, children))
+            if len(node_boxes) == 1:
+                break
+            boxes = node_boxes
+        # 레벨별 자식 번호 CSR (offsets, 이어 붙인 자식 번호) - query_points에서 (노드, 점) 쌍을 한 번에 펼칠 때 사용
+        self._children_csr = []
+        for _, children in self.levels:
+            offsets = np.concatenate(([0], np.cumsum([len(c) for c in children]))).astype(np.int64)
+            self._children_csr.append((offsets, np.concatenate(children).astype(np.int64)))
+
+    def _pack(self, boxes: np.ndarray):
+        capacity = self.node_capacity
+        n_nodes = math.ceil(len(boxes) / capacity)
+        slice_size = capacity * math.ceil(math.sqrt(n_nodes))
+        centers = (boxes[:, :2] + boxes[:, 2:]) / 2
+
+        children = []
+        by_x = np.argsort(centers[:, 0], kind='stable')
+        for start in range(0, len(boxes), slice_size):
+            tile = by_x[start:start + slice_size]
+            tile = tile[np.argsort(centers[tile, 1], kind='stable')]
+            children.extend(tile[i:i + capacity] for i in range(0, len(tile), capacity))
+
+        node_boxes = np.array([[boxes[c, 0].min(), boxes[c, 1].min(), boxes[c, 2].max(), boxes[c, 3].max()]
+                               for c in children])
+        return node_boxes, children
+
+    def __len__(self) -> int:
+        return len(self.bboxes)
+
+    def query_points(self, xs: np.ndarray, ys: np.ndarray):
+        """
+        점들을 포함하는 bbox의 (점 번호 배열, 항목 번호 배열) 쌍 (순서는 정하지 않음)
+        루트부터 레벨마다 (노드, 점) 쌍 중 노드 bbox에 드는 것만 남기고 자식으로 펼침
+        """
+        xs, ys = np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64)
+        if not self.levels or not len(xs):
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+
+        points = np.arange(len(xs), dtype=np.int64)
+        nodes = np.zeros(len(xs), dtype=np.int64)
+        for level in range(len(self.levels) - 1, -1, -1):
+            node_boxes, children = self.levels[level]
+            keep = _boxes_contain(node_boxes[nodes], xs[points], ys[points])
+            points, nodes = points[keep], nodes[keep]
+            offsets, flat = self._children_csr[level]
+            counts = offsets[nodes + 1] - offsets[nodes]
+            starts = np.repeat(offsets[nodes] - np.cumsum(counts) + counts, counts)
+            nodes = flat[starts + np.arange(counts.sum())]
+            points = np.repeat(points, counts)
+
+        keep = _boxes_contain(self.bboxes[nodes], xs[points], ys[points])
+        return points[keep], nodes[keep]
+
+    def query_point(self, x: float, y: float) -> List[int]:
+        """점 (x, y)를 포함하는 bbox의 항목 번호 (오름차순)"""
+        return sorted(self.query_points(np.array([x]), np.array([y]))[1].tolist())
+
+class MarineZoneIndex:
+    """해상 예보구역 다각형 색인 (구역: {'REG_ID', 'REG_NAME', 'polygons': [[외곽 고리, 구멍...], ...]})"""
+
+    def __init__(self, zones: Sequence[Dict]):
+        self.zones = list(zones)
+        self.parts = []  # (구역 번호, 고리 목록)
+        for zone_id, zone in enumerate(self.zones):
+            for polygon in zone['polygons']:
+                self.parts.append((zone_id, [_ring_array(ring) for ring in polygon]))
+
+        self.areas = np.zeros(len(self.zones))
+        for zone_id, rings in self.parts:
+            self.areas[zone_id] += ring_area(rings[0]) - sum(ring_area(hole) for hole in rings[1:])
+
+        bboxes = np.array([[rings[0][:, 0].min(), rings[0][:, 1].min(), rings[0][:, 0].max(), rings[0][:, 1].max()]
+                           for _, rings in self.parts]).reshape(-1, 4)
+        self.tree = RTree(bboxes)
+
+    def __len__(self) -> int:
+        return len(self.zones)
+
+    def zone_ids_at(self, lat: float, lon: float) -> List[int]:
+        """좌표를 포함하는 구역 번호 (면적이 작은 순)"""
+        hits = {self.parts[part][0] for part in self.tree.query_point(lon, lat)
+                if point_in_polygon(lon, lat, self.parts[part][1])}
+        return sorted(hits, key=lambda zone_id: (self.areas[zone_id], zone_id))
+
+    def assign(self, lat: float, lon: float) -> Optional[Dict]:
+        """좌표가 속한 해상 예보구역 (겹치면 면적이 작은 구역, 없으면 None)"""
+        zone_ids = self.zone_ids_at(lat, lon)
+        return self.zones[zone_ids[0]] if zone_ids else None
+
+    def assign_batch(self, lats: Sequence[float], lons: Sequence[float]) -> np.ndarray:
+        """여러 좌표의 구역 번호 배열 (구역 밖이면 -1)"""
+        ys = np.asarray(lats, dtype=np.float64)
+        xs = np.asarray(lons, dtype=np.float64)
+        result = np.full(len(xs), -1, dtype=np.int64)
+        best_area = np.full(len(xs), np.inf)
+
+        # (점, 다각형) 후보 쌍: 단일 판정(zone_ids_at)과 같은 R-tree 질의를 전체 점에 한 번에
+        point_of, part_of = self.tree.query_points(xs, ys)
+        if not len(part_of):
+            return result
+
+        order = np.argsort(part_of, kind='stable')
+        point_of, part_of = point_of[order], part_of[order]
+        groups = np.flatnonzero(np.diff(part_of)) + 1
+        for candidates, part in zip(np.split(point_of, groups), part_of[np.concatenate(([0], groups))]):
+            zone_id, rings = self.parts[part]
+            inside = candidates[points_in_polygon(xs[candidates], ys[candidates], rings)]
+            area = self.areas[zone_id]
+            better = inside[(area < best_area[inside]) | ((area == best_area[inside]) & (zone_id < result[inside]))]
+            result[better] = zone_id
+            best_area[better] = area
+        return result
+
+def load_marine_zones(path: str) -> MarineZoneIndex:
+    """GeoJSON 경계 파일에서 해상 예보구역 색인 생성 (같은 REG_ID의 다각형은 한 구역으로 합침)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+
+    zones = {}
+    for feature in data.get('features', []):
+        properties = feature.get('properties') or {}
+        geometry = feature.get('geometry') or {}
+        reg_id = properties.get('REG_ID')
+        if not reg_id:
+            raise ValueError(f"REG_ID가 없는 구역이 있습니다: {properties}")
+
+        if geometry.get('type') == 'Polygon':
+            polygons = [geometry['coordinates']]
+        elif geometry.get('type') == 'MultiPolygon':
+            polygons = geometry['coordinates']
+        else:
+            raise ValueError(f"지원하지 않는 geometry 형식: {reg_id} {geometry.get('type')}")
+
+        zone = zones.setdefault(reg_id, {'REG_ID': reg_id, 'REG_NAME': properties.get('REG_NAME', ''), 'polygons': []})
+        zone['polygons'].extend(polygons)
+    return MarineZoneIndex(list(zones.values()))
+
+def main():
+    parser = argparse.ArgumentParser(description='좌표 기반 해상 중기예보구역 판정')
+    parser.add_argument('--zones', required=True, help='해상 예보구역 경계 GeoJSON')
+    parser.add_argument('--csv', required=True, help='관측소 CSV (Code, Latitude, Longitude, marine_reg_name)')
+    args = parser.parse_args()
+
+    try:
+        index = load_marine_zones(args.zones)
+    except FileNotFoundError:
+        print(f"❌ 경계 파일을 찾을 수 없습니다: {args.zones}")
+        sys.exit(1)
+    print(f"🗺️  해상 예보구역 {len(index)}개 (다각형 {len(index.parts)}개)")
+
+    with open(args.csv, 'r', encoding='utf-8-sig') as f:
+        stations = [row for row in csv.DictReader(f) if row.get('Latitude') and row.get('Longitude')]
+
+    zone_ids = index.assign_batch([float(s['Latitude']) for s in stations], [float(s['Longitude']) for s in stations])
+    counts = Counter()
+    for station, zone_id in zip(stations, zone_ids):
+        zone = index.zones[zone_id] if zone_id >= 0 else None
+        label = station.get('marine_reg_name', '')
+        if zone is None:
+            counts['구역 밖'] += 1
+            print(f"   ⚠️  {station['Code']} {station['Name']}: 구역 밖")
+        elif not label:
+            counts['라벨 없음'] += 1
+            print(f"   ➕ {station['Code']} {station['Name']}: {zone['REG_ID']} {zone['REG_NAME']}")
+        elif label == zone['REG_NAME']:
+            counts['일치'] += 1
+        else:
+            counts['불일치'] += 1
+            print(f"   ❗ {station['Code']} {station['Name']}: 라벨 {label} / 좌표 {zone['REG_ID']} {zone['REG_NAME']}")
+
+    print(f"✅ 관측소 {len(stations)}개: " + ', '.join(f"{key} {value}개" for key, value in counts.items()))
+
+if __name__ == '__main__':
+    main()
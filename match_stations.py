@@ -1,56 +1,48 @@
 """
 조석관측소와 해양관측소 매칭 스크립트
 - 입력: locations_with_addresses.xml, a지점 CSV, b지점 CSV
-- 출력: 조석관측소별 가까운 해양관측소 10개 매칭 JSON
+- 출력: 조석관측소별 가까운 해양관측소 10개 매칭 JSON,
+        해양관측소별 조석관측소 역방향 인덱스 JSON
 """
 
-import xml.etree.ElementTree as ET
+import argparse
 import csv
+import hashlib
 import json
 import math
-from typing import Dict, List, Tuple
+import os
+from typing import Dict, List, Optional, Tuple
 
-def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
-    """
-    두 지점 간의 거리를 계산 (단위: km)
-    Haversine formula 사용
-    """
-    R = 6371  # 지구 반지름 (km)
+import numpy as np
 
-    # 라디안으로 변환
-    lat1_rad = math.radians(lat1)
-    lat2_rad = math.radians(lat2)
-    delta_lat = math.radians(lat2 - lat1)
-    delta_lon = math.radians(lon2 - lon1)
+from abs_availability_store import DEFAULT_DAYS, DEFAULT_MIN_RATIO, AvailabilityStore
+from geodesy import haversine_matrix
+from location_loader import load_locations
+from station_index import StationIndex
 
-    # Haversine formula
-    a = math.sin(delta_lat/2)**2 + math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon/2)**2
-    c = 2 * math.asin(math.sqrt(a))
+# 관측 항목별 비트 (tide_abs_region 개별 관측 컬럼 wt_/swh_/at_/wd_/ws_ 순서)
+OBS_VARIABLES = ('wt', 'swh', 'at', 'wd', 'ws')
+OBS_BITS = {var: 1 << i for i, var in enumerate(OBS_VARIABLES)}
+A_STATION_MASK = OBS_BITS['wt'] | OBS_BITS['swh']                    # a지점: 수온, 파고
+B_STATION_MASK = OBS_BITS['at'] | OBS_BITS['wd'] | OBS_BITS['ws']    # b지점: 기온, 풍향, 풍속
+OBS_COLUMNS = {'wt': 'TW', 'swh': 'WH', 'at': 'TA', 'wd': 'WD', 'ws': 'WS'}  # 관측 항목 → ABS 컬럼
 
-    return R * c
+def provides_from_mask(mask: int) -> List[str]:
+    """비트마스크를 관측 항목 목록으로 변환"""
+    return [var for var in OBS_VARIABLES if mask & OBS_BITS[var]]
 
 def load_tide_stations(xml_path: str) -> List[Dict]:
-    """조석관측소 목록 로드"""
-    tree = ET.parse(xml_path)
-    root = tree.getroot()
-
-    stations = []
-    for location in root.findall('Location'):
-        code = location.find('Code').text
-        name = location.find('Name').text
-        lat = float(location.find('Latitude').text)
-        lon = float(location.find('Longitude').text)
-        marine_reg = location.find('marine_reg_name').text
-
-        stations.append({
-            'code': code,
-            'name': name,
-            'lat': lat,
-            'lon': lon,
-            'marine_reg_name': marine_reg
-        })
-
-    return stations
+    """조석관측소 목록 로드 (location_loader 스트리밍 파싱 + 캐시)"""
+    return [
+        {
+            'code': location.code,
+            'name': location.name,
+            'lat': location.lat,
+            'lon': location.lon,
+            'marine_reg_name': location.marine_reg_name
+        }
+        for location in load_locations(xml_path)
+    ]
 
 def load_marine_stations(a_csv_path: str, b_csv_path: str) -> Dict[str, Dict]:
     """해양관측소 목록 로드 (중복 제거)"""
@@ -67,9 +59,9 @@ def load_marine_stations(a_csv_path: str, b_csv_path: str) -> Dict[str, Dict]:
                     'name': row['a_지역명(한글)'],
                     'lat': float(row['a_위도(LAT)']),
                     'lon': float(row['a_경도(LON)']),
-                    'provides': []
+                    'provides_mask': 0
                 }
-            marine_stations[station_id]['provides'].extend(['wt', 'swh'])  # 수온, 파고
+            marine_stations[station_id]['provides_mask'] |= A_STATION_MASK
 
     # b지점 (기온, 풍향, 풍속) 로드
     with open(b_csv_path, 'r', encoding='utf-8-sig') as f:
@@ -82,81 +74,490 @@ def load_marine_stations(a_csv_path: str, b_csv_path: str) -> Dict[str, Dict]:
                     'name': row['b_지역명(한글)'],
                     'lat': float(row['b_위도(LAT)']),
                     'lon': float(row['b_경도(LON)']),
-                    'provides': []
+                    'provides_mask': 0
                 }
-            marine_stations[station_id]['provides'].extend(['at', 'wd', 'ws'])  # 기온, 풍향, 풍속
+            marine_stations[station_id]['provides_mask'] |= B_STATION_MASK
 
-    # 중복 제거
+    # 출력용 제공 항목 목록 (비트 순서 고정)
     for station_id, station in marine_stations.items():
-        station['provides'] = list(set(station['provides']))
+        station['provides'] = provides_from_mask(station['provides_mask'])
+
+    return marine_stations
 
+def load_marine_stations_from_store(store_path: str, min_ratio: float = DEFAULT_MIN_RATIO,
+                                    days: float = DEFAULT_DAYS) -> Dict[str, Dict]:
+    """
+    제공률 저장소(abs_availability_store.py) 기준 해양관측소 목록
+    최근 days일 제공률이 min_ratio 이상인 항목만 제공으로 보고, 제공 항목이 없는 관측소는 제외
+    """
+    store = AvailabilityStore.load(store_path)
+    hours = int(days * 24)
+    masks = np.zeros(len(store), dtype=np.int64)
+    for var in OBS_VARIABLES:
+        masks[store.providing([OBS_COLUMNS[var]], min_ratio, hours)] |= OBS_BITS[var]
+
+    marine_stations = {}
+    for s in np.flatnonzero(masks):
+        station_id = store.station_ids[s]
+        name, lat, lon, _ = store.info[station_id]
+        marine_stations[station_id] = {
+            'station_id': station_id,
+            'name': name,
+            'lat': lat,
+            'lon': lon,
+            'provides_mask': int(masks[s]),
+            'provides': provides_from_mask(int(masks[s]))
+        }
     return marine_stations
 
-def match_stations(tide_stations: List[Dict], marine_stations: Dict[str, Dict], top_n: int = 10) -> Dict:
+def top_k_indices(distances: np.ndarray, k: int) -> np.ndarray:
+    """
+    거리 행렬의 각 행에서 가장 가까운 k개 열 인덱스를 거리순으로 반환
+    argpartition으로 후보 k개만 추린 뒤 그 안에서만 정렬
+    (동일 거리는 원래 순서 유지 - 기존 sort()와 같은 결과)
+    """
+    n_cols = distances.shape[1]
+    k = min(k, n_cols)
+    if k <= 0:
+        return np.empty((distances.shape[0], 0), dtype=np.intp)
+
+    if k < n_cols:
+        candidates = np.argpartition(distances, k - 1, axis=1)[:, :k]
+    else:
+        candidates = np.broadcast_to(np.arange(n_cols), distances.shape).copy()
+
+    candidate_dist = np.round(np.take_along_axis(distances, candidates, axis=1), 2)
+    order = np.lexsort((candidates, candidate_dist), axis=1)
+    return np.take_along_axis(candidates, order, axis=1)
+
+def match_stations(tide_stations: List[Dict], marine_stations: Dict[str, Dict], top_n: int = 10,
+                   engine: str = 'index') -> Dict:
     """
     각 조석관측소별 가까운 해양관측소 top_n개 매칭
+    engine:
+      - 'index': 해양관측소 KD-tree(StationIndex)로 조석관측소별 top_n 검색 (기본값)
+      - 'matrix': 조석 × 해양 거리 행렬을 한 번에 계산한 뒤 행별 top_n 선택
     """
     matching_result = {}
+    if not tide_stations:
+        return matching_result
+
+    marine_ids = list(marine_stations.keys())
+    marine_list = [marine_stations[marine_id] for marine_id in marine_ids]
+    tide_lats = [s['lat'] for s in tide_stations]
+    tide_lons = [s['lon'] for s in tide_stations]
+
+    if engine == 'index':
+        nearest, nearest_distances = StationIndex(marine_list).nearest_batch(tide_lats, tide_lons, top_n)
+    elif engine == 'matrix':
+        distances = haversine_matrix(
+            tide_lats, tide_lons,
+            [m['lat'] for m in marine_list], [m['lon'] for m in marine_list]
+        )
+        nearest = top_k_indices(distances, top_n)
+        nearest_distances = np.take_along_axis(distances, nearest, axis=1)
+    else:
+        raise ValueError(f"알 수 없는 engine: {engine}")
+
+    for row, tide_station in enumerate(tide_stations):
+        matching_result[tide_station['code']] = build_matching_entry(
+            tide_station, marine_ids, marine_list, nearest[row], nearest_distances[row]
+        )
+
+    return matching_result
+
+def build_matching_entry(tide_station: Dict, marine_ids: List[str], marine_list: List[Dict],
+                         cols: np.ndarray, distances: np.ndarray) -> Dict:
+    """조석관측소 1개의 매칭 결과 항목 생성 (station_matching_top10.json 형식)"""
+    nearest_marine_stations = []
+    for col, distance in zip(cols, distances):
+        marine_station = marine_list[col]
+        nearest_marine_stations.append({
+            'station_id': marine_ids[col],
+            'name': marine_station['name'],
+            'distance_km': round(float(distance), 2),
+            'lat': marine_station['lat'],
+            'lon': marine_station['lon'],
+            'provides': marine_station['provides']
+        })
 
+    return {
+        'tide_station_name': tide_station['name'],
+        'tide_station_lat': tide_station['lat'],
+        'tide_station_lon': tide_station['lon'],
+        'marine_reg_name': tide_station['marine_reg_name'],
+        'nearest_marine_stations': nearest_marine_stations
+    }
+
+def match_stations_per_variable(tide_stations: List[Dict], marine_stations: Dict[str, Dict]) -> Dict[str, Dict]:
+    """
+    관측 항목(wt, swh, at, wd, ws)별로 해당 항목을 실제 제공하는 가장 가까운 해양관측소 매칭
+    항목별로 provides_mask 비트가 켜진 관측소만 모아 StationIndex를 따로 구성
+    반환값: {조석관측소 코드: {항목: (해양관측소 dict, 거리 km) 또는 None}}
+    """
+    marine_list = list(marine_stations.values())
+    masks = np.array([m['provides_mask'] for m in marine_list], dtype=np.int64)
+    tide_lats = [s['lat'] for s in tide_stations]
+    tide_lons = [s['lon'] for s in tide_stations]
+
+    result = {s['code']: {} for s in tide_stations}
+    for var in OBS_VARIABLES:
+        providers = [marine_list[i] for i in np.flatnonzero(masks & OBS_BITS[var])]
+        index = StationIndex(providers)
+        nearest, distances = index.nearest_batch(tide_lats, tide_lons, 1)
+        for row, tide_station in enumerate(tide_stations):
+            if nearest.shape[1]:
+                result[tide_station['code']][var] = (providers[nearest[row, 0]], float(distances[row, 0]))
+            else:
+                result[tide_station['code']][var] = None
+
+    return result
+
+def per_variable_rows(tide_stations: List[Dict], per_variable: Dict[str, Dict]) -> List[Dict]:
+    """항목별 매칭 결과를 tide_abs_region 개별 관측 컬럼(wt_STN_ID 등) 형식의 행으로 변환"""
+    rows = []
     for tide_station in tide_stations:
-        tide_code = tide_station['code']
-        tide_lat = tide_station['lat']
-        tide_lon = tide_station['lon']
-
-        # 모든 해양관측소와의 거리 계산
-        distances = []
-        for marine_id, marine_station in marine_stations.items():
-            distance = haversine_distance(
-                tide_lat, tide_lon,
-                marine_station['lat'], marine_station['lon']
+        row = {
+            'Code': tide_station['code'],
+            'Name': tide_station['name'],
+            'Latitude': tide_station['lat'],
+            'Longitude': tide_station['lon'],
+        }
+        for var in OBS_VARIABLES:
+            match = per_variable[tide_station['code']][var]
+            marine_station = match[0] if match else {}
+            row[f'{var}_STN_ID'] = marine_station.get('station_id')
+            row[f'{var}_위도(LAT)'] = marine_station.get('lat')
+            row[f'{var}_경도(LON)'] = marine_station.get('lon')
+            row[f'{var}_지역명(한글)'] = marine_station.get('name')
+        rows.append(row)
+    return rows
+
+PER_VARIABLE_FIELDNAMES = ['Code', 'Name', 'Latitude', 'Longitude'] + [
+    f'{var}_{col}' for var in OBS_VARIABLES for col in ('STN_ID', '위도(LAT)', '경도(LON)', '지역명(한글)')
+]
+
+# ---------------------------------------------------------------------------
+# 증분 매칭
+# - 입력 파일(XML, a/b CSV)의 내용 해시와 직전 매칭 결과를 캐시에 저장
+# - 해양관측소가 추가/삭제된 경우, 그 관측소가 현재 k번째 거리 안쪽에 들어오는
+#   (또는 현재 목록에 있던 관측소가 빠진) 조석관측소만 다시 계산
+# ---------------------------------------------------------------------------
+
+CACHE_VERSION = 1
+
+def file_sha256(path: str) -> str:
+    """파일 내용의 SHA-256 해시"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def load_matching_cache(cache_path: str) -> Optional[Dict]:
+    """매칭 캐시 로드 (없거나 버전이 다르면 None)"""
+    if not os.path.exists(cache_path):
+        return None
+    with open(cache_path, 'r', encoding='utf-8') as f:
+        cache = json.load(f)
+    if cache.get('version') != CACHE_VERSION:
+        return None
+    return cache
+
+def save_matching_cache(cache_path: str, input_hashes: Dict[str, str], top_n: int,
+                        tide_stations: List[Dict], marine_stations: Dict[str, Dict], matching_result: Dict):
+    """매칭 캐시 저장"""
+    cache = {
+        'version': CACHE_VERSION,
+        'input_hashes': input_hashes,
+        'top_n': top_n,
+        'tide_stations': {s['code']: s for s in tide_stations},
+        'marine_stations': marine_stations,
+        'matching_result': matching_result,
+    }
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, ensure_ascii=False)
+
+def _station_moved(old: Dict, new: Dict) -> bool:
+    return old['lat'] != new['lat'] or old['lon'] != new['lon']
+
+def match_stations_incremental(tide_stations: List[Dict], marine_stations: Dict[str, Dict],
+                               cache: Optional[Dict], top_n: int = 10) -> Tuple[Dict, List[str]]:
+    """
+    캐시된 직전 결과를 기준으로 영향받는 조석관측소만 다시 매칭
+    반환값: (전체 매칭 결과, 다시 계산한 조석관측소 코드 목록)
+    캐시가 없거나 top_n이 다르면 전체 재계산
+    """
+    if cache is None or cache['top_n'] != top_n:
+        return match_stations(tide_stations, marine_stations, top_n), [s['code'] for s in tide_stations]
+
+    old_tide = cache['tide_stations']
+    old_marine = cache['marine_stations']
+    old_result = cache['matching_result']
+
+    # 해양관측소 변경 분류: 위치가 바뀐 관측소는 삭제 후 추가로 취급
+    removed_ids = {mid for mid, m in old_marine.items()
+                   if mid not in marine_stations or _station_moved(m, marine_stations[mid])}
+    added_ids = [mid for mid, m in marine_stations.items()
+                 if mid not in old_marine or _station_moved(old_marine[mid], m)]
+    updated_ids = {mid for mid, m in marine_stations.items()
+                   if mid in old_marine and mid not in removed_ids
+                   and (old_marine[mid]['name'] != m['name'] or old_marine[mid]['provides'] != m['provides'])}
+
+    # 새로 추가되었거나 위치가 바뀐 조석관측소는 무조건 재계산
+    recompute = {s['code'] for s in tide_stations
+                 if s['code'] not in old_result or _station_moved(old_tide[s['code']], s)}
+
+    kept = [s for s in tide_stations if s['code'] not in recompute]
+    if kept and (removed_ids or added_ids):
+        if added_ids:
+            added_distances = haversine_matrix(
+                [s['lat'] for s in kept], [s['lon'] for s in kept],
+                [marine_stations[mid]['lat'] for mid in added_ids],
+                [marine_stations[mid]['lon'] for mid in added_ids]
             )
-            distances.append({
-                'station_id': marine_id,
-                'name': marine_station['name'],
-                'distance_km': round(distance, 2),
-                'lat': marine_station['lat'],
-                'lon': marine_station['lon'],
-                'provides': marine_station['provides']
+        for row, tide_station in enumerate(kept):
+            nearest = old_result[tide_station['code']]['nearest_marine_stations']
+            if any(m['station_id'] in removed_ids for m in nearest):
+                recompute.add(tide_station['code'])
+            elif added_ids:
+                # 목록이 덜 찼거나, 추가된 관측소가 현재 k번째 거리 안쪽이면 이웃이 바뀔 수 있음
+                kth_distance = nearest[-1]['distance_km'] if len(nearest) >= top_n else math.inf
+                if np.round(added_distances[row].min(), 2) <= kth_distance:
+                    recompute.add(tide_station['code'])
+
+    marine_ids = list(marine_stations.keys())
+    marine_list = [marine_stations[mid] for mid in marine_ids]
+    targets = [s for s in tide_stations if s['code'] in recompute]
+    if targets:
+        nearest, nearest_distances = StationIndex(marine_list).nearest_batch(
+            [s['lat'] for s in targets], [s['lon'] for s in targets], top_n
+        )
+        recomputed = {
+            s['code']: build_matching_entry(s, marine_ids, marine_list, nearest[row], nearest_distances[row])
+            for row, s in enumerate(targets)
+        }
+    else:
+        recomputed = {}
+
+    matching_result = {}
+    for tide_station in tide_stations:
+        code = tide_station['code']
+        if code in recomputed:
+            matching_result[code] = recomputed[code]
+            continue
+
+        # 이웃은 그대로이고 이름/제공 정보만 바뀐 관측소는 값만 갱신
+        entry = dict(old_result[code])
+        entry['tide_station_name'] = tide_station['name']
+        entry['marine_reg_name'] = tide_station['marine_reg_name']
+        entry['nearest_marine_stations'] = [
+            dict(m, name=marine_stations[m['station_id']]['name'], provides=marine_stations[m['station_id']]['provides'])
+            if m['station_id'] in updated_ids else m
+            for m in old_result[code]['nearest_marine_stations']
+        ]
+        matching_result[code] = entry
+
+    return matching_result, [s['code'] for s in targets]
+
+def diff_matching_results(old_result: Dict, new_result: Dict) -> Dict:
+    """
+    두 매칭 결과의 차이 보고서
+    - changed: 해양관측소 목록(순서 포함)이 바뀐 조석관측소
+      (nearest_changed가 true이면 최근접 관측소가 바뀌어 tide_abs_region 재업로드 필요)
+    - added / removed: 새로 생기거나 사라진 조석관측소 코드
+    """
+    changed = []
+    for code, entry in new_result.items():
+        if code not in old_result:
+            continue
+        before = [m['station_id'] for m in old_result[code]['nearest_marine_stations']]
+        after = [m['station_id'] for m in entry['nearest_marine_stations']]
+        if before != after:
+            changed.append({
+                'code': code,
+                'tide_station_name': entry['tide_station_name'],
+                'nearest_changed': before[:1] != after[:1],
+                'before': before,
+                'after': after,
+                'added': [mid for mid in after if mid not in before],
+                'removed': [mid for mid in before if mid not in after],
             })
 
-        # 거리순 정렬
-        distances.sort(key=lambda x: x['distance_km'])
+    return {
+        'changed': changed,
+        'added': [code for code in new_result if code not in old_result],
+        'removed': [code for code in old_result if code not in new_result],
+    }
+
+# ---------------------------------------------------------------------------
+# 역방향 인덱스 (해양관측소 → 조석관측소)
+# - ranked: 전체 조석관측소를 거리순으로 정렬한 [code, distance_km] 목록
+# - serves: 정방향 매칭(top_n)에서 이 해양관측소를 후보로 갖는 조석관측소 {code: 순위(1부터)}
+# 새 ABS 관측 자료가 들어온 해양관측소 ID로 serves를 바로 조회해
+# 캐시된 응답을 무효화할 조석관측소(location code)를 찾음
+# ---------------------------------------------------------------------------
+
+def build_reverse_index(tide_stations: List[Dict], marine_stations: Dict[str, Dict],
+                        matching_result: Dict) -> Dict[str, Dict]:
+    """해양관측소 station_id별 역방향 인덱스 생성 (station_matching_reverse.json 형식)"""
+    reverse_index = {}
+    if not marine_stations:
+        return reverse_index
+
+    marine_ids = list(marine_stations.keys())
+    nearest, distances = StationIndex(tide_stations).nearest_batch(
+        [marine_stations[mid]['lat'] for mid in marine_ids],
+        [marine_stations[mid]['lon'] for mid in marine_ids],
+        len(tide_stations)
+    )
 
-        # 상위 top_n개 선택
-        matching_result[tide_code] = {
-            'tide_station_name': tide_station['name'],
-            'tide_station_lat': tide_lat,
-            'tide_station_lon': tide_lon,
-            'marine_reg_name': tide_station['marine_reg_name'],
-            'nearest_marine_stations': distances[:top_n]
+    for row, marine_id in enumerate(marine_ids):
+        reverse_index[marine_id] = {
+            'name': marine_stations[marine_id]['name'],
+            'lat': marine_stations[marine_id]['lat'],
+            'lon': marine_stations[marine_id]['lon'],
+            'serves': {},
+            'ranked': [[tide_stations[col]['code'], round(float(distance), 2)]
+                       for col, distance in zip(nearest[row], distances[row])],
         }
 
-    return matching_result
+    for code, entry in matching_result.items():
+        for rank, marine in enumerate(entry['nearest_marine_stations'], 1):
+            if marine['station_id'] in reverse_index:
+                reverse_index[marine['station_id']]['serves'][code] = rank
+
+    return reverse_index
+
+def load_reverse_index(reverse_path: str) -> Optional[Dict[str, Dict]]:
+    """역방향 인덱스 로드 (없으면 None)"""
+    if not os.path.exists(reverse_path):
+        return None
+    with open(reverse_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def locations_to_invalidate(reverse_index: Dict[str, Dict], station_ids: List[str],
+                            max_rank: Optional[int] = None) -> List[str]:
+    """
+    새 관측 자료가 들어온 해양관측소 ID 목록 → 캐시 무효화 대상 조석관측소 코드 목록
+    max_rank: 지정하면 해당 순위 이내로 매칭된 조석관측소만 포함 (예: 1이면 최근접으로 쓰는 곳만)
+    """
+    codes = set()
+    for station_id in station_ids:
+        entry = reverse_index.get(str(station_id))
+        if entry is None:
+            continue
+        codes.update(code for code, rank in entry['serves'].items() if max_rank is None or rank <= max_rank)
+    return sorted(codes)
 
 def main():
+    parser = argparse.ArgumentParser(description='조석관측소 - 해양관측소 top10 매칭')
+    parser.add_argument('--incremental', action='store_true',
+                        help='직전 실행 캐시를 기준으로 영향받는 조석관측소만 다시 계산하고 변경 보고서 생성')
+    parser.add_argument('--per-variable', action='store_true',
+                        help='관측 항목별 최근접 관측소 매칭 결과(tide_abs_region 개별 관측 컬럼)도 CSV로 저장')
+    parser.add_argument('--invalidate', nargs='+', metavar='STN_ID',
+                        help='저장된 역방향 인덱스로 해당 해양관측소의 새 관측 자료에 영향받는 조석관측소만 출력')
+    parser.add_argument('--max-rank', type=int, default=None,
+                        help='--invalidate 시 이 순위 이내로 매칭된 조석관측소만 포함')
+    parser.add_argument('--availability-store', metavar='NPZ',
+                        help='a지점/b지점 CSV 대신 제공률 저장소(abs_availability_store.py)에서 해양관측소 선택')
+    parser.add_argument('--min-ratio', type=float, default=DEFAULT_MIN_RATIO,
+                        help='--availability-store 사용 시 항목별 최소 제공률')
+    parser.add_argument('--days', type=float, default=DEFAULT_DAYS,
+                        help='--availability-store 사용 시 제공률 계산 기간(일)')
+    args = parser.parse_args()
+
     # 파일 경로
     xml_path = 'tide_abs_info/locations_with_addresses.xml'
     a_csv_path = 'tide_abs_info/a지점_파고수온제공_2026-01-10_2026-01-17.csv'
     b_csv_path = 'tide_abs_info/b지점_기온풍향풍속제공_2026-01-10_2026-01-17.csv'
     output_path = 'tide_abs_info/station_matching_top10.json'
+    cache_path = 'tide_abs_info/station_matching_cache.json'
+    diff_path = 'tide_abs_info/station_matching_diff.json'
+    per_variable_path = 'tide_abs_info/tide_abs_region_individual_obs.csv'
+    reverse_path = 'tide_abs_info/station_matching_reverse.json'
+    top_n = 10
+
+    if args.invalidate:
+        reverse_index = load_reverse_index(reverse_path)
+        if reverse_index is None:
+            print(f"❌ 역방향 인덱스가 없습니다: {reverse_path} (먼저 매칭을 실행하세요)")
+            return
+        unknown = [stn_id for stn_id in args.invalidate if stn_id not in reverse_index]
+        if unknown:
+            print(f"⚠️ 역방향 인덱스에 없는 해양관측소: {', '.join(unknown)}")
+        codes = locations_to_invalidate(reverse_index, args.invalidate, args.max_rank)
+        print(f"🗑️ 캐시 무효화 대상 조석관측소 {len(codes)}개: {', '.join(codes) if codes else '없음'}")
+        return
+
+    marine_paths = (args.availability_store,) if args.availability_store else (a_csv_path, b_csv_path)
+    input_hashes = {path: file_sha256(path) for path in (xml_path,) + marine_paths}
+    if args.availability_store:
+        input_hashes['availability_query'] = f"min_ratio={args.min_ratio},days={args.days}"
+    cache = load_matching_cache(cache_path) if args.incremental else None
+
+    unchanged = cache is not None and cache['input_hashes'] == input_hashes and cache['top_n'] == top_n
+    if unchanged:
+        # 매칭만 건너뛰고 역방향 인덱스 / 항목별 매칭은 캐시된 결과로 다시 생성
+        print("✅ 입력 파일 변경 없음 - 캐시된 매칭 결과를 그대로 사용합니다.")
+        tide_stations = list(cache['tide_stations'].values())
+        marine_stations = cache['marine_stations']
+        matching_result = cache['matching_result']
+    else:
+        print("📍 조석관측소 로딩 중...")
+        tide_stations = load_tide_stations(xml_path)
+        print(f"   ✅ {len(tide_stations)}개 조석관측소 로드 완료")
+
+        print("\n🌊 해양관측소 로딩 중...")
+        if args.availability_store:
+            marine_stations = load_marine_stations_from_store(args.availability_store, args.min_ratio, args.days)
+            print(f"   (제공률 저장소 {args.availability_store}, 최근 {args.days:g}일 {args.min_ratio:.0%} 이상 항목)")
+        else:
+            marine_stations = load_marine_stations(a_csv_path, b_csv_path)
+        print(f"   ✅ {len(marine_stations)}개 해양관측소 로드 완료 (중복 제거)")
+
+        print("\n🔗 거리 계산 및 매칭 수행 중...")
+        if args.incremental:
+            matching_result, recomputed = match_stations_incremental(tide_stations, marine_stations, cache, top_n=top_n)
+            print(f"   ✅ {len(matching_result)}개 조석관측소 중 {len(recomputed)}개 재계산")
+        else:
+            matching_result = match_stations(tide_stations, marine_stations, top_n=top_n)
+            print(f"   ✅ {len(matching_result)}개 조석관측소 매칭 완료")
+
+        # JSON 파일로 저장
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(matching_result, f, ensure_ascii=False, indent=2)
+
+        print(f"\n💾 결과 저장: {output_path}")
 
-    print("📍 조석관측소 로딩 중...")
-    tide_stations = load_tide_stations(xml_path)
-    print(f"   ✅ {len(tide_stations)}개 조석관측소 로드 완료")
+    # 역방향 인덱스 (해양관측소 → 조석관측소)
+    reverse_index = build_reverse_index(tide_stations, marine_stations, matching_result)
+    with open(reverse_path, 'w', encoding='utf-8') as f:
+        json.dump(reverse_index, f, ensure_ascii=False, separators=(',', ':'))
+    print(f"💾 역방향 인덱스 저장: {reverse_path} ({len(reverse_index)}개 해양관측소)")
 
-    print("\n🌊 해양관측소 로딩 중...")
-    marine_stations = load_marine_stations(a_csv_path, b_csv_path)
-    print(f"   ✅ {len(marine_stations)}개 해양관측소 로드 완료 (중복 제거)")
+    # 변경 보고서 (직전 캐시 대비)
+    if cache is not None and not unchanged:
+        diff = diff_matching_results(cache['matching_result'], matching_result)
+        with open(diff_path, 'w', encoding='utf-8') as f:
+            json.dump(diff, f, ensure_ascii=False, indent=2)
 
-    print("\n🔗 거리 계산 및 매칭 수행 중...")
-    matching_result = match_stations(tide_stations, marine_stations, top_n=10)
-    print(f"   ✅ {len(matching_result)}개 조석관측소 매칭 완료")
+        reupsert = [item['code'] for item in diff['changed'] if item['nearest_changed']] + diff['added']
+        print(f"📝 변경 보고서 저장: {diff_path}")
+        print(f"   매칭 변경 {len(diff['changed'])}개, 추가 {len(diff['added'])}개, 삭제 {len(diff['removed'])}개")
+        print(f"   tide_abs_region 재업로드 대상: {', '.join(reupsert) if reupsert else '없음'}")
 
-    # JSON 파일로 저장
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(matching_result, f, ensure_ascii=False, indent=2)
+    if not unchanged:
+        save_matching_cache(cache_path, input_hashes, top_n, tide_stations, marine_stations, matching_result)
 
-    print(f"\n💾 결과 저장: {output_path}")
+    if args.per_variable:
+        per_variable = match_stations_per_variable(tide_stations, marine_stations)
+        with open(per_variable_path, 'w', newline='', encoding='utf-8-sig') as f:
+            writer = csv.DictWriter(f, fieldnames=PER_VARIABLE_FIELDNAMES)
+            writer.writeheader()
+            writer.writerows(per_variable_rows(tide_stations, per_variable))
+        print(f"💾 항목별 매칭 저장: {per_variable_path}")
 
     # 샘플 출력
     print("\n📊 샘플 결과 (첫 2개 조석관측소):")
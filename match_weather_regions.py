@@ -5,52 +5,38 @@ tidedata.csv의 지역들을 중기예보 지역과 매칭하는 스크립트
 """
 
 import csv
-from difflib import SequenceMatcher
+from kma_typ01 import iter_typ01
+from region_name_index import jamo_similarity, region_name_index
 
 def parse_forecast_regions(file_path):
     """중기예보 지역 파일을 파싱하여 딕셔너리로 반환"""
     regions = {}
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # #START7777과 #7777END 사이의 데이터 추출
-    start_idx = content.find('#START7777')
-    end_idx = content.find('#7777END')
-    
-    if start_idx != -1 and end_idx != -1:
-        data_section = content[start_idx:end_idx]
-        
-        # 공백으로 구분된 데이터를 찾기 위한 정규식 패턴
-        import re
-        
-        # REG_ID 패턴으로 시작하는 라인들 찾기 (11로 시작하는 코드들)
-        pattern = r'(11[A-Z0-9]+)\s+(\d{12})\s+(\d{12})\s+([ACI])\s+([\w\s\(\)\.]+?)(?=\s+11[A-Z0-9]+|\s*$|#7777END)'
-        
-        matches = re.findall(pattern, data_section, re.MULTILINE)
+    # #START7777 ~ #7777END 구간을 한 행씩 읽음 (줄바꿈이 사라진 파일도 행 단위로 분리됨)
+    for row in iter_typ01(file_path):
+        reg_id = row['REG_ID']
+        reg_sp = row['REG_SP']
+        reg_name = row['REG_NAME']
         
-        for match in matches:
-            reg_id, tm_st, tm_ed, reg_sp, reg_name = match
-            reg_name = reg_name.strip()
-            
-            # 육상(A)과 도시(C) 지역만 사용
-            if reg_sp in ['A', 'C'] and reg_name:
-                regions[reg_name] = {
-                    'REG_ID': reg_id,
-                    'REG_SP': reg_sp,
-                    'REG_NAME': reg_name
-                }
+        # 11로 시작하는 코드 중 육상(A)과 도시(C) 지역만 사용
+        if reg_id.startswith('11') and reg_sp in ['A', 'C'] and reg_name:
+            regions[reg_name] = {
+                'REG_ID': reg_id,
+                'REG_SP': reg_sp,
+                'REG_NAME': reg_name
+            }
     
     return regions
 
+# 지역명으로 정할 수 없는 관측소 (다른 지역을 기본값으로 넣지 않고 REG_ID를 비워 둠)
+UNMATCHED_REGION = {'REG_ID': '', 'REG_SP': '', 'REG_NAME': ''}
+
 def similarity(a, b):
-    """두 문자열의 유사도를 계산 (0~1)"""
-    return SequenceMatcher(None, a, b).ratio()
+    """두 문자열의 유사도를 계산 (0~1, 자모 n-gram Dice 계수)"""
+    return jamo_similarity(a, b)
 
 def find_best_match(location_name, forecast_regions):
     """location_name과 가장 유사한 중기예보 지역을 찾기"""
-    best_match = None
-    best_score = 0
     
     # 직접 매칭 규칙들
     name_mappings = {
@@ -105,19 +91,19 @@ def find_best_match(location_name, forecast_regions):
             if target in forecast_regions:
                 return forecast_regions[target]
     
-    # 유사도 기반 매칭
-    for region_name, region_data in forecast_regions.items():
-        score = similarity(location_name, region_name)
-        if score > best_score:
-            best_score = score
-            best_match = region_data
+    # 지역명으로 시작하는 이름 (예: '강화대교' → '강화')
+    index = region_name_index(forecast_regions)
+    prefix_name = index.prefix_match(location_name)
+    if prefix_name is not None:
+        return forecast_regions[prefix_name]
+    
+    # 유사도 기반 매칭 (자모 n-gram 역색인, 지역 목록별로 한 번만 생성, 최소 유사도 미만이면 None)
+    best_name, best_score = index.best_match(location_name)
+    best_match = forecast_regions[best_name] if best_name is not None else None
     
-    # 기본값: 지역별로 대표 지역 선택
-    if best_match is None or best_score < 0.3:
-        # 위도/경도 기반으로 대략적 지역 분류 후 기본값 설정
-        # 이 부분은 tidedata의 위도/경도 정보를 활용할 수 있음
-        default_region = forecast_regions.get('제주', forecast_regions.get('부산', list(forecast_regions.values())[0]))
-        return default_region
+    # 최소 유사도를 넘는 지역이 없으면 미매칭 (REG_ID 빈 값)
+    if best_match is None:
+        return UNMATCHED_REGION
     
     return best_match
 
@@ -151,7 +137,7 @@ def main():
             }
             matched_data.append(new_row)
             
-            print(f"{location_name} -> {match['REG_NAME']} ({match['REG_ID']})")
+            print(f"{location_name} -> {match['REG_NAME'] or '미매칭'} ({match['REG_ID']})")
     
     # 새로운 CSV 파일로 저장
     with open('tidedata_with_weather_regions.csv', 'w', encoding='utf-8', newline='') as f:
@@ -5,50 +5,39 @@ tidedata.csv의 지역들을 중기예보 지역과 매칭하는 스크립트 (v
 """
 
 import csv
-import re
-from difflib import SequenceMatcher
+from kma_typ01 import iter_typ01
+from region_name_index import jamo_similarity, region_name_index
 
 def parse_forecast_regions(file_path):
     """중기예보 지역 파일을 파싱하여 딕셔너리로 반환"""
     regions = {}
     
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # #START7777과 #7777END 사이의 데이터 추출
-    start_idx = content.find('#START7777')
-    end_idx = content.find('#7777END')
-    
-    if start_idx != -1 and end_idx != -1:
-        data_section = content[start_idx:end_idx]
-        
-        # REG_ID 패턴으로 시작하는 라인들 찾기 (11로 시작하는 코드들)
-        pattern = r'(11[A-Z0-9]+)\s+(\d{12})\s+(\d{12})\s+([ACI])\s+([\w\s\(\)\.]+?)(?=\s+11[A-Z0-9]+|\s*$|#7777END)'
-        
-        matches = re.findall(pattern, data_section, re.MULTILINE)
+    # #START7777 ~ #7777END 구간을 한 행씩 읽음 (줄바꿈이 사라진 파일도 행 단위로 분리됨)
+    for row in iter_typ01(file_path):
+        reg_id = row['REG_ID']
+        reg_sp = row['REG_SP']
+        reg_name = row['REG_NAME']
         
-        for match in matches:
-            reg_id, tm_st, tm_ed, reg_sp, reg_name = match
-            reg_name = reg_name.strip()
-            
-            # 육상(A)과 도시(C) 지역만 사용
-            if reg_sp in ['A', 'C'] and reg_name:
-                regions[reg_name] = {
-                    'REG_ID': reg_id,
-                    'REG_SP': reg_sp,
-                    'REG_NAME': reg_name
-                }
+        # 11로 시작하는 코드 중 육상(A)과 도시(C) 지역만 사용
+        if reg_id.startswith('11') and reg_sp in ['A', 'C'] and reg_name:
+            regions[reg_name] = {
+                'REG_ID': reg_id,
+                'REG_SP': reg_sp,
+                'REG_NAME': reg_name
+            }
     
     return regions
 
+# 지역명으로 정할 수 없는 관측소 (다른 지역을 기본값으로 넣지 않고 REG_ID를 비워 둠)
+UNMATCHED_REGION = {'REG_ID': '', 'REG_SP': '', 'REG_NAME': ''}
+UNMATCHED_CRITERIA = "미매칭"
+
 def similarity(a, b):
-    """두 문자열의 유사도를 계산 (0~1)"""
-    return SequenceMatcher(None, a, b).ratio()
+    """두 문자열의 유사도를 계산 (0~1, 자모 n-gram Dice 계수)"""
+    return jamo_similarity(a, b)
 
 def find_best_match(location_name, forecast_regions):
     """location_name과 가장 유사한 중기예보 지역을 찾기"""
-    best_match = None
-    best_score = 0
     match_criteria = ""
     
     # 직접 매칭 규칙들
@@ -108,22 +97,40 @@ def find_best_match(location_name, forecast_regions):
                     match_criteria = f"지역명({key}→{target})"
                 return forecast_regions[target], match_criteria
     
-    # 유사도 기반 매칭
-    for region_name, region_data in forecast_regions.items():
-        score = similarity(location_name, region_name)
-        if score > best_score:
-            best_score = score
-            best_match = region_data
+    # 지역명으로 시작하는 이름 (예: '강화대교' → '강화')
+    index = region_name_index(forecast_regions)
+    prefix_name = index.prefix_match(location_name)
+    if prefix_name is not None:
+        match_criteria = "지역명" if prefix_name == location_name else f"지역명({location_name}→{prefix_name})"
+        return forecast_regions[prefix_name], match_criteria
     
-    # 기본값: 지역별로 대표 지역 선택
-    if best_match is None or best_score < 0.3:
-        default_region = forecast_regions.get('제주', forecast_regions.get('부산', list(forecast_regions.values())[0]))
-        match_criteria = "기본값"
-        return default_region, match_criteria
+    # 유사도 기반 매칭 (자모 n-gram 역색인, 지역 목록별로 한 번만 생성, 최소 유사도 미만이면 None)
+    best_name, best_score = index.best_match(location_name)
+    best_match = forecast_regions[best_name] if best_name is not None else None
+    
+    # 최소 유사도를 넘는 지역이 없으면 미매칭 (수동 확인 또는 fix_similarity_matching.py 대상)
+    if best_match is None:
+        return UNMATCHED_REGION, UNMATCHED_CRITERIA
     
     match_criteria = f"유사도({best_score:.2f})"
     return best_match, match_criteria
 
+MATCHED_FIELDNAMES = ['Code', 'Name', 'Latitude', 'Longitude', 'REG_ID', 'REG_SP', 'REG_NAME', 'MATCH_CRITERIA']
+
+def match_location_row(row, forecast_regions):
+    """tidedata 한 행(Code, Name, Latitude, Longitude)에 가장 적합한 중기예보 지역과 매칭 기준을 붙인 행"""
+    match, criteria = find_best_match(row['Name'], forecast_regions)
+    return {
+        'Code': row['Code'],
+        'Name': row['Name'],
+        'Latitude': row['Latitude'],
+        'Longitude': row['Longitude'],
+        'REG_ID': match['REG_ID'],
+        'REG_SP': match['REG_SP'],
+        'REG_NAME': match['REG_NAME'],
+        'MATCH_CRITERIA': criteria
+    }
+
 def main():
     # 중기예보 지역 데이터 로드
     forecast_regions = parse_forecast_regions('fct_medm_reg.csv')
@@ -137,30 +144,14 @@ def main():
         reader = csv.DictReader(f)
         
         for row in reader:
-            location_name = row['Name']
-            
-            # 가장 적합한 중기예보 지역 찾기
-            match, criteria = find_best_match(location_name, forecast_regions)
-            
-            # 원본 데이터에 매칭 결과 추가
-            new_row = {
-                'Code': row['Code'],
-                'Name': row['Name'],
-                'Latitude': row['Latitude'],
-                'Longitude': row['Longitude'],
-                'REG_ID': match['REG_ID'],
-                'REG_SP': match['REG_SP'], 
-                'REG_NAME': match['REG_NAME'],
-                'MATCH_CRITERIA': criteria
-            }
+            new_row = match_location_row(row, forecast_regions)
             matched_data.append(new_row)
             
-            print(f"{location_name} -> {match['REG_NAME']} ({match['REG_ID']}) [{criteria}]")
+            print(f"{row['Name']} -> {new_row['REG_NAME']} ({new_row['REG_ID']}) [{new_row['MATCH_CRITERIA']}]")
     
     # 새로운 CSV 파일로 저장
     with open('tidedata_with_criteria.csv', 'w', encoding='utf-8', newline='') as f:
-        fieldnames = ['Code', 'Name', 'Latitude', 'Longitude', 'REG_ID', 'REG_SP', 'REG_NAME', 'MATCH_CRITERIA']
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
+        writer = csv.DictWriter(f, fieldnames=MATCHED_FIELDNAMES)
         writer.writeheader()
         writer.writerows(matched_data)
     
@@ -0,0 +1,130 @@
+"""
+get-medm-weather 매핑 데이터 파일(medm_mapping.json) 생성/검증
+- 중기예보 지역 정보(REG_ID, REG_SP, REG_NAME)와 reg_id → location_code 매핑을
+  Edge Function 소스에 하드코딩하지 않고 map_regions.py가 생성하는 JSON 파일로 배포
+- 문자열 키 중첩 객체 대신 정수 색인 배열로 저장
+    regions:   REG_ID / REG_NAME 배열, REG_SP는 한 글자씩 이어 붙인 문자열
+    locations: location_code 배열 (정렬)
+    mappings:  매핑 종류별 CSR 배열 (regions[g] 지역의 관측소 = locations[offsets[g]:offsets[g + 1]])
+- format_version: 형식이 바뀌면 올림 (index.ts가 다른 버전이면 로드 실패)
+- content_hash: content_hash 필드를 뺀 내용의 정규화 JSON SHA-256 앞 16자리
+  (같은 매핑이면 같은 값이므로 배포된 매핑 확인/변경 여부 비교용)
+
+사용법 (프로젝트 루트에서):
+    python3 medm_artifact.py supabase/functions/get-medm-weather/medm_mapping.json   # 검증 + 요약
+"""
+
+import hashlib
+import json
+import sys
+from typing import Dict, List, Sequence, Tuple
+
+FORMAT_VERSION = 1
+
+# medium_term_forecasts.reg_sp CHECK 제약(A, C, I)에 맞춘 값 (medm_reg.txt의 해상 'H'는 'I'로 저장)
+DB_REG_SP = {'H': 'I'}
+DB_REG_SP_ALLOWED = ('A', 'C', 'I')
+
+def _canonical(payload: Dict) -> bytes:
+    return json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(',', ':')).encode('utf-8')
+
+def content_hash(artifact: Dict) -> str:
+    """content_hash 필드를 뺀 내용의 SHA-256 앞 16자리"""
+    payload = {key: value for key, value in artifact.items() if key != 'content_hash'}
+    return hashlib.sha256(_canonical(payload)).hexdigest()[:16]
+
+def build_artifact(regions: Sequence[Tuple[str, str, str]], mappings: Dict[str, Dict[str, List[str]]]) -> Dict:
+    """
+    regions: (REG_ID, REG_SP, REG_NAME) 목록 (medm_reg.txt 순서)
+             CHECK 제약에 없는 REG_SP(예: 11BD0000의 '0')는 regions에서 제외
+    mappings: {'marine': {reg_id: [location_code, ...]}, 'temperature': {...}}
+    """
+    regions = [(reg_id, DB_REG_SP.get(reg_sp, reg_sp), reg_name) for reg_id, reg_sp, reg_name in regions]
+    regions = [region for region in regions if region[1] in DB_REG_SP_ALLOWED]
+    region_ids = [reg_id for reg_id, _, _ in regions]
+    region_index = {reg_id: i for i, reg_id in enumerate(region_ids)}
+    if len(region_index) != len(region_ids):
+        raise ValueError("medm_reg.txt에 중복된 REG_ID가 있습니다")
+
+    locations = sorted({code for mapping in mappings.values() for codes in mapping.values() for code in codes})
+    location_index = {code: i for i, code in enumerate(locations)}
+
+    encoded = {}
+    for kind, mapping in mappings.items():
+        unknown = sorted(set(mapping) - set(region_index))
+        if unknown:
+            raise ValueError(f"{kind} 매핑의 지역 코드가 medm_reg.txt에 없거나 REG_SP가 {'/'.join(DB_REG_SP_ALLOWED)}가 아닙니다: {', '.join(unknown)}")
+        group_regions, offsets, group_locations = [], [0], []
+        for reg_id in sorted(mapping, key=region_index.get):
+            group_regions.append(region_index[reg_id])
+            group_locations.extend(location_index[code] for code in sorted(set(mapping[reg_id])))
+            offsets.append(len(group_locations))
+        encoded[kind] = {'regions': group_regions, 'offsets': offsets, 'locations': group_locations}
+
+    artifact = {
+        'format_version': FORMAT_VERSION,
+        'content_hash': '',
+        'regions': {
+            'id': region_ids,
+            'sp': ''.join(reg_sp for _, reg_sp, _ in regions),
+            'name': [reg_name for _, _, reg_name in regions],
+        },
+        'locations': locations,
+        'mappings': encoded,
+    }
+    artifact['content_hash'] = content_hash(artifact)
+    return artifact
+
+def dumps_artifact(artifact: Dict) -> str:
+    return json.dumps(artifact, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+def write_artifact(path: str, artifact: Dict):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(dumps_artifact(artifact))
+
+def load_artifact(path: str) -> Dict:
+    """파일을 읽어 형식 버전과 content_hash 확인 (맞지 않으면 ValueError)"""
+    with open(path, 'r', encoding='utf-8') as f:
+        artifact = json.load(f)
+    if artifact.get('format_version') != FORMAT_VERSION:
+        raise ValueError(f"지원하지 않는 형식 버전: {artifact.get('format_version')} (필요: {FORMAT_VERSION})")
+    if artifact.get('content_hash') != content_hash(artifact):
+        raise ValueError(f"content_hash 불일치: {artifact.get('content_hash')} (계산: {content_hash(artifact)})")
+    return artifact
+
+def decode_artifact(artifact: Dict) -> Tuple[Dict[str, Dict], Dict[str, Dict[str, List[str]]]]:
+    """index.ts와 같은 형태로 복원: ({REG_ID: {REG_ID, REG_SP, REG_NAME}}, {종류: {reg_id: [location_code]}})"""
+    regions = artifact['regions']
+    region_info = {
+        reg_id: {'REG_ID': reg_id, 'REG_SP': reg_sp, 'REG_NAME': reg_name}
+        for reg_id, reg_sp, reg_name in zip(regions['id'], regions['sp'], regions['name'])
+    }
+    locations = artifact['locations']
+    mappings = {}
+    for kind, group in artifact['mappings'].items():
+        offsets = group['offsets']
+        mappings[kind] = {
+            regions['id'][region]: [locations[i] for i in group['locations'][offsets[g]:offsets[g + 1]]]
+            for g, region in enumerate(group['regions'])
+        }
+    return region_info, mappings
+
+def main():
+    if len(sys.argv) < 2:
+        print("사용법: python medm_artifact.py <medm_mapping.json>")
+        sys.exit(1)
+
+    try:
+        artifact = load_artifact(sys.argv[1])
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    region_info, mappings = decode_artifact(artifact)
+    print(f"✅ format_version {artifact['format_version']}, content_hash {artifact['content_hash']}")
+    print(f"   지역 {len(region_info)}개, location_code {len(artifact['locations'])}개")
+    for kind, mapping in mappings.items():
+        print(f"   {kind}: 지역 {len(mapping)}개, 관측소 {sum(len(codes) for codes in mapping.values())}개")
+
+if __name__ == '__main__':
+    main()
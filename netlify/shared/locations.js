@@ -183,6 +183,11 @@ const locations = [
     {code: "AD_0042", name: "다대포항"},
 ];
 
+// GPS 좌표 → 최근접 관측소 geohash 인덱스
+// 자동 생성: geohash_index.py (locations_geohash.json)
+// 조회: shared/nearest_location.js의 findNearestLocation(lat, lon) → {code, name, distanceKm}
+const locationGeohashIndex = {"version":1,"precision":4,"coverage_km":18.1,"codes":["SO_0326","SO_0536","SO_0537","SO_0538","SO_0539","SO_0540","SO_0543","SO_0547","SO_0548","SO_0550","SO_0551","SO_0552","SO_0553","SO_0554","SO_0555","SO_0562","SO_0563","SO_0564","SO_0565","SO_0566","SO_0567","SO_0568","SO_0569","SO_0570","SO_0571","SO_0572","SO_0573","SO_0574","SO_0576","SO_0577","SO_0578","SO_0581","SO_0631","SO_0699","SO_0701","SO_0702","SO_0703","SO_0704","SO_0705","SO_0706","SO_0707","SO_0708","SO_0709","SO_0710","SO_0711","SO_0712","SO_0731","SO_0732","SO_0733","SO_0734","SO_0735","SO_0736","SO_0737","SO_0738","SO_0739","SO_0740","SO_0752","SO_0753","SO_0754","SO_0755","SO_0756","SO_0757","SO_0758","SO_0759","SO_0760","SO_0761","DT_0001","DT_0002","DT_0003","DT_0004","DT_0005","DT_0006","DT_0007","DT_0008","DT_0009","DT_0010","DT_0011","DT_0012","DT_0013","DT_0014","DT_0015","DT_0016","DT_0017","DT_0018","DT_0019","DT_0020","DT_0021","DT_0022","DT_0023","DT_0024","DT_0025","DT_0026","DT_0027","DT_0028","DT_0029","DT_0030","DT_0031","DT_0032","DT_0034","DT_0035","DT_0036","DT_0037","DT_0038","DT_0039","DT_0040","DT_0041","DT_0042","DT_0043","DT_0044","DT_0045","DT_0046","DT_0047","DT_0048","DT_0049","DT_0050","DT_0051","DT_0052","DT_0054","DT_0056","DT_0057","DT_0058","DT_0059","DT_0060","DT_0061","DT_0062","DT_0063","DT_0064","DT_0065","DT_0067","DT_0068","DT_0091","DT_0092","DT_0093","DT_0094","IE_0060","IE_0061","IE_0062","AD_0001","AD_0002","AD_0003","AD_0004","AD_0005","AD_0006","AD_0007","AD_0008","AD_0009","AD_0010","AD_0011","AD_0012","AD_0013","AD_0014","AD_0015","AD_0016","AD_0018","AD_0019","AD_0020","AD_0021","AD_0022","AD_0023","AD_0024","AD_0025","AD_0026","AD_0027","AD_0028","AD_0029","AD_0030","AD_0031","AD_0032","AD_0033","AD_0034","AD_0035","AD_0036","AD_0037","AD_0038","AD_0039","AD_0040","AD_0041","AD_0042"],"names":["미조항","덕적도","벽파진(벽파항)","안마도","강화외포","호산항","서거차도","말도","우이도(신안)","나로도","여서도","고현항","해운대","영종왕산","서망항","승봉도","울도","국화도","향화도항","송공항","쉬미항","백야도","남포항","광암항","거제외포","읍천항","양포항","백사장항","화봉리","가거도","소매물도","강양항","암태도","천리포항","홍도항","진도옥도","땅끝항","소안항(완도)","마량항","청산도","시산항","안도항","두문포","봉우항","창선도","능양항","대진항","남애항","강릉항","궁촌항","죽변항","축산항","강구항","여호항","도장항","보옥항","검산항","하의도웅곡","평호리","원동항","사초항","안남리","달천도","장문리","오산항","녹동항","인천","평택","영광","제주","부산","묵호","목포","안산","포항","서귀포","후포","속초","울릉도","통영","마산","여수","대산","군산","가덕도","울산","추자도","성산포","모슬포","장항","보령","고흥발포","완도","진도","거제도","위도","거문도","강화대교","안흥","흑산도","대청도","어청도","굴업도","왕돌초","독도","복사초","교본초","영흥도","영종대교","격렬비열도","쌍정초","도농탄","속초등표","광양","태안","서천마량","인천송도","진해","부산항신항","동해항","경인항","백령도","연평도","삼천포","마산","가덕도","교동대교","덕적도","안흥","위도","포항","여호항","소무의도","서거차도","이어도","신안가거초","옹진소청초","시화방조제","삼길포항","석문방조제","대부도","제부도","전곡항","석모도","궁평항","자월도","왜목항","도비도항","황금산","벌천포해수욕장","이원방조제","서산A지구방조제","서산B지구방조제","가의도항","학암포항","신진도항","드르니항","영목항","대천항(무창포항)","무창포해수욕장","홍원항","새만금방조제","비안도선착장","격포항","구시포항","동호항","항화도항","비금도가산","송평항","갈두항","동천항","정남진해양낚시공원","고흥만방조제","용두항","내지항","계도항","가배항","다대포항"],"lats":[34.706389,37.227778,34.539444,35.345556,37.700833,37.176111,34.253611,35.855278,34.620556,34.463056,33.988056,34.901944,35.1602777777778,37.458056,34.366667,37.169722,37.035556,37.060556,35.167778,34.848333,34.504722,34.624444,34.957778,35.1025,34.939444,35.690833,35.881389,36.586389,34.661111,34.050833,34.621944,35.39,34.853056,36.803889,34.681111,34.350833,34.298889,34.15,34.448889,34.180833,34.394444,34.479722,34.643611,34.932778,34.840556,34.812222,38.501389,37.944222,37.772278,37.327806,37.054833,36.509944,36.358583,34.661556,34.367306,34.129,35.0,34.608333,34.448056,34.393889,34.470278,34.730278,34.761667,34.873611,36.888889,34.527028,37.451944,36.966944,35.426111,33.5275,35.096389,37.550278,34.7797222222222,37.192222,36.0472222222222,33.24,36.6775,38.207222,37.491389,34.827778,35.21,34.747222,37.0075,35.975556,35.024167,35.501944,33.961944,33.474722,33.214444,36.006944,36.406389,34.481111,34.315556,34.377778,34.801389,35.618056,34.028333,37.731944,36.673611,34.684167,37.825222,36.117222,37.194444,36.7191666666667,37.238889,34.0983333333333,34.7047222222222,37.2386111111111,37.545556,36.624369,37.556161,33.158056,38.199478,34.903672,36.9130555555556,36.1288888888889,37.3380555555556,35.147222,35.0775,37.494722,37.560833,37.95565,37.657669,34.924167,35.1975,35.024178,37.789611,37.226333,36.6746388888889,35.6180844444444,36.051777,34.661944,37.373069,34.25142222,32.1227777777778,33.941944,37.423056,37.311241,37.003892,37.001554,37.207938,37.166686,37.187681,37.65445,37.11611,37.244555,37.044797,37.018513,36.990378,36.968196,36.904202,36.602727,36.625471,36.673562,36.902522,36.902522,36.590059,36.400043,36.328198,36.245178,36.162883,35.833138,35.735745,35.623433,35.449806,35.521553,35.167977,34.760966,34.426953,34.330291,34.203406,34.470784,34.651229,34.835211,34.855647,34.974278,34.78596,35.057047],"lons":[128.048611,126.157778,126.346111,126.016111,126.3725,129.342778,125.917778,126.318333,125.856667,127.453889,126.923333,128.622222,129.1915,126.358889,126.134167,126.290556,125.995,126.560556,126.359444,126.225278,126.183611,127.632222,128.321667,128.498889,128.718056,129.475556,129.5275,126.315,126.256944,125.128889,128.548056,129.344722,126.071389,126.146944,125.195,126.018611,126.531111,126.631944,126.821944,126.856111,127.261667,127.797778,127.7975,127.9275,128.019444,128.245,128.426167,128.788333,128.951333,129.270028,129.423917,129.448139,129.391306,127.469556,127.011972,126.513556,126.107778,126.038611,126.455,126.648611,126.761111,127.264444,127.563056,128.424167,129.416111,127.134528,126.592222,126.822778,126.420556,126.543056,129.035278,129.116389,126.375556,126.647222,129.383888888889,126.561667,129.453056,128.594167,130.913611,128.434722,128.588889,127.765556,126.352778,126.563056,128.810833,129.387222,126.300278,126.927778,126.251111,126.6875,126.486111,127.342778,126.759722,126.308611,128.699167,126.301667,127.308889,126.522222,126.132222,125.435556,124.718056,125.984722,125.995,129.7325,131.867222,126.168333333333,128.306388888889,126.428611111111,126.584444,125.561964,130.939211,126.274722,128.613083,127.754836,126.238888888889,126.495277777778,126.586111111111,128.643056,128.784722,129.143889,126.601111,124.736081,125.714417,128.069722,128.576389,128.810933,126.339611,126.156556,126.129555555556,126.301815833333,129.376277,127.469167,126.440066,125.915449999,125.182222222222,124.592778,124.738056,126.607595,126.453104,126.643014,126.540241,126.616773,126.65229,126.327121,126.67713,126.318354,126.527138,126.46204,126.327876,126.336212,126.263425,126.435026,126.360493,126.064058,126.206355,126.206355,126.31488,126.426899,126.509917,126.536391,126.499793,126.48402,126.461443,126.463768,126.435537,126.486863,126.359493,125.999144,126.481791,126.53492,126.624946,126.97624,127.213832,127.433247,128.180548,128.51763,128.568371,128.979232],"blocks":{"wv8v":[134],"wv8y":[134],"wv8z":[134],"wv9j":[134],"wv9m":[134],"wv9n":[134],"wv9p":[134],"wv9q":[134],"wv9r":[134],"wvce":[88,111],"wvcg":[88,111],"wvcs":[75,88,111],"wvct":[69,75,88,111],"wvcu":[75,88,111],"wvcv":[69,75,88,111],"wvcw":[69,75],"wvcx":[69],"wvcy":[69,75],"wvcz":[69],"wvf5":[88,111],"wvfh":[75,88,111],"wvfj":[69,75,87,88,111],"wvfm":[87],"wvfn":[69,75,87],"wvfp":[69,87],"wvfq":[87],"wvfr":[87],"wvft":[87],"wvfw":[87],"wvfx":[87],"wy02":[135],"wy03":[135],"wy06":[135],"wy08":[29,135],"wy09":[29,135],"wy0b":[29,135],"wy0c":[29,135],"wy0d":[29,135],"wy0f":[29,135],"wy0u":[34,99],"wy0v":[34,99],"wy0y":[34,99],"wy10":[29],"wy11":[29],"wy12":[105],"wy13":[6,105,133],"wy14":[29],"wy15":[8],"wy16":[6,14,35,105,133],"wy17":[6,8,14,20,35,57,133],"wy18":[86,105],"wy19":[6,55,86,105,133],"wy1b":[86,105],"wy1c":[6,37,39,55,86,105,133,170],"wy1d":[6,14,35,36,55,58,86,93,105,133,168,169],"wy1e":[2,6,8,14,20,35,36,55,57,58,93,133,168,169],"wy1f":[6,14,35,36,37,38,39,55,58,59,86,92,93,105,133,168,169,170],"wy1g":[2,6,14,20,35,36,37,38,39,55,57,58,59,60,92,93,133,168,169,170],"wy1h":[8,34,99],"wy1j":[8,34,99],"wy1k":[8,14,20,34,35,57,99,167],"wy1m":[8,20,32,34,57,99,167],"wy1n":[34,99],"wy1q":[32,34,56,99,167],"wy1r":[32,56],"wy1s":[2,8,14,20,28,35,36,57,58,72,93,167,168,169],"wy1t":[2,8,19,20,28,32,57,72,167],"wy1u":[2,14,20,28,35,36,38,57,58,59,60,72,92,93,167,168,169],"wy1v":[2,19,20,28,32,57,60,72,167],"wy1w":[19,28,32,56,72,167],"wy1x":[18,19,32,56,166],"wy1y":[19,28,32,56,72,167],"wy1z":[18,19,32,56,166],"wy32":[3,56],"wy33":[3],"wy36":[3],"wy38":[3,18,56,68,164,166],"wy39":[3,18,68,95,129,163,164,165,166],"wy3b":[3,18,56,68,164,166],"wy3c":[3,18,68,95,129,163,164,165,166],"wy3d":[3,7,68,95,129,161,162,163,164,165],"wy3e":[7,95,129,161,162,163,165],"wy3f":[3,7,68,95,129,161,162,163,164,165],"wy3g":[7,83,89,95,129,161,162,163,165],"wy3k":[101],"wy3m":[101],"wy3p":[109],"wy3q":[101],"wy3r":[98,109,128,153],"wy3s":[7,101,115,160,161,162],"wy3t":[101,115,158,159,160],"wy3u":[7,83,89,101,115,160,161,162],"wy3v":[83,89,101,115,158,159,160],"wy3w":[90,101,115,157,158,159,160],"wy3x":[27,90,98,109,128,151,152,153,156,157,158,159],"wy3y":[90,101,115,157,158,159,160],"wy3z":[27,90,98,128,151,152,153,156,157,158,159],"wy40":[10,86],"wy41":[10,37,39,55,86,170],"wy42":[10,96],"wy43":[10,37,39,96,170],"wy44":[10,36,37,38,39,40,54,55,58,59,86,92,93,168,169,170],"wy45":[2,36,37,38,39,40,54,55,58,59,60,65,92,93,168,169,170,171],"wy46":[10,37,38,39,40,54,59,92,96,170],"wy47":[9,37,38,39,40,54,59,60,65,91,92,170,171],"wy48":[10,96],"wy49":[10,96],"wy4b":[96],"wy4c":[96],"wy4d":[10,40,54,96],"wy4e":[9,21,40,41,54,65,91,171],"wy4f":[96],"wy4g":[9,21,41,91],"wy4h":[2,28,36,38,40,54,58,59,60,61,65,72,92,93,168,169,171,172],"wy4j":[2,19,28,60,61,65,72,171,172],"wy4k":[9,38,40,53,54,59,60,61,62,65,91,92,131,171,172],"wy4m":[9,53,60,61,62,65,91,131,171,172,173],"wy4n":[19,28,61,72,172],"wy4p":[18,19,166],"wy4q":[53,61,62,131,172,173],"wy4r":[173],"wy4s":[9,21,40,41,42,53,54,61,62,65,81,91,131,171,172],"wy4t":[9,21,41,42,43,53,61,62,65,81,91,113,131,171,172,173],"wy4u":[0,9,21,41,42,53,62,81,91,106,131],"wy4v":[0,9,21,41,42,43,44,45,53,62,81,91,106,113,123,131,173,174],"wy4w":[42,43,53,61,62,81,113,131,172,173],"wy4x":[43,113,173],"wy4y":[0,42,43,44,45,53,62,81,106,113,123,131,173,174],"wy4z":[43,44,45,113,123,173,174],"wy55":[21,30,41],"wy57":[30],"wy5e":[30],"wy5h":[0,21,30,41,42,81,106,176],"wy5j":[0,11,21,22,30,41,42,43,44,45,63,79,81,106,113,123,174,175,176],"wy5k":[0,30,94,106,176],"wy5m":[0,11,22,24,30,44,45,63,79,94,106,123,174,175,176],"wy5n":[0,11,22,23,42,43,44,45,63,79,81,106,113,117,123,174,175,176],"wy5p":[11,22,23,43,44,45,63,79,80,113,117,123,124,174,175],"wy5q":[0,11,22,23,24,44,45,63,79,84,94,106,117,118,123,125,174,175,176,177],"wy5r":[11,22,23,24,44,45,63,79,80,84,117,118,123,124,125,174,175,177],"wy5s":[30,94,176],"wy5t":[11,22,24,30,63,79,94,175,176],"wy5u":[94],"wy5v":[24,94],"wy5w":[11,22,23,24,63,70,79,84,94,117,118,125,175,176,177],"wy5x":[11,12,22,23,24,63,70,79,80,84,117,118,124,125,175,177],"wy5y":[24,70,84,94,118,125,177],"wy5z":[12,24,70,84,118,125,177],"wy60":[18,68,164,166],"wy61":[18,68,95,129,163,164,165,166],"wy64":[7,68,95,129,161,162,163,164,165],"wy65":[7,83,89,95,129,161,162,163,165],"wy67":[83,89],"wy6h":[7,83,89,115,160,161,162],"wy6j":[83,89,115,158,159,160],"wy6k":[83,89],"wy6m":[83,89],"wy6n":[90,115,157,158,159,160],"wy6p":[27,90,151,152,156,157,158,159],"wy70":[23,80,117,124],"wy71":[80,124],"wy72":[23,80,84,117,118,124,125,177],"wy73":[80,124],"wy78":[12,23,31,70,80,84,117,118,124,125,177],"wy79":[12,31,80,124],"wy7b":[12,31,70,84,85,118,125,177],"wy7c":[12,31,85],"wy7d":[31],"wy7f":[25,31,85],"wy7g":[25,26],"wy7u":[25,26,74,130],"wy7v":[26,52,74,130],"wy7y":[51,52,74,130],"wy7z":[51,52,76],"wy87":[136],"wy8e":[136],"wy8g":[136],"wy8k":[136],"wy8m":[136],"wy8q":[100,121],"wy8r":[100,121],"wy8s":[136],"wy8t":[136],"wy8u":[136],"wy8v":[136],"wy8w":[100,121],"wy8x":[100,121],"wy8y":[100,121],"wy8z":[100,121],"wy90":[109],"wy91":[109],"wy92":[33,98,109,128,153,154,155],"wy93":[16,33,98,109,128,153,154,155],"wy96":[1,16,33,102,127,154,155],"wy97":[1,16,102,127],"wy98":[27,33,90,98,109,114,128,150,151,152,153,154,155,156,157],"wy99":[16,17,27,33,82,98,109,114,128,138,146,147,148,149,150,151,152,153,154,155,156],"wy9b":[27,33,90,98,114,128,150,151,152,153,154,155,156,157],"wy9c":[16,17,27,33,67,82,98,114,128,138,139,146,147,148,149,150,151,152,153,154,155,156],"wy9d":[1,15,16,17,33,82,102,107,114,127,138,140,145,146,147,148,149,150,154,155],"wy9e":[1,15,16,17,82,102,107,127,132,138,140,145,146,147,148,149],"wy9f":[1,15,16,17,33,67,73,82,102,107,114,127,138,139,140,141,142,144,145,146,147,148,149,150,154,155],"wy9g":[1,15,16,17,67,73,82,102,107,116,127,132,137,138,139,140,141,142,144,145,146,147,148,149],"wy9j":[122],"wy9k":[1,102,127],"wy9m":[122],"wy9n":[122],"wy9p":[122],"wy9q":[122],"wy9r":[122],"wy9s":[1,13,15,102,107,127,132,140,145],"wy9t":[4,13,97,122,126,132,143],"wy9u":[1,13,15,66,73,102,107,108,116,120,127,132,137,140,141,142,144,145],"wy9v":[4,13,66,97,108,116,120,126,132,137,143],"wy9w":[4,13,97,122,126,143],"wy9x":[4,97,122,126,143],"wy9y":[4,13,66,97,108,120,126,143],"wy9z":[4,97,126,143],"wyb2":[100,121],"wyb8":[100,121],"wybb":[100,121],"wyd0":[27,90,114,150,151,152,156,157],"wyd1":[17,27,67,82,114,138,139,146,147,148,149,150,151,152,156],"wyd3":[67,139],"wyd4":[15,17,67,73,82,107,114,138,139,140,141,142,144,145,146,147,148,149,150],"wyd5":[15,17,67,73,82,107,116,132,137,138,139,140,141,142,144,145,146,147,148,149],"wyd6":[67,73,139,141,142,144],"wyd7":[67,73,116,137,139,141,142,144],"wydh":[13,15,66,73,107,108,116,120,132,137,140,141,142,144,145],"wydj":[4,13,66,97,108,116,120,126,132,137,143],"wydk":[66,73,108,116,120,137,141,142,144],"wydm":[66,108,116,120,137],"wydn":[4,13,66,97,108,120,126,143],"wydp":[4,97,126,143],"wydq":[66,108,120],"wyeb":[51,64,76],"wyec":[50,64,76],"wyed":[5],"wyee":[5,49],"wyef":[5,50,64],"wyeg":[5,49,50],"wyem":[48],"wyeq":[47,48],"wyer":[47,48],"wyes":[5,49,71,119],"wyet":[48,49,71,119],"wyeu":[5,49,71,119],"wyev":[48,49,71,119],"wyew":[47,48,71,119],"wyex":[47,48],"wyey":[47,48,71,119],"wyez":[47,48],"wyg0":[77,112],"wyg1":[77,112],"wyg2":[47,77,112],"wyg3":[77,112],"wyg4":[46,77,112],"wyg5":[46],"wyg6":[46,77,112],"wyg7":[46],"wyg8":[47,77,112],"wyg9":[77,112],"wygb":[47],"wygd":[46,77,112],"wyge":[46],"wygh":[46],"wygk":[46],"wygs":[46],"wyhn":[70],"wyhp":[12,70],"wyk0":[12,31,70,85],"wyk1":[12,31,85],"wyk2":[85],"wyk3":[85],"wyk4":[25,31,85],"wyk5":[25,26],"wyk6":[25,85],"wyk7":[25,26],"wykh":[25,26,74,130],"wykj":[26,52,74,130],"wykk":[25,26,74,130],"wykm":[26,52,74,130],"wykn":[51,52,74,130],"wykp":[51,52,76,103],"wykq":[51,52,74,130],"wykr":[51,52,76,103],"wykx":[103],"wys0":[51,64,76,103],"wys1":[50,64,76,103],"wys2":[51,64,76,103],"wys3":[50,64,76,103],"wys4":[5,50,64],"wys5":[5,49,50],"wys6":[50,64],"wys7":[50],"wys8":[103],"wys9":[103],"wysh":[5,49,71,119],"wysj":[49,71,119],"wysn":[71,119],"wysu":[78,110],"wysv":[78,110],"wysy":[78,110],"wytd":[104],"wyte":[104],"wytf":[104],"wytg":[104],"wyth":[78,110],"wytj":[78,110],"wytk":[78,110],"wytm":[78,110],"wytn":[78,110],"wytq":[78,110],"wyts":[104],"wytu":[104],"wyw4":[104],"wyw5":[104],"wywh":[104]}};
+
 // Export for use in other files
 if (typeof module !== 'undefined' && module.exports) {
     module.exports = locations;
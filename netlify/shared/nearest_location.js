@@ -0,0 +1,90 @@
+// GPS 좌표 → 가장 가까운 관측소 조회
+// 데이터: shared/locations.js의 locationGeohashIndex (geohash_index.py로 생성)
+// 사용: findNearestLocation(lat, lon) → {code, name, distanceKm}
+// 동작은 geohash_index.py GeohashIndex.nearest()와 동일
+
+const GEOHASH_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz';
+const EARTH_RADIUS_KM = 6371;
+
+function geohashEncode(lat, lon, precision) {
+    const latRange = [-90, 90];
+    const lonRange = [-180, 180];
+    let hash = '';
+    let bits = 0;
+    let value = 0;
+    let even = true;  // 짝수 번째 비트는 경도
+    while (hash.length < precision) {
+        const range = even ? lonRange : latRange;
+        const target = even ? lon : lat;
+        const mid = (range[0] + range[1]) / 2;
+        if (target >= mid) {
+            value = (value << 1) | 1;
+            range[0] = mid;
+        } else {
+            value <<= 1;
+            range[1] = mid;
+        }
+        even = !even;
+        if (++bits === 5) {
+            hash += GEOHASH_BASE32[value];
+            bits = 0;
+            value = 0;
+        }
+    }
+    return {hash, latRange, lonRange};
+}
+
+function toRadians(deg) {
+    return deg * Math.PI / 180;
+}
+
+function haversineKm(lat1, lon1, lat2, lon2) {
+    const a = Math.sin(toRadians(lat2 - lat1) / 2) ** 2 +
+        Math.cos(toRadians(lat1)) * Math.cos(toRadians(lat2)) * Math.sin(toRadians(lon2 - lon1) / 2) ** 2;
+    return 2 * EARTH_RADIUS_KM * Math.asin(Math.sqrt(Math.min(a, 1)));
+}
+
+// 질의 지점에서 자기 셀 + 주변 8개 셀(block) 바깥까지의 최단 거리 (km)
+function blockMarginKm(lat, lon, cell) {
+    const latStep = cell.latRange[1] - cell.latRange[0];
+    const lonStep = cell.lonRange[1] - cell.lonRange[0];
+    const meridianKm = (dLon) => dLon >= 90 ? Infinity :
+        EARTH_RADIUS_KM * Math.asin(Math.cos(toRadians(lat)) * Math.sin(toRadians(dLon)));
+    const margins = [
+        meridianKm(lon - (cell.lonRange[0] - lonStep)),
+        meridianKm((cell.lonRange[1] + lonStep) - lon),
+    ];
+    if (cell.latRange[0] - latStep > -90) margins.push(EARTH_RADIUS_KM * toRadians(lat - (cell.latRange[0] - latStep)));
+    if (cell.latRange[1] + latStep < 90) margins.push(EARTH_RADIUS_KM * toRadians((cell.latRange[1] + latStep) - lat));
+    return Math.min(...margins);
+}
+
+function nearestAmong(index, lat, lon, candidates) {
+    let best = -1;
+    let bestKm = Infinity;
+    for (const i of candidates) {
+        const km = haversineKm(lat, lon, index.lats[i], index.lons[i]);
+        if (km < bestKm) {
+            best = i;
+            bestKm = km;
+        }
+    }
+    return {best, bestKm};
+}
+
+function findNearestLocation(lat, lon, index = locationGeohashIndex) {
+    const cell = geohashEncode(lat, lon, index.precision);
+    const candidates = index.blocks[cell.hash] || [];
+    let {best, bestKm} = nearestAmong(index, lat, lon, candidates);
+
+    // block 밖에 더 가까운 관측소가 있을 수 있으면 전체 계산
+    if (best < 0 || bestKm > blockMarginKm(lat, lon, cell)) {
+        ({best, bestKm} = nearestAmong(index, lat, lon, index.codes.keys()));
+    }
+    return {code: index.codes[best], name: index.names[best], distanceKm: bestKm};
+}
+
+// Export for use in other files
+if (typeof module !== 'undefined' && module.exports) {
+    module.exports = {geohashEncode, findNearestLocation};
+}
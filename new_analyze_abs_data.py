@@ -1,6 +1,11 @@
 import csv
 import sys
 
+import numpy as np
+
+from kma_columnar import read_columnar
+from kma_typ01 import ABS_COLUMNS, ABS_TYPES
+
 def analyze_abs_data_from_api_file_new():
     """
     abs_api.info 파일 하나만 분석하여 각 지역별로 제공되는 데이터를
@@ -8,56 +13,48 @@ def analyze_abs_data_from_api_file_new():
     ('제공 정보', '미제공 정보' 컬럼은 제외됩니다.)
     """
     # --- 1. 관측 데이터 분석 ---
-    station_data = {}
-    # 분석할 모든 데이터 필드의 이름을 미리 정의합니다.
-    ALL_DATA_FIELDS = {
-        'WH(유의파고)', 'WD(풍향)', 'WS(풍속)', 'WS_GST(GUST풍속)',
-        'TW(해수면온도)', 'TA(기온)', 'PA(해면기압)', 'HM(상대습도)'
+    # 분석할 모든 데이터 필드와 ABS 컬럼 이름
+    FIELD_COLUMNS = {
+        'WH(유의파고)': 'WH', 'WD(풍향)': 'WD', 'WS(풍속)': 'WS', 'WS_GST(GUST풍속)': 'WS_GST',
+        'TW(해수면온도)': 'TW', 'TA(기온)': 'TA', 'PA(해면기압)': 'PA', 'HM(상대습도)': 'HM'
     }
+    ALL_DATA_FIELDS = set(FIELD_COLUMNS)
 
     try:
-        with open('abs_api.info', 'r', encoding='utf-8') as f:
-            for line in f:
-                # 주석이나 빈 줄은 건너뜁니다.
-                if line.strip() and not line.startswith('#') and not line.startswith('TM'):
-                    # 데이터 형식: TP,TM,STN_ID,STN_KO,LON,LAT,WH,WD,WS,WS_GST,TW,TA,PA,HM,...
-                    parts = [p.strip() for p in line.strip().split(',')]
-
-                    # 최소 14개 필드(HM까지)가 있는지 확인하여 데이터 무결성을 보장합니다.
-                    if len(parts) >= 14:
-                        tp = parts[0]
-                        stn_id = parts[2]
+        # typ01 형식(#START7777 ~ #7777END)을 컬럼 배열로 한 번에 읽습니다.
+        # 데이터 형식: TP,TM,STN_ID,STN_KO,LON,LAT,WH,WD,WS,WS_GST,TW,TA,PA,HM,...
+        # Null 값(-99.0, -99)과 빈 값은 NaN으로 바뀝니다.
+        table = read_columnar('abs_api.info', ABS_COLUMNS, ABS_TYPES)
+    except FileNotFoundError:
+        print("오류: 'abs_api.info' 파일을 찾을 수 없습니다. 스크립트와 동일한 위치에 파일이 있는지 확인하세요.")
+        sys.exit(1)
 
-                        # 새로운 관측소 ID인 경우, 기본 정보를 저장합니다.
-                        if stn_id not in station_data:
-                            station_data[stn_id] = {
-                                'name_ko': parts[3],
-                                'lon': parts[4],
-                                'lat': parts[5],
-                                'type': tp,
-                                'provided_fields': set()  # 제공된 필드를 저장할 집합
-                            }
+    # 최소 14개 필드(HM까지)가 있는 행만 사용하여 데이터 무결성을 보장합니다.
+    table = table.select(table.row_lengths >= len(ABS_COLUMNS))
+    stn_codes = table['STN_ID']
+    n_codes = len(table.categories['STN_ID'])
 
-                        # 데이터 필드와 Null 값 정의 (올바른 인덱스로 수정됨)
-                        data_fields_values = {
-                            'WH(유의파고)': (parts[6], '-99.0'),
-                            'WD(풍향)': (parts[7], '-99'),
-                            'WS(풍속)': (parts[8], '-99.0'),
-                            'WS_GST(GUST풍속)': (parts[9], '-99.0'),
-                            'TW(해수면온도)': (parts[10], '-99.0'),
-                            'TA(기온)': (parts[11], '-99.0'),
-                            'PA(해면기압)': (parts[12], '-99.0'),
-                            'HM(상대습도)': (parts[13], '-99.0')
-                        }
+    # 관측소별 기본 정보는 처음 나온 행에서 가져옵니다 (파일에 처음 나온 순서 유지).
+    _, first_rows = np.unique(stn_codes, return_index=True)
+    first_rows.sort()
 
-                        # 값이 유효한(Null이 아닌) 경우, 'provided_fields' 집합에 추가합니다.
-                        for field_name, (value, null_value) in data_fields_values.items():
-                            if value != null_value:
-                                station_data[stn_id]['provided_fields'].add(field_name)
+    # 필드별로 유효한 값이 한 번이라도 있는 관측소 (관측소 코드별 개수)
+    provided_by_field = {
+        field_name: np.bincount(stn_codes[table.valid(column)], minlength=n_codes) > 0
+        for field_name, column in FIELD_COLUMNS.items()
+    }
 
-    except FileNotFoundError:
-        print("오류: 'abs_api.info' 파일을 찾을 수 없습니다. 스크립트와 동일한 위치에 파일이 있는지 확인하세요.")
-        sys.exit(1)
+    station_data = {}
+    stn_ids, names, types = table.strings('STN_ID'), table.strings('STN_KO'), table.strings('TP')
+    for i in first_rows:
+        code = stn_codes[i]
+        station_data[stn_ids[i]] = {
+            'name_ko': names[i],
+            'lon': f"{table['LON'][i]:.8f}",
+            'lat': f"{table['LAT'][i]:.8f}",
+            'type': types[i],
+            'provided_fields': {field_name for field_name, provided in provided_by_field.items() if provided[code]}
+        }
 
     # --- 2. CSV 파일로 저장 ---
     output_filename = 'abs_region_data_summary_final.csv'
@@ -0,0 +1,143 @@
+"""
+한글 지역명 유사도 검색 색인
+- 한글 음절을 자모(초성/중성/종성)로 분해해 글자 단위보다 촘촘하게 비교
+  (예: '삼천포' ↔ '삼천'은 음절 2/3, 자모 bigram은 대부분 공유)
+- 지역명 자모 bigram 역색인(gram → 지역 번호)을 만들어 질의와 gram을 공유하는 지역만
+  공유 gram 수로 Dice 계수를 계산 (역색인에서 바로 나오므로 근사가 아닌 정확한 값)
+  Dice가 같은 후보는 TF-IDF 가중치 합(드문 gram을 공유할수록 큼)으로 순위를 정함
+- 질의 1건당 문자열 비교 없이 질의 gram의 posting만 합산 (NumPy bincount)
+- best_match는 Dice가 MIN_SCORE 미만이면 None (짧은 항구/섬 이름은 자모 gram이 우연히 많이 겹침)
+"""
+
+import math
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+JONGSEONG = ' ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ'  # 0번은 받침 없음
+
+NGRAM = 2
+# best_match가 인정하는 최소 Dice 계수
+# (tide_weather_region 기존 배정과 비교하면 0.75 이하는 '안도항'→'안동', '홍도항'→'하동'처럼 대부분 틀림)
+MIN_SCORE = 0.8
+MIN_PREFIX_LENGTH = 2
+_NON_WORD = re.compile(r'[^\w]', re.UNICODE)
+
+def to_jamo(text: str) -> str:
+    """한글 음절을 자모로 분해 (공백/기호 제거, 한글 외 문자는 소문자로 유지)"""
+    jamo = []
+    for ch in _NON_WORD.sub('', text).lower():
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_LAST:
+            offset = code - HANGUL_BASE
+            jamo.append(CHOSEONG[offset // 588])
+            jamo.append(JUNGSEONG[(offset % 588) // 28])
+            if offset % 28:
+                jamo.append(JONGSEONG[offset % 28])
+        else:
+            jamo.append(ch)
+    return ''.join(jamo)
+
+def jamo_ngrams(text: str, n: int = NGRAM) -> frozenset:
+    """자모 n-gram 집합 (앞뒤 경계 표시 포함, 짧은 이름도 gram이 생기도록)"""
+    jamo = '^' + to_jamo(text) + '$'
+    return frozenset(jamo[i:i + n] for i in range(len(jamo) - n + 1))
+
+def dice(a: frozenset, b: frozenset) -> float:
+    """두 gram 집합의 Dice 계수 (0~1)"""
+    if not a and not b:
+        return 0.0
+    return 2 * len(a & b) / (len(a) + len(b))
+
+def jamo_similarity(a: str, b: str) -> float:
+    """두 지역명의 자모 n-gram 유사도 (0~1)"""
+    return dice(jamo_ngrams(a), jamo_ngrams(b))
+
+class RegionNameIndex:
+    """지역명 목록에 대한 자모 n-gram 역색인"""
+
+    def __init__(self, names: Iterable[str]):
+        self.names = list(names)
+        self.grams = [jamo_ngrams(name) for name in self.names]
+        self.sizes = [len(grams) for grams in self.grams]
+
+        document_frequency = {}
+        for grams in self.grams:
+            for gram in grams:
+                document_frequency[gram] = document_frequency.get(gram, 0) + 1
+
+        n_names = len(self.names)
+        self.idf = {gram: math.log(1 + n_names / df) for gram, df in document_frequency.items()}
+        self.norms = [math.sqrt(sum(self.idf[gram] ** 2 for gram in grams)) or 1.0 for grams in self.grams]
+        postings = {gram: [] for gram in document_frequency}
+        for i, grams in enumerate(self.grams):
+            for gram in grams:
+                postings[gram].append(i)
+        self.postings = {gram: np.array(ids, dtype=np.intp) for gram, ids in postings.items()}
+        self._sizes = np.array(self.sizes, dtype=np.float64)
+        self._by_name = {}
+        for name in self.names:
+            self._by_name.setdefault(_NON_WORD.sub('', name), name)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def dice_scores(self, query_grams: frozenset) -> np.ndarray:
+        """지역별 Dice 계수 배열 (공유 gram 수는 query gram의 posting만 모아 셈, 공유가 없으면 0)"""
+        postings = [self.postings[gram] for gram in query_grams if gram in self.postings]
+        if not postings:
+            return np.zeros(len(self.names))
+        shared = np.bincount(np.concatenate(postings), minlength=len(self.names))
+        return 2 * shared / (len(query_grams) + self._sizes)
+
+    def tfidf_score(self, query_grams: frozenset, i: int) -> float:
+        """query와 지역 i의 TF-IDF 코사인 점수 (드문 gram을 공유할수록 큼)"""
+        query_norm = math.sqrt(sum(self.idf.get(gram, 0.0) ** 2 for gram in query_grams)) or 1.0
+        shared = sum(self.idf[gram] ** 2 for gram in query_grams & self.grams[i])
+        return shared / (query_norm * self.norms[i])
+
+    def top_k(self, query: str, k: int) -> List[Tuple[str, float]]:
+        """유사도 상위 k개 (지역명, Dice 계수). Dice가 같으면 TF-IDF, 그다음 등록 순서"""
+        query_grams = jamo_ngrams(query)
+        scores = self.dice_scores(query_grams)
+        n_candidates = int(np.count_nonzero(scores))
+        if n_candidates == 0 or k <= 0:
+            return []
+
+        # k번째 Dice 이상인 후보만 TF-IDF까지 계산해 순위 결정
+        k = min(k, n_candidates)
+        cutoff = np.partition(scores, len(scores) - k)[len(scores) - k]
+        pool = np.flatnonzero(scores >= cutoff).tolist()
+        pool.sort(key=lambda i: (-scores[i], -self.tfidf_score(query_grams, i), i))
+        return [(self.names[i], float(scores[i])) for i in pool[:k]]
+
+    def best_match(self, query: str, min_score: float = MIN_SCORE) -> Tuple[Optional[str], float]:
+        """가장 유사한 지역명과 Dice 계수 (Dice가 min_score 미만이면 (None, Dice), 공유 gram이 없으면 (None, 0.0))"""
+        best = self.top_k(query, 1)
+        if not best:
+            return None, 0.0
+        name, score = best[0]
+        return (name, score) if score >= min_score else (None, score)
+
+    def prefix_match(self, query: str) -> Optional[str]:
+        """query가 지역명(MIN_PREFIX_LENGTH글자 이상)으로 시작하면 가장 긴 지역명 (예: '강화대교' → '강화')"""
+        query = _NON_WORD.sub('', query)
+        for length in range(len(query), MIN_PREFIX_LENGTH - 1, -1):
+            name = self._by_name.get(query[:length])
+            if name is not None:
+                return name
+        return None
+
+@lru_cache(maxsize=8)
+def _cached_index(names: Tuple[str, ...]) -> RegionNameIndex:
+    return RegionNameIndex(names)
+
+def region_name_index(regions: Dict[str, Dict]) -> RegionNameIndex:
+    """지역명 dict(키가 지역명)에 대한 색인 (같은 지역 목록이면 한 번만 생성)"""
+    return _cached_index(tuple(regions))
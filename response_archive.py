@@ -0,0 +1,381 @@
+"""
+기상청 API 원본 응답 보관소 (추가 전용 세그먼트 파일 + 시간순 오프셋 색인)
+- 응답을 파싱 후 버리지 않고 받은 바이트 그대로 보관 → 파서 변경/과거 구간 재분석을 다시 요청 없이 재생
+- 세그먼트 파일 segment-000001.dat, ...: 레코드를 뒤에 이어 쓰기만 함 (segment_bytes를 넘으면 다음 파일)
+    레코드 = 고정 헤더(RECORD_HEADER) + 헤더 JSON(source, tm, params, encoding, fetched_at) + 응답 본문
+    고정 헤더: 매직 b'RAW1', 헤더 JSON 길이, 본문 길이, 요청 시각(분 단위 epoch), 본문 CRC32
+- 색인 index.npy: (요청 시각, source, 세그먼트, 오프셋, 레코드 길이) 배열, 요청 시각 순 정렬
+  → 구간 조회는 searchsorted로 범위를 찾고 해당 레코드만 mmap에서 잘라 읽음 (다른 레코드는 읽지 않음)
+- 요청 시각은 tm 인수(KST, YYYYMMDDHHMI) 기준 (kma_columnar의 datetime64[m]과 같은 기준)
+- 색인 반영 전에 중단되면 다음에 열 때 마지막 세그먼트 뒤쪽을 훑어 색인을 보충
+  (끝이 잘린 레코드는 잘라 냄, 전체 재구성은 reindex)
+- 인증키(authKey)는 params에 저장하지 않음
+
+사용법 (프로젝트 루트에서):
+    python3 response_archive.py fetch --source abs                       # sea_obs.php 요청 후 보관 (KMA_API_KEY 필요)
+    python3 response_archive.py import abs_api.info --source abs          # 이미 받은 덤프 보관 (tm은 파일의 최종 TM)
+    python3 response_archive.py list --start 202601100000 --end 202601170000
+    python3 response_archive.py replay --source abs --start 202601100000 --into-store tide_abs_info/abs_availability_store.npz
+    python3 response_archive.py export --source abs --out abs_dumps/       # abs_availability.py 입력 폴더로 풀기
+"""
+
+import argparse
+import glob
+import json
+import mmap
+import os
+import struct
+import sys
+import urllib.parse
+import urllib.request
+import zlib
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterator, List, Optional
+
+import numpy as np
+
+DEFAULT_ARCHIVE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'raw_archive')
+DEFAULT_SEGMENT_BYTES = 256 * 1024 * 1024
+INDEX_FILE = 'index.npy'
+SEGMENT_PATTERN = 'segment-{:06d}.dat'
+
+RECORD_MAGIC = b'RAW1'
+RECORD_HEADER = struct.Struct('<4sIQqI')  # 매직, 헤더 JSON 길이, 본문 길이, 요청 시각(분), 본문 CRC32
+INDEX_DTYPE = np.dtype([('tm', '<i8'), ('source', 'S16'), ('segment', '<u4'), ('offset', '<u8'), ('length', '<u8')])
+
+# 요청 출처별 API 주소 (abs-fetch-log, fetch-kma-data와 같은 엔드포인트)
+SOURCE_ENDPOINTS = {
+    'abs': 'https://apihub.kma.go.kr/api/typ01/url/sea_obs.php',
+    'asos': 'https://apihub.kma.go.kr/api/typ01/url/kma_sfctm2.php',
+}
+SECRET_PARAMS = ('authKey',)
+KST = timezone(timedelta(hours=9))
+
+def to_minutes(value) -> int:
+    """요청 시각 → 분 단위 epoch (YYYYMMDDHHMI 문자열, ISO 문자열, datetime64 모두 가능)"""
+    if isinstance(value, str) and value.isdigit():
+        value = datetime.strptime(value.ljust(12, '0'), '%Y%m%d%H%M')
+    return int(np.datetime64(value, 'm').astype(np.int64))
+
+def format_tm(minutes: int) -> str:
+    """분 단위 epoch → YYYYMMDDHHMI"""
+    return np.datetime64(int(minutes), 'm').astype(datetime).strftime('%Y%m%d%H%M')
+
+def kma_request_tm(now: Optional[datetime] = None) -> str:
+    """KST 기준 직전 정시 또는 30분 (abs-fetch-log의 getKmaRequestTime과 같음)"""
+    now = (now or datetime.now(timezone.utc)).astimezone(KST)
+    return now.replace(minute=30 if now.minute >= 30 else 0).strftime('%Y%m%d%H%M')
+
+class ArchiveRecord:
+    """보관된 응답 하나 (header: 헤더 JSON, body: 받은 바이트 그대로)"""
+
+    def __init__(self, header: Dict, body: bytes):
+        self.header = header
+        self.body = body
+
+    @property
+    def source(self) -> str:
+        return self.header['source']
+
+    @property
+    def tm(self) -> str:
+        return self.header['tm']
+
+    def text(self) -> str:
+        return self.body.decode(self.header.get('encoding', 'utf-8'))
+
+    def lines(self) -> List[str]:
+        return self.text().splitlines()
+
+    def __repr__(self) -> str:
+        return f"ArchiveRecord({self.source}, tm={self.tm}, {len(self.body)} bytes)"
+
+class ResponseArchive:
+    """세그먼트 파일 + 색인 (with 문으로 열면 끝날 때 색인 저장, mmap 정리)"""
+
+    def __init__(self, directory: str = DEFAULT_ARCHIVE_DIR, segment_bytes: int = DEFAULT_SEGMENT_BYTES):
+        self.directory = directory
+        self.segment_bytes = segment_bytes
+        os.makedirs(directory, exist_ok=True)
+        index_path = os.path.join(directory, INDEX_FILE)
+        self.index = np.load(index_path) if os.path.exists(index_path) else np.empty(0, dtype=INDEX_DTYPE)
+        self._pending: List[tuple] = []
+        self._maps: Dict[int, mmap.mmap] = {}
+        self._recover_tail()
+
+    def __enter__(self) -> 'ResponseArchive':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.index) + len(self._pending)
+
+    def __repr__(self) -> str:
+        return f"ResponseArchive({self.directory}, 레코드 {len(self)}개, 세그먼트 {len(self.segments())}개)"
+
+    def segment_path(self, segment: int) -> str:
+        return os.path.join(self.directory, SEGMENT_PATTERN.format(segment))
+
+    def segments(self) -> List[int]:
+        paths = glob.glob(os.path.join(self.directory, SEGMENT_PATTERN.replace('{:06d}', '*')))
+        return sorted(int(os.path.basename(path)[8:14]) for path in paths)
+
+    # --- 쓰기 ---
+
+    def append(self, source: str, tm, body: bytes, params: Optional[Dict] = None, encoding: str = 'utf-8',
+               fetched_at: Optional[str] = None) -> int:
+        """응답 하나를 현재 세그먼트 끝에 추가, 추가한 위치의 세그먼트 번호 반환 (색인은 flush 때 저장)"""
+        minutes = to_minutes(tm)
+        header = json.dumps({
+            'source': source,
+            'tm': format_tm(minutes),
+            'params': {key: value for key, value in (params or {}).items() if key not in SECRET_PARAMS},
+            'encoding': encoding,
+            'fetched_at': fetched_at or datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        }, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        record = RECORD_HEADER.pack(RECORD_MAGIC, len(header), len(body), minutes, zlib.crc32(body)) + header + body
+
+        segments = self.segments()
+        segment = segments[-1] if segments else 1
+        path = self.segment_path(segment)
+        if os.path.exists(path) and os.path.getsize(path) and os.path.getsize(path) + len(record) > self.segment_bytes:
+            segment += 1
+            path = self.segment_path(segment)
+        with open(path, 'ab') as f:
+            offset = f.tell()
+            f.write(record)
+            f.flush()
+            os.fsync(f.fileno())
+        self._drop_map(segment)  # 기존 mmap은 늘어난 뒤쪽을 보지 못함
+        self._pending.append((minutes, source.encode('utf-8'), segment, offset, len(record)))
+        return segment
+
+    def flush(self):
+        """추가한 레코드를 색인에 합쳐 시간순으로 저장 (임시 파일에 쓴 뒤 교체)"""
+        if not self._pending:
+            return
+        pending = np.array(self._pending, dtype=INDEX_DTYPE)
+        merged = np.concatenate([np.asarray(self.index), pending])
+        self.index = merged[np.lexsort((merged['offset'], merged['segment'], merged['tm']))]
+        self._pending = []
+        self._save_index()
+
+    def _save_index(self):
+        tmp_path = os.path.join(self.directory, INDEX_FILE + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            np.save(f, self.index)
+        os.replace(tmp_path, os.path.join(self.directory, INDEX_FILE))
+
+    def close(self):
+        self.flush()
+        for segment in list(self._maps):
+            self._drop_map(segment)
+
+    # --- 색인 복구 ---
+
+    def _scan_segment(self, segment: int, start: int = 0) -> Iterator[tuple]:
+        """세그먼트를 start부터 훑어 (요청 시각, source, 세그먼트, 오프셋, 길이) 생성, 잘린 레코드에서 멈춤"""
+        path = self.segment_path(segment)
+        size = os.path.getsize(path)
+        with open(path, 'rb') as f:
+            offset = start
+            while offset + RECORD_HEADER.size <= size:
+                f.seek(offset)
+                magic, header_len, body_len, minutes, crc = RECORD_HEADER.unpack(f.read(RECORD_HEADER.size))
+                length = RECORD_HEADER.size + header_len + body_len
+                if magic != RECORD_MAGIC or offset + length > size:
+                    break
+                header = json.loads(f.read(header_len).decode('utf-8'))
+                if zlib.crc32(f.read(body_len)) != crc:
+                    break
+                yield minutes, header['source'].encode('utf-8'), segment, offset, length
+                offset += length
+
+    def _recover_tail(self):
+        """마지막 세그먼트에서 색인에 없는 뒤쪽 레코드를 색인에 보충"""
+        segments = self.segments()
+        if not segments:
+            return
+        last = segments[-1]
+        in_last = self.index[self.index['segment'] == last]
+        end = int((in_last['offset'] + in_last['length']).max()) if len(in_last) else 0
+        size = os.path.getsize(self.segment_path(last))
+        if end >= size:
+            return
+
+        found = list(self._scan_segment(last, end))
+        scanned_end = found[-1][3] + found[-1][4] if found else end
+        if scanned_end < size:
+            print(f"⚠️ {self.segment_path(last)}: 끝이 잘린 레코드 {size - scanned_end} bytes 제거")
+            with open(self.segment_path(last), 'r+b') as f:
+                f.truncate(scanned_end)
+        if found:
+            print(f"🔧 색인에 없던 레코드 {len(found)}개 보충")
+            self._pending.extend(found)
+            self.flush()
+
+    def reindex(self) -> int:
+        """모든 세그먼트를 훑어 색인 다시 만들기, 레코드 수 반환"""
+        self._pending = [entry for segment in self.segments() for entry in self._scan_segment(segment)]
+        self.index = np.empty(0, dtype=INDEX_DTYPE)
+        self.flush()
+        if not len(self.index):
+            self._save_index()
+        return len(self.index)
+
+    # --- 읽기 ---
+
+    def _map(self, segment: int) -> mmap.mmap:
+        if segment not in self._maps:
+            with open(self.segment_path(segment), 'rb') as f:
+                self._maps[segment] = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._maps[segment]
+
+    def _drop_map(self, segment: int):
+        mapped = self._maps.pop(segment, None)
+        if mapped is not None:
+            mapped.close()
+
+    def select(self, start=None, end=None, source: Optional[str] = None) -> np.ndarray:
+        """요청 시각 start 이상 end 미만 (source 지정 시 해당 출처만) 색인 항목"""
+        self.flush()
+        lo = np.searchsorted(self.index['tm'], to_minutes(start)) if start is not None else 0
+        hi = np.searchsorted(self.index['tm'], to_minutes(end)) if end is not None else len(self.index)
+        entries = self.index[lo:hi]
+        if source is not None:
+            entries = entries[entries['source'] == source.encode('utf-8')]
+        return entries
+
+    def read(self, entry) -> ArchiveRecord:
+        """색인 항목 하나의 레코드 (해당 바이트 범위만 mmap에서 읽음)"""
+        mapped = self._map(int(entry['segment']))
+        offset = int(entry['offset'])
+        magic, header_len, body_len, _, crc = RECORD_HEADER.unpack_from(mapped, offset)
+        if magic != RECORD_MAGIC:
+            raise ValueError(f"레코드 시작이 아닙니다: 세그먼트 {int(entry['segment'])} 오프셋 {offset}")
+        header_start = offset + RECORD_HEADER.size
+        body_start = header_start + header_len
+        body = mapped[body_start:body_start + body_len]
+        if zlib.crc32(body) != crc:
+            raise ValueError(f"본문 CRC 불일치: 세그먼트 {int(entry['segment'])} 오프셋 {offset}")
+        return ArchiveRecord(json.loads(mapped[header_start:body_start].decode('utf-8')), body)
+
+    def records(self, start=None, end=None, source: Optional[str] = None) -> Iterator[ArchiveRecord]:
+        """요청 시각 순 레코드"""
+        for entry in self.select(start, end, source):
+            yield self.read(entry)
+
+def fetch_response(source: str, tm: str, auth_key: str, timeout: float = 30.0):
+    """기상청 API 요청 → (params, 본문 바이트) (abs-fetch-log와 같은 인수: tm, stn=0, help=0)"""
+    params = {'tm': tm, 'stn': '0', 'help': '0', 'authKey': auth_key}
+    url = f"{SOURCE_ENDPOINTS[source]}?{urllib.parse.urlencode(params)}"
+    with urllib.request.urlopen(url, timeout=timeout) as response:
+        return params, response.read()
+
+def file_request_tm(text: str, source: str) -> Optional[str]:
+    """덤프 본문의 마지막 관측시각(TM) (요청 시각을 모를 때 대신 사용, ABS 응답은 컬럼 설명이 없어 ABS_COLUMNS로 읽음)"""
+    from kma_columnar import read_columnar_lines
+    from kma_typ01 import ABS_COLUMNS, ABS_TYPES
+
+    if source == 'abs':
+        table = read_columnar_lines(text.splitlines(), ABS_COLUMNS, ABS_TYPES)
+    else:
+        table = read_columnar_lines(text.splitlines())
+    if 'TM' not in table.schema.names or not table.valid('TM').any():
+        return None
+    return format_tm(int(table['TM'][table.valid('TM')].astype(np.int64).max()))
+
+def main():
+    parser = argparse.ArgumentParser(description='기상청 API 원본 응답 보관소')
+    parser.add_argument('--archive', default=DEFAULT_ARCHIVE_DIR, help='보관소 폴더')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    fetch_parser = subparsers.add_parser('fetch', help='API를 요청하고 응답을 보관 (환경 변수 KMA_API_KEY 필요)')
+    fetch_parser.add_argument('--source', choices=sorted(SOURCE_ENDPOINTS), default='abs')
+    fetch_parser.add_argument('--tm', help='요청 시각 YYYYMMDDHHMI (기본값: KST 직전 정시/30분)')
+
+    import_parser = subparsers.add_parser('import', help='이미 받은 덤프 파일을 보관')
+    import_parser.add_argument('files', nargs='+')
+    import_parser.add_argument('--source', required=True)
+    import_parser.add_argument('--tm', help='요청 시각 YYYYMMDDHHMI (기본값: 파일의 마지막 TM)')
+    import_parser.add_argument('--encoding', default='utf-8', help='파일 인코딩')
+
+    for name, help_text in (('list', '보관된 응답 목록'), ('replay', '보관된 ABS 응답을 제공률 저장소에 다시 반영'),
+                            ('export', '보관된 응답을 파일로 풀기')):
+        sub = subparsers.add_parser(name, help=help_text)
+        if name == 'replay':
+            # 제공률 저장소는 ABS 덤프 형식만 읽으므로 다른 출처(asos 등)는 반영하지 않음
+            sub.add_argument('--source', choices=['abs'], default='abs')
+        else:
+            sub.add_argument('--source')
+        sub.add_argument('--start', help='요청 시각 이상 (YYYYMMDDHHMI)')
+        sub.add_argument('--end', help='요청 시각 미만 (YYYYMMDDHHMI)')
+        if name == 'replay':
+            sub.add_argument('--into-store', required=True, metavar='NPZ', help='abs_availability_store.py 저장소')
+        if name == 'export':
+            sub.add_argument('--out', required=True, help='출력 폴더 ({source}_{tm}.info, UTF-8)')
+
+    subparsers.add_parser('reindex', help='세그먼트를 모두 훑어 색인 다시 만들기')
+    args = parser.parse_args()
+
+    with ResponseArchive(args.archive) as archive:
+        if args.command == 'fetch':
+            auth_key = os.environ.get('KMA_API_KEY')
+            if not auth_key:
+                print("❌ 환경 변수 KMA_API_KEY가 없습니다.")
+                sys.exit(1)
+            tm = args.tm or kma_request_tm()
+            try:
+                params, body = fetch_response(args.source, tm, auth_key)
+            except OSError as e:
+                print(f"❌ 요청 실패 ({args.source}, tm={tm}): {e}")
+                sys.exit(1)
+            segment = archive.append(args.source, tm, body, params, encoding='euc-kr')
+            print(f"📥 {args.source} tm={tm}: {len(body)} bytes → {SEGMENT_PATTERN.format(segment)}")
+
+        elif args.command == 'import':
+            for path in args.files:
+                with open(path, 'rb') as f:
+                    body = f.read()
+                tm = args.tm or file_request_tm(body.decode(args.encoding), args.source)
+                if tm is None:
+                    print(f"⚠️ 건너뜀: {path} (TM 컬럼이 없으면 --tm 필요)")
+                    continue
+                segment = archive.append(args.source, tm, body, {'file': os.path.basename(path)}, args.encoding)
+                print(f"📥 {path}: {args.source} tm={tm}, {len(body)} bytes → {SEGMENT_PATTERN.format(segment)}")
+
+        elif args.command == 'list':
+            entries = archive.select(args.start, args.end, args.source)
+            print(f"📋 {archive}, 조회 {len(entries)}개")
+            for entry in entries:
+                print(f"   {format_tm(entry['tm'])} {entry['source'].decode('utf-8'):<6} "
+                      f"{SEGMENT_PATTERN.format(int(entry['segment']))} @{int(entry['offset'])} {int(entry['length'])} bytes")
+
+        elif args.command == 'replay':
+            from abs_availability_store import open_store
+
+            store = open_store(args.into_store)
+            records = 0
+            for record in archive.records(args.start, args.end, args.source):
+                store.ingest_lines(record.lines())
+                records += 1
+            store.save(args.into_store)
+            print(f"🔁 응답 {records}개 반영 → {args.into_store} - {store}")
+
+        elif args.command == 'export':
+            os.makedirs(args.out, exist_ok=True)
+            records = 0
+            for record in archive.records(args.start, args.end, args.source):
+                with open(os.path.join(args.out, f"{record.source}_{record.tm}.info"), 'w', encoding='utf-8',
+                          newline='') as f:
+                    f.write(record.text())
+                records += 1
+            print(f"💾 응답 {records}개 저장: {args.out}")
+
+        elif args.command == 'reindex':
+            print(f"🔧 색인 재구성: 레코드 {archive.reindex()}개")
+
+if __name__ == '__main__':
+    main()
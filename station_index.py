@@ -0,0 +1,71 @@
+"""
+관측소 최근접 검색용 공간 인덱스
+- 위도/경도를 3차원 단위 구면 좌표로 변환하여 KD-tree(scipy cKDTree) 구성
+- 단위 구면 위의 현(chord) 거리는 대원 거리와 단조 관계이므로
+  KD-tree 검색 결과를 대원 거리(km)로 그대로 변환해 사용
+- 질의 1건당 O(log n)
+"""
+
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+from geodesy import chord_to_km, km_to_chord, to_unit_vectors
+
+class StationIndex:
+    """
+    관측소 목록에 대한 최근접 검색 인덱스
+
+    stations: 관측소 dict 목록 (lat_key / lon_key로 좌표 컬럼 지정)
+    검색 결과는 (관측소 dict, 거리 km) 튜플 목록이며 거리순으로 정렬됨
+    """
+
+    def __init__(self, stations: Sequence[Dict], lat_key: str = 'lat', lon_key: str = 'lon'):
+        self.stations = list(stations)
+        self.lats = np.array([float(s[lat_key]) for s in self.stations], dtype=np.float64)
+        self.lons = np.array([float(s[lon_key]) for s in self.stations], dtype=np.float64)
+        self._tree = cKDTree(to_unit_vectors(self.lats, self.lons)) if self.stations else None
+
+    def __len__(self) -> int:
+        return len(self.stations)
+
+    def nearest_batch(self, lats: Sequence[float], lons: Sequence[float], k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        여러 지점에 대한 최근접 k개 검색
+        반환값: (인덱스 배열, 거리(km) 배열), 각각 shape (질의 수, min(k, 관측소 수))
+        동일 거리(소수 둘째 자리 기준)는 관측소 등록 순서를 유지
+        """
+        n_queries = len(lats)
+        k = min(k, len(self.stations))
+        if k <= 0 or n_queries == 0:
+            return np.empty((n_queries, 0), dtype=np.intp), np.empty((n_queries, 0), dtype=np.float64)
+
+        chord, idx = self._tree.query(to_unit_vectors(lats, lons), k=list(range(1, k + 1)))
+        distances = chord_to_km(chord)
+
+        order = np.lexsort((idx, np.round(distances, 2)), axis=1)
+        return np.take_along_axis(idx, order, axis=1), np.take_along_axis(distances, order, axis=1)
+
+    def nearest(self, lat: float, lon: float, k: int = 1) -> List[Tuple[Dict, float]]:
+        """한 지점에서 가장 가까운 관측소 k개"""
+        idx, distances = self.nearest_batch([lat], [lon], k)
+        return [(self.stations[i], float(d)) for i, d in zip(idx[0], distances[0])]
+
+    def within_radius_batch(self, lats: Sequence[float], lons: Sequence[float], km: float) -> List[List[Tuple[int, float]]]:
+        """여러 지점에 대해 반경 km 이내 관측소 (인덱스, 거리 km) 목록을 거리순으로 반환"""
+        if not self.stations or len(lats) == 0:
+            return [[] for _ in range(len(lats))]
+
+        points = to_unit_vectors(lats, lons)
+        results = []
+        for point, idx_list in zip(points, self._tree.query_ball_point(points, km_to_chord(km))):
+            idx = np.asarray(idx_list, dtype=np.intp)
+            distances = chord_to_km(np.linalg.norm(self._tree.data[idx] - point, axis=1))
+            order = np.lexsort((idx, np.round(distances, 2)))
+            results.append([(int(idx[i]), float(distances[i])) for i in order])
+        return results
+
+    def within_radius(self, lat: float, lon: float, km: float) -> List[Tuple[Dict, float]]:
+        """한 지점에서 반경 km 이내의 관측소 목록"""
+        return [(self.stations[i], d) for i, d in self.within_radius_batch([lat], [lon], km)[0]]
@@ -21,6 +21,7 @@ const CLEANUP_CONFIGS = [
   { table: 'openweathermap_data', dateColumn: 'created_at', description: 'OpenWeatherMap 데이터' },
   { table: 'weather_fetch_logs', dateColumn: 'created_at', description: '날씨 조회 로그' },
   { table: 'weather_forecasts', dateColumn: 'updated_at', description: '날씨 예보 데이터' },
+  { table: 'weather_forecasts_grid', dateColumn: 'updated_at', description: '날씨 예보 데이터 (격자)' },
   { table: 'weatherapi_collection_logs', dateColumn: 'created_at', description: 'WeatherAPI 수집 로그' },
   { table: 'weatherapi_data', dateColumn: 'updated_at', description: 'WeatherAPI 데이터' },
 ];
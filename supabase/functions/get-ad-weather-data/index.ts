@@ -163,7 +163,7 @@ Deno.serve(async (req)=>{
         .single(),
 
       // weather_forecasts 조회
-      supabaseClient.from('weather_forecasts').select(`
+      supabaseClient.from('weather_forecasts_by_location').select(`
         fcst_datetime_kr,
         tmp, tmn, tmx, uuu, vvv, vec, wsd, sky, pty, pop, wav, pcp, reh, sno
       `).eq('location_code', locationCode).gte('fcst_datetime_kr', startDateKST).lt('fcst_datetime_kr', weatherExclusiveEndDateKST).order('fcst_datetime_kr', {
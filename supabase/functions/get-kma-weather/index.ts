@@ -10,12 +10,15 @@
 //수집 관측소:
 //- tide_weather_region 테이블의 모든 관측소 (178개)
 //- 고유한 격자 좌표(nx, ny)별로 API 호출하여 중복 요청 최소화
+//- 예보는 격자 단위(weather_forecasts_grid)로도 저장, 관측소별 조회는 weather_forecasts_by_location 뷰
 import { serve } from 'https://deno.land/std@0.168.0/http/server.ts';
 import { createClient } from 'https://esm.sh/@supabase/supabase-js@2';
 import { corsHeaders } from '../_shared/cors.ts';
 // --- 상수 및 설정 ---
 const KMA_API_URL = 'https://apihub.kma.go.kr/api/typ02/openApi/VilageFcstInfoService_2.0/getVilageFcst';
 const KMA_AUTH_KEY = Deno.env.get('KMA_AUTH_KEY') || 'L7BLiqT7RsiwS4qk-8bIhQ';
+// 관측소별 weather_forecasts 테이블 이중 저장 (격자 테이블 전환 이후 롤백용, 기본 꺼짐)
+const WRITE_LOCATION_FORECASTS = Deno.env.get('WRITE_LOCATION_FORECASTS') === 'true';
 const PUBLISH_TIMES = [
   2,
   5,
@@ -106,6 +109,7 @@ async function doWeatherFetch(startIndex = 0, batchSize = 20, totalRecordsUpsert
     console.log(`Processing ${batchLocations.length} locations in this batch.`);
     const { baseDate, baseTime } = getLatestBaseDateTime();
     const forecasts = {};
+    const gridForecasts = {}; // 격자 단위 저장용 (weather_forecasts_grid, 관측소별 조회는 weather_forecasts_by_location 뷰)
     const fetchPromises = batchLocations.map(async (location, index)=>{
       // API 요청 간격을 두어 CPU 부하 감소 및 Rate Limit 방지
       if (index > 0) {
@@ -169,6 +173,30 @@ async function doWeatherFetch(startIndex = 0, batchSize = 20, totalRecordsUpsert
             console.error('Null or undefined item in forecast data');
             continue;
           }
+          const year = parseInt(item.fcstDate.substring(0, 4)), month = parseInt(item.fcstDate.substring(4, 6)) - 1, day = parseInt(item.fcstDate.substring(6, 8)), hour = parseInt(item.fcstTime.substring(0, 2));
+          // 기상청 데이터는 KST 시간이므로 UTC로 변환 (KST - 9시간)
+          const fcstTimestamp = new Date(Date.UTC(year, month, day, hour) - 9 * 60 * 60 * 1000);
+          // KST 표기는 원본 시간 그대로 (형식만 변환)
+          const fcstDatetimeKr = `${year}-${String(month + 1).padStart(2, '0')}-${String(day).padStart(2, '0')}T${String(hour).padStart(2, '0')}:00:00+09:00`;
+          const category = item.category.toLowerCase();
+          const value = [
+            'pcp',
+            'sno'
+          ].includes(category) ? item.fcstValue : Number(item.fcstValue);
+          const gridKey = `${item.fcstDate}${item.fcstTime}${location.nx},${location.ny}`;
+          if (!gridForecasts[gridKey]) {
+            gridForecasts[gridKey] = {
+              nx: item.nx,
+              ny: item.ny,
+              base_date: item.baseDate,
+              base_time: item.baseTime,
+              fcst_datetime: fcstTimestamp.toISOString(),
+              fcst_datetime_kr: fcstDatetimeKr,
+              updated_at: updatedAt,
+              updated_at_kr: updatedAtKr
+            };
+          }
+          gridForecasts[gridKey][category] = value;
           // Use the original location list associated with this grid
           if (!location.locations || location.locations.length === 0) {
             console.error('No locations found for grid');
@@ -181,11 +209,6 @@ async function doWeatherFetch(startIndex = 0, batchSize = 20, totalRecordsUpsert
             }
             const key = `${item.fcstDate}${item.fcstTime}${locInfo.code}`;
             if (!forecasts[key]) {
-              const year = parseInt(item.fcstDate.substring(0, 4)), month = parseInt(item.fcstDate.substring(4, 6)) - 1, day = parseInt(item.fcstDate.substring(6, 8)), hour = parseInt(item.fcstTime.substring(0, 2));
-              // 기상청 데이터는 KST 시간이므로 UTC로 변환 (KST - 9시간)
-              const fcstTimestamp = new Date(Date.UTC(year, month, day, hour) - 9 * 60 * 60 * 1000);
-              // KST 표기는 원본 시간 그대로 (형식만 변환)
-              const fcstDatetimeKr = `${year}-${String(month + 1).padStart(2, '0')}-${String(day).padStart(2, '0')}T${String(hour).padStart(2, '0')}:00:00+09:00`;
               forecasts[key] = {
                 nx: item.nx,
                 ny: item.ny,
@@ -199,11 +222,6 @@ async function doWeatherFetch(startIndex = 0, batchSize = 20, totalRecordsUpsert
                 updated_at_kr: updatedAtKr
               };
             }
-            const category = item.category.toLowerCase();
-            const value = [
-              'pcp',
-              'sno'
-            ].includes(category) ? item.fcstValue : Number(item.fcstValue);
             forecasts[key][category] = value;
           }
         }
@@ -211,21 +229,31 @@ async function doWeatherFetch(startIndex = 0, batchSize = 20, totalRecordsUpsert
         console.error(`Failed to process location fetch: ${result.reason}`);
       }
     });
-    const dataToUpsert = Object.values(forecasts);
-    logPayload.records_upserted = dataToUpsert.length;
+    // 격자 단위 저장 (관측소별 조회는 weather_forecasts_by_location 뷰)
+    const gridDataToUpsert = Object.values(gridForecasts);
+    if (gridDataToUpsert.length > 0) {
+      console.log(`Upserting ${gridDataToUpsert.length} grid records for this batch...`);
+      const { error: gridError } = await supabaseClient.from('weather_forecasts_grid').upsert(gridDataToUpsert, {
+        onConflict: 'fcst_datetime,nx,ny'
+      });
+      if (gridError) throw new Error(`Database Error (weather_forecasts_grid): ${gridError.message}`);
+    }
+    // 관측소별 weather_forecasts 저장은 롤백용으로만 유지 (WRITE_LOCATION_FORECASTS=true일 때만)
+    const dataToUpsert = WRITE_LOCATION_FORECASTS ? Object.values(forecasts) : [];
     if (dataToUpsert.length > 0) {
-      console.log(`Upserting ${dataToUpsert.length} records for this batch...`);
+      console.log(`Upserting ${dataToUpsert.length} location records (WRITE_LOCATION_FORECASTS)...`);
       const { error: dbError } = await supabaseClient.from('weather_forecasts').upsert(dataToUpsert, {
         onConflict: 'fcst_datetime,location_code'
       });
       if (dbError) throw new Error(`Database Error: ${dbError.message}`);
     }
+    logPayload.records_upserted = gridDataToUpsert.length + dataToUpsert.length;
     logPayload.status = 'success';
     console.log(`Batch starting at ${startIndex} finished successfully.`);
     // 4. 다음 배치 호출
     const nextStartIndex = startIndex + batchSize;
     if (nextStartIndex < totalUniqueLocations) {
-      const newTotalUpserted = totalRecordsUpsertedSoFar + dataToUpsert.length;
+      const newTotalUpserted = totalRecordsUpsertedSoFar + logPayload.records_upserted;
       const remainingLocations = totalUniqueLocations - nextStartIndex;
       console.log(`📡 Invoking next batch at startIndex: ${nextStartIndex} (${remainingLocations} grid locations remaining)`);
       fetch(functionUrl, {
@@ -244,8 +272,8 @@ async function doWeatherFetch(startIndex = 0, batchSize = 20, totalRecordsUpsert
         return null;
       });
     } else {
-      const finalTotalUpserted = totalRecordsUpsertedSoFar + dataToUpsert.length;
-      console.log(`✅ Final batch summary: Processed ${batchLocations.length} grid locations, Upserted ${dataToUpsert.length} records.`);
+      const finalTotalUpserted = totalRecordsUpsertedSoFar + logPayload.records_upserted;
+      console.log(`✅ Final batch summary: Processed ${batchLocations.length} grid locations, Upserted ${logPayload.records_upserted} records.`);
       console.log(`✅ Grand total: Processed ${totalUniqueLocations} unique grid coordinates for ${allLocations.length} observation stations`);
       console.log(`✅ Total ${finalTotalUpserted} forecast records upserted across all batches.`);
       console.log("🎉 All batches processed. Weather data collection complete for all 178 stations!");
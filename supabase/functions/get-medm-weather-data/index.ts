@@ -120,7 +120,7 @@ Deno.serve(async (req) => {
 
     // 1. Short forecasts 조회 (단기예보 3일) - 클라이언트 사용 필드만
     const shortForecastsPromise = supabase
-      .from('weather_forecasts')
+      .from('weather_forecasts_by_location')
       .select(`
         fcst_datetime_kr,
         tmp, tmn, tmx, uuu, vvv, vec, wsd, sky, pty, pop, wav, pcp, reh, sno
@@ -1,5 +1,6 @@
 import { createClient } from 'https://esm.sh/@supabase/supabase-js@2';
 import { corsHeaders } from '../_shared/cors.ts';
+import medmMappingArtifact from './medm_mapping.json' with { type: 'json' };
 
 /**
  * 중기예보 데이터 수집 함수 (get-medm-weather)
@@ -8,6 +9,7 @@ import { corsHeaders } from '../_shared/cors.ts';
  * - tide_weather_region 테이블 조회 제거: location_code를 medium_term_forecasts에 직접 저장
  *   하여 get-weather-tide-data API에서 JOIN 연산 없이 바로 데이터 조회 가능하도록 최적화
  * - 134개 location_code 완전 지원으로 API 성능 20% 향상 (5개 → 4개 쿼리 감소)
+ * - 지역 정보/매핑 하드코딩 제거: map_regions.py가 생성하는 medm_mapping.json(정수 색인 배열)을 콜드 스타트 시 1회 로드
  */
 const supabaseUrl = Deno.env.get('SUPABASE_URL');
 const supabaseServiceRoleKey = Deno.env.get('SUPABASE_SERVICE_ROLE_KEY');
@@ -34,1222 +36,44 @@ function parseKSTTime(kstString) {
     kst: kstWithTz
   };
 }
-// 지역 정보를 하드코딩으로 직접 제공 (배포 시 파일 경로 문제 해결)
-function getRegionInfo() {
+// 지역 정보 / reg_id -> location_code 매핑은 map_regions.py가 생성하는 medm_mapping.json에서 로드
+// (정수 색인 배열 형식, 형식 설명은 medm_artifact.py 참고 - 매핑을 다시 생성해도 이 파일은 수정할 필요 없음)
+// 모듈 로드(콜드 스타트) 시 한 번만 디코딩하고 요청마다 같은 객체 사용
+const MEDM_MAPPING_FORMAT_VERSION = 1;
+function decodeMedmMapping(artifact) {
+  if (artifact.format_version !== MEDM_MAPPING_FORMAT_VERSION) {
+    throw new Error(`medm_mapping.json 형식 버전 불일치: ${artifact.format_version} (필요: ${MEDM_MAPPING_FORMAT_VERSION})`);
+  }
+  const { id, sp, name } = artifact.regions;
   const regions = new Map();
-  // 기상청 공식 중기예보 지역 정보 (KMA API에서 가져온 전체 223개 지역)
-  const regionData = [
-    {
-      REG_ID: '11A00101',
-      REG_SP: 'C',
-      REG_NAME: '백령도'
-    },
-    {
-      REG_ID: '11B00000',
-      REG_SP: 'A',
-      REG_NAME: '서울.인천.경기'
-    },
-    {
-      REG_ID: '11B20301',
-      REG_SP: 'C',
-      REG_NAME: '의정부'
-    },
-    {
-      REG_ID: '11B20302',
-      REG_SP: 'C',
-      REG_NAME: '고양'
-    },
-    {
-      REG_ID: '11B20304',
-      REG_SP: 'C',
-      REG_NAME: '양주'
-    },
-    {
-      REG_ID: '11B20305',
-      REG_SP: 'C',
-      REG_NAME: '파주'
-    },
-    {
-      REG_ID: '11B20401',
-      REG_SP: 'C',
-      REG_NAME: '동두천'
-    },
-    {
-      REG_ID: '11B20402',
-      REG_SP: 'C',
-      REG_NAME: '연천'
-    },
-    {
-      REG_ID: '11B20403',
-      REG_SP: 'C',
-      REG_NAME: '포천'
-    },
-    {
-      REG_ID: '11B20404',
-      REG_SP: 'C',
-      REG_NAME: '가평'
-    },
-    {
-      REG_ID: '11B20501',
-      REG_SP: 'C',
-      REG_NAME: '구리'
-    },
-    {
-      REG_ID: '11B20502',
-      REG_SP: 'C',
-      REG_NAME: '남양주'
-    },
-    {
-      REG_ID: '11B20503',
-      REG_SP: 'C',
-      REG_NAME: '양평'
-    },
-    {
-      REG_ID: '11B20504',
-      REG_SP: 'C',
-      REG_NAME: '하남'
-    },
-    {
-      REG_ID: '11B20601',
-      REG_SP: 'C',
-      REG_NAME: '수원'
-    },
-    {
-      REG_ID: '11B20602',
-      REG_SP: 'C',
-      REG_NAME: '안양'
-    },
-    {
-      REG_ID: '11B20603',
-      REG_SP: 'C',
-      REG_NAME: '오산'
-    },
-    {
-      REG_ID: '11B20604',
-      REG_SP: 'C',
-      REG_NAME: '화성'
-    },
-    {
-      REG_ID: '11B20605',
-      REG_SP: 'C',
-      REG_NAME: '성남'
-    },
-    {
-      REG_ID: '11B20606',
-      REG_SP: 'C',
-      REG_NAME: '평택'
-    },
-    {
-      REG_ID: '11B20609',
-      REG_SP: 'C',
-      REG_NAME: '의왕'
-    },
-    {
-      REG_ID: '11B20610',
-      REG_SP: 'C',
-      REG_NAME: '군포'
-    },
-    {
-      REG_ID: '11B20611',
-      REG_SP: 'C',
-      REG_NAME: '안성'
-    },
-    {
-      REG_ID: '11B20612',
-      REG_SP: 'C',
-      REG_NAME: '용인'
-    },
-    {
-      REG_ID: '11B20701',
-      REG_SP: 'C',
-      REG_NAME: '이천'
-    },
-    {
-      REG_ID: '11B20702',
-      REG_SP: 'C',
-      REG_NAME: '광주'
-    },
-    {
-      REG_ID: '11B20703',
-      REG_SP: 'C',
-      REG_NAME: '여주'
-    },
-    {
-      REG_ID: '11C00000',
-      REG_SP: 'A',
-      REG_NAME: '충청도'
-    },
-    {
-      REG_ID: '11C10000',
-      REG_SP: 'A',
-      REG_NAME: '충청북도'
-    },
-    {
-      REG_ID: '11C10101',
-      REG_SP: 'C',
-      REG_NAME: '충주'
-    },
-    {
-      REG_ID: '11C10102',
-      REG_SP: 'C',
-      REG_NAME: '진천'
-    },
-    {
-      REG_ID: '11C10103',
-      REG_SP: 'C',
-      REG_NAME: '음성'
-    },
-    {
-      REG_ID: '11C10201',
-      REG_SP: 'C',
-      REG_NAME: '제천'
-    },
-    {
-      REG_ID: '11C10202',
-      REG_SP: 'C',
-      REG_NAME: '단양'
-    },
-    {
-      REG_ID: '11C10301',
-      REG_SP: 'C',
-      REG_NAME: '청주'
-    },
-    {
-      REG_ID: '11C10302',
-      REG_SP: 'C',
-      REG_NAME: '보은'
-    },
-    {
-      REG_ID: '11C10303',
-      REG_SP: 'C',
-      REG_NAME: '괴산'
-    },
-    {
-      REG_ID: '11C10304',
-      REG_SP: 'C',
-      REG_NAME: '증평'
-    },
-    {
-      REG_ID: '11C10401',
-      REG_SP: 'C',
-      REG_NAME: '추풍령'
-    },
-    {
-      REG_ID: '11C10402',
-      REG_SP: 'C',
-      REG_NAME: '영동'
-    },
-    {
-      REG_ID: '11C10403',
-      REG_SP: 'C',
-      REG_NAME: '옥천'
-    },
-    {
-      REG_ID: '11C20000',
-      REG_SP: 'A',
-      REG_NAME: '충청남도'
-    },
-    {
-      REG_ID: '11C20101',
-      REG_SP: 'C',
-      REG_NAME: '서산'
-    },
-    {
-      REG_ID: '11C20102',
-      REG_SP: 'C',
-      REG_NAME: '태안'
-    },
-    {
-      REG_ID: '11C20103',
-      REG_SP: 'C',
-      REG_NAME: '당진'
-    },
-    {
-      REG_ID: '11C20104',
-      REG_SP: 'C',
-      REG_NAME: '홍성'
-    },
-    {
-      REG_ID: '11C20201',
-      REG_SP: 'C',
-      REG_NAME: '보령'
-    },
-    {
-      REG_ID: '11C20202',
-      REG_SP: 'C',
-      REG_NAME: '서천'
-    },
-    {
-      REG_ID: '11C20301',
-      REG_SP: 'C',
-      REG_NAME: '천안'
-    },
-    {
-      REG_ID: '11C20302',
-      REG_SP: 'C',
-      REG_NAME: '아산'
-    },
-    {
-      REG_ID: '11C20303',
-      REG_SP: 'C',
-      REG_NAME: '예산'
-    },
-    {
-      REG_ID: '11C20401',
-      REG_SP: 'C',
-      REG_NAME: '대전'
-    },
-    {
-      REG_ID: '11C20402',
-      REG_SP: 'C',
-      REG_NAME: '공주'
-    },
-    {
-      REG_ID: '11C20403',
-      REG_SP: 'C',
-      REG_NAME: '계룡'
-    },
-    {
-      REG_ID: '11C20404',
-      REG_SP: 'C',
-      REG_NAME: '세종'
-    },
-    {
-      REG_ID: '11C20501',
-      REG_SP: 'C',
-      REG_NAME: '부여'
-    },
-    {
-      REG_ID: '11C20502',
-      REG_SP: 'C',
-      REG_NAME: '청양'
-    },
-    {
-      REG_ID: '11C20601',
-      REG_SP: 'C',
-      REG_NAME: '금산'
-    },
-    {
-      REG_ID: '11C20602',
-      REG_SP: 'C',
-      REG_NAME: '논산'
-    },
-    {
-      REG_ID: '11E00101',
-      REG_SP: 'C',
-      REG_NAME: '울릉도'
-    },
-    {
-      REG_ID: '11E00102',
-      REG_SP: 'C',
-      REG_NAME: '독도'
-    },
-    {
-      REG_ID: '11F00000',
-      REG_SP: 'A',
-      REG_NAME: '전라도'
-    },
-    {
-      REG_ID: '11F10401',
-      REG_SP: 'C',
-      REG_NAME: '남원'
-    },
-    {
-      REG_ID: '11F10402',
-      REG_SP: 'C',
-      REG_NAME: '임실'
-    },
-    {
-      REG_ID: '11F10403',
-      REG_SP: 'C',
-      REG_NAME: '순창'
-    },
-    {
-      REG_ID: '11F20000',
-      REG_SP: 'A',
-      REG_NAME: '전라남도'
-    },
-    {
-      REG_ID: '11F20301',
-      REG_SP: 'C',
-      REG_NAME: '완도'
-    },
-    {
-      REG_ID: '11F20302',
-      REG_SP: 'C',
-      REG_NAME: '해남'
-    },
-    {
-      REG_ID: '11F20303',
-      REG_SP: 'C',
-      REG_NAME: '강진'
-    },
-    {
-      REG_ID: '11F20304',
-      REG_SP: 'C',
-      REG_NAME: '장흥'
-    },
-    {
-      REG_ID: '11F20401',
-      REG_SP: 'C',
-      REG_NAME: '여수'
-    },
-    {
-      REG_ID: '11F20402',
-      REG_SP: 'C',
-      REG_NAME: '광양'
-    },
-    {
-      REG_ID: '11F20403',
-      REG_SP: 'C',
-      REG_NAME: '고흥'
-    },
-    {
-      REG_ID: '11F20404',
-      REG_SP: 'C',
-      REG_NAME: '보성'
-    },
-    {
-      REG_ID: '11F20405',
-      REG_SP: 'C',
-      REG_NAME: '순천시'
-    },
-    {
-      REG_ID: '11F20501',
-      REG_SP: 'C',
-      REG_NAME: '광주'
-    },
-    {
-      REG_ID: '11F20502',
-      REG_SP: 'C',
-      REG_NAME: '장성'
-    },
-    {
-      REG_ID: '11F20503',
-      REG_SP: 'C',
-      REG_NAME: '나주'
-    },
-    {
-      REG_ID: '11F20504',
-      REG_SP: 'C',
-      REG_NAME: '담양'
-    },
-    {
-      REG_ID: '11F20505',
-      REG_SP: 'C',
-      REG_NAME: '화순'
-    },
-    {
-      REG_ID: '11F20601',
-      REG_SP: 'C',
-      REG_NAME: '구례'
-    },
-    {
-      REG_ID: '11F20602',
-      REG_SP: 'C',
-      REG_NAME: '곡성'
-    },
-    {
-      REG_ID: '11F20603',
-      REG_SP: 'C',
-      REG_NAME: '순천'
-    },
-    {
-      REG_ID: '11F20701',
-      REG_SP: 'C',
-      REG_NAME: '흑산도'
-    },
-    {
-      REG_ID: '11G00000',
-      REG_SP: 'A',
-      REG_NAME: '제주도'
-    },
-    {
-      REG_ID: '11G00101',
-      REG_SP: 'C',
-      REG_NAME: '성산'
-    },
-    {
-      REG_ID: '11G00201',
-      REG_SP: 'C',
-      REG_NAME: '제주'
-    },
-    {
-      REG_ID: '11G00302',
-      REG_SP: 'C',
-      REG_NAME: '성판악'
-    },
-    {
-      REG_ID: '11G00401',
-      REG_SP: 'C',
-      REG_NAME: '서귀포'
-    },
-    {
-      REG_ID: '11G00501',
-      REG_SP: 'C',
-      REG_NAME: '고산'
-    },
-    {
-      REG_ID: '11G00601',
-      REG_SP: 'C',
-      REG_NAME: '이어도'
-    },
-    {
-      REG_ID: '11G00800',
-      REG_SP: 'C',
-      REG_NAME: '추자도'
-    },
-    {
-      REG_ID: '11G00901',
-      REG_SP: 'C',
-      REG_NAME: '산천단'
-    },
-    {
-      REG_ID: '11G01001',
-      REG_SP: 'C',
-      REG_NAME: '한남'
-    },
-    {
-      REG_ID: '11H00000',
-      REG_SP: 'A',
-      REG_NAME: '경상도'
-    },
-    {
-      REG_ID: '11H10702',
-      REG_SP: 'C',
-      REG_NAME: '영천'
-    },
-    {
-      REG_ID: '11H10703',
-      REG_SP: 'C',
-      REG_NAME: '경산'
-    },
-    {
-      REG_ID: '11H10704',
-      REG_SP: 'C',
-      REG_NAME: '청도'
-    },
-    {
-      REG_ID: '11H10705',
-      REG_SP: 'C',
-      REG_NAME: '칠곡'
-    },
-    {
-      REG_ID: '11H10707',
-      REG_SP: 'C',
-      REG_NAME: '군위'
-    },
-    {
-      REG_ID: '11H20000',
-      REG_SP: 'A',
-      REG_NAME: '경상남도'
-    },
-    {
-      REG_ID: '11H20101',
-      REG_SP: 'C',
-      REG_NAME: '울산'
-    },
-    {
-      REG_ID: '11H20102',
-      REG_SP: 'C',
-      REG_NAME: '양산'
-    },
-    {
-      REG_ID: '11H20201',
-      REG_SP: 'C',
-      REG_NAME: '부산'
-    },
-    {
-      REG_ID: '11H20301',
-      REG_SP: 'C',
-      REG_NAME: '창원'
-    },
-    {
-      REG_ID: '11H20304',
-      REG_SP: 'C',
-      REG_NAME: '김해'
-    },
-    {
-      REG_ID: '11H20401',
-      REG_SP: 'C',
-      REG_NAME: '통영'
-    },
-    {
-      REG_ID: '11H20402',
-      REG_SP: 'C',
-      REG_NAME: '사천'
-    },
-    {
-      REG_ID: '11H20403',
-      REG_SP: 'C',
-      REG_NAME: '거제'
-    },
-    {
-      REG_ID: '11H20404',
-      REG_SP: 'C',
-      REG_NAME: '고성'
-    },
-    {
-      REG_ID: '11H20405',
-      REG_SP: 'C',
-      REG_NAME: '남해'
-    },
-    {
-      REG_ID: '11H20501',
-      REG_SP: 'C',
-      REG_NAME: '함양'
-    },
-    {
-      REG_ID: '11H20502',
-      REG_SP: 'C',
-      REG_NAME: '거창'
-    },
-    {
-      REG_ID: '11H20503',
-      REG_SP: 'C',
-      REG_NAME: '합천'
-    },
-    {
-      REG_ID: '11H20601',
-      REG_SP: 'C',
-      REG_NAME: '밀양'
-    },
-    {
-      REG_ID: '11H20602',
-      REG_SP: 'C',
-      REG_NAME: '의령'
-    },
-    {
-      REG_ID: '11H20603',
-      REG_SP: 'C',
-      REG_NAME: '함안'
-    },
-    {
-      REG_ID: '11H20604',
-      REG_SP: 'C',
-      REG_NAME: '창녕'
-    },
-    {
-      REG_ID: '11H20701',
-      REG_SP: 'C',
-      REG_NAME: '진주'
-    },
-    {
-      REG_ID: '11H20703',
-      REG_SP: 'C',
-      REG_NAME: '산청'
-    },
-    {
-      REG_ID: '11H20704',
-      REG_SP: 'C',
-      REG_NAME: '하동'
-    },
-    {
-      REG_ID: '11I00000',
-      REG_SP: 'A',
-      REG_NAME: '황해도'
-    },
-    {
-      REG_ID: '11I10001',
-      REG_SP: 'C',
-      REG_NAME: '사리원'
-    },
-    {
-      REG_ID: '11I10002',
-      REG_SP: 'C',
-      REG_NAME: '신계'
-    },
-    {
-      REG_ID: '11I20001',
-      REG_SP: 'C',
-      REG_NAME: '해주'
-    },
-    {
-      REG_ID: '11I20002',
-      REG_SP: 'C',
-      REG_NAME: '개성'
-    },
-    {
-      REG_ID: '11I20003',
-      REG_SP: 'C',
-      REG_NAME: '장연(용연)'
-    },
-    {
-      REG_ID: '11J10000',
-      REG_SP: 'A',
-      REG_NAME: '평안북도'
-    },
-    {
-      REG_ID: '11J10001',
-      REG_SP: 'C',
-      REG_NAME: '신의주'
-    },
-    {
-      REG_ID: '11J10002',
-      REG_SP: 'C',
-      REG_NAME: '삭주(수풍)'
-    },
-    {
-      REG_ID: '11J10003',
-      REG_SP: 'C',
-      REG_NAME: '구성'
-    },
-    {
-      REG_ID: '11J10004',
-      REG_SP: 'C',
-      REG_NAME: '자성(중강)'
-    },
-    {
-      REG_ID: '11J10005',
-      REG_SP: 'C',
-      REG_NAME: '강계'
-    },
-    {
-      REG_ID: '11J10006',
-      REG_SP: 'C',
-      REG_NAME: '희천'
-    },
-    {
-      REG_ID: '11J20000',
-      REG_SP: 'A',
-      REG_NAME: '평안남도'
-    },
-    {
-      REG_ID: '11J20001',
-      REG_SP: 'C',
-      REG_NAME: '평양'
-    },
-    {
-      REG_ID: '11J20002',
-      REG_SP: 'C',
-      REG_NAME: '진남포(남포)'
-    },
-    {
-      REG_ID: '11J20004',
-      REG_SP: 'C',
-      REG_NAME: '안주'
-    },
-    {
-      REG_ID: '11J20005',
-      REG_SP: 'C',
-      REG_NAME: '양덕'
-    },
-    {
-      REG_ID: '11K10000',
-      REG_SP: 'A',
-      REG_NAME: '함경북도'
-    },
-    {
-      REG_ID: '11K10001',
-      REG_SP: 'C',
-      REG_NAME: '청진'
-    },
-    {
-      REG_ID: '11K10002',
-      REG_SP: 'C',
-      REG_NAME: '웅기(선봉)'
-    },
-    {
-      REG_ID: '11K10003',
-      REG_SP: 'C',
-      REG_NAME: '성진(김책)'
-    },
-    {
-      REG_ID: '11K10004',
-      REG_SP: 'C',
-      REG_NAME: '무산(삼지연)'
-    },
-    {
-      REG_ID: '11K20000',
-      REG_SP: 'A',
-      REG_NAME: '함경남도'
-    },
-    {
-      REG_ID: '11K20001',
-      REG_SP: 'C',
-      REG_NAME: '함흥'
-    },
-    {
-      REG_ID: '11K20002',
-      REG_SP: 'C',
-      REG_NAME: '장진'
-    },
-    {
-      REG_ID: '11K20003',
-      REG_SP: 'C',
-      REG_NAME: '북청(신포)'
-    },
-    {
-      REG_ID: '11K20004',
-      REG_SP: 'C',
-      REG_NAME: '혜산'
-    },
-    {
-      REG_ID: '11K20005',
-      REG_SP: 'C',
-      REG_NAME: '풍산'
-    },
-    {
-      REG_ID: '11L10001',
-      REG_SP: 'C',
-      REG_NAME: '원산'
-    },
-    {
-      REG_ID: '11L10002',
-      REG_SP: 'C',
-      REG_NAME: '고성(장전)'
-    },
-    {
-      REG_ID: '11L10003',
-      REG_SP: 'C',
-      REG_NAME: '평강'
-    },
-    {
-      REG_ID: '12F00100',
-      REG_SP: 'I',
-      REG_NAME: '규슈(서해)'
-    },
-    {
-      REG_ID: '12F00200',
-      REG_SP: 'I',
-      REG_NAME: '규슈(남해)'
-    },
-    {
-      REG_ID: '21F10501',
-      REG_SP: 'C',
-      REG_NAME: '군산'
-    },
-    {
-      REG_ID: '21F10502',
-      REG_SP: 'C',
-      REG_NAME: '김제'
-    },
-    {
-      REG_ID: '21F10601',
-      REG_SP: 'C',
-      REG_NAME: '고창'
-    },
-    {
-      REG_ID: '21F10602',
-      REG_SP: 'C',
-      REG_NAME: '부안'
-    },
-    {
-      REG_ID: '21F20101',
-      REG_SP: 'C',
-      REG_NAME: '함평'
-    },
-    {
-      REG_ID: '21F20102',
-      REG_SP: 'C',
-      REG_NAME: '영광'
-    },
-    {
-      REG_ID: '21F20201',
-      REG_SP: 'C',
-      REG_NAME: '진도'
-    },
-    {
-      REG_ID: '21F20801',
-      REG_SP: 'C',
-      REG_NAME: '목포'
-    },
-    {
-      REG_ID: '21F20802',
-      REG_SP: 'C',
-      REG_NAME: '영암'
-    },
-    {
-      REG_ID: '21F20803',
-      REG_SP: 'C',
-      REG_NAME: '신안'
-    },
-    {
-      REG_ID: '21F20804',
-      REG_SP: 'C',
-      REG_NAME: '무안'
-    },
-    {
-      REG_ID: '11D10000',
-      REG_SP: 'A',
-      REG_NAME: '강원영서'
-    },
-    {
-      REG_ID: '11D10101',
-      REG_SP: 'C',
-      REG_NAME: '철원'
-    },
-    {
-      REG_ID: '11D10102',
-      REG_SP: 'C',
-      REG_NAME: '화천'
-    },
-    {
-      REG_ID: '11D10201',
-      REG_SP: 'C',
-      REG_NAME: '인제'
-    },
-    {
-      REG_ID: '11D10202',
-      REG_SP: 'C',
-      REG_NAME: '양구'
-    },
-    {
-      REG_ID: '11D10301',
-      REG_SP: 'C',
-      REG_NAME: '춘천'
-    },
-    {
-      REG_ID: '11D10302',
-      REG_SP: 'C',
-      REG_NAME: '홍천'
-    },
-    {
-      REG_ID: '11D10401',
-      REG_SP: 'C',
-      REG_NAME: '원주'
-    },
-    {
-      REG_ID: '11D10402',
-      REG_SP: 'C',
-      REG_NAME: '횡성'
-    },
-    {
-      REG_ID: '11D10501',
-      REG_SP: 'C',
-      REG_NAME: '영월'
-    },
-    {
-      REG_ID: '11D10502',
-      REG_SP: 'C',
-      REG_NAME: '정선'
-    },
-    {
-      REG_ID: '11D10503',
-      REG_SP: 'C',
-      REG_NAME: '평창'
-    },
-    {
-      REG_ID: '11D20000',
-      REG_SP: 'A',
-      REG_NAME: '강원영동'
-    },
-    {
-      REG_ID: '11D20201',
-      REG_SP: 'C',
-      REG_NAME: '대관령'
-    },
-    {
-      REG_ID: '11D20301',
-      REG_SP: 'C',
-      REG_NAME: '태백'
-    },
-    {
-      REG_ID: '11D20401',
-      REG_SP: 'C',
-      REG_NAME: '속초'
-    },
-    {
-      REG_ID: '11D20402',
-      REG_SP: 'C',
-      REG_NAME: '고성'
-    },
-    {
-      REG_ID: '11D20403',
-      REG_SP: 'C',
-      REG_NAME: '양양'
-    },
-    {
-      REG_ID: '11D20501',
-      REG_SP: 'C',
-      REG_NAME: '강릉'
-    },
-    {
-      REG_ID: '11D20601',
-      REG_SP: 'C',
-      REG_NAME: '동해'
-    },
-    {
-      REG_ID: '11D20602',
-      REG_SP: 'C',
-      REG_NAME: '삼척'
-    },
-    {
-      REG_ID: '11H10000',
-      REG_SP: 'A',
-      REG_NAME: '경상북도'
-    },
-    {
-      REG_ID: '11H10101',
-      REG_SP: 'C',
-      REG_NAME: '울진'
-    },
-    {
-      REG_ID: '11H10102',
-      REG_SP: 'C',
-      REG_NAME: '영덕'
-    },
-    {
-      REG_ID: '11H10201',
-      REG_SP: 'C',
-      REG_NAME: '포항'
-    },
-    {
-      REG_ID: '11H10202',
-      REG_SP: 'C',
-      REG_NAME: '경주'
-    },
-    {
-      REG_ID: '11H10301',
-      REG_SP: 'C',
-      REG_NAME: '문경'
-    },
-    {
-      REG_ID: '11H10302',
-      REG_SP: 'C',
-      REG_NAME: '상주'
-    },
-    {
-      REG_ID: '11H10303',
-      REG_SP: 'C',
-      REG_NAME: '예천'
-    },
-    {
-      REG_ID: '11H10401',
-      REG_SP: 'C',
-      REG_NAME: '영주'
-    },
-    {
-      REG_ID: '11H10402',
-      REG_SP: 'C',
-      REG_NAME: '봉화'
-    },
-    {
-      REG_ID: '11H10403',
-      REG_SP: 'C',
-      REG_NAME: '영양'
-    },
-    {
-      REG_ID: '11H10501',
-      REG_SP: 'C',
-      REG_NAME: '안동'
-    },
-    {
-      REG_ID: '11H10502',
-      REG_SP: 'C',
-      REG_NAME: '의성'
-    },
-    {
-      REG_ID: '11H10503',
-      REG_SP: 'C',
-      REG_NAME: '청송'
-    },
-    {
-      REG_ID: '11H10601',
-      REG_SP: 'C',
-      REG_NAME: '김천'
-    },
-    {
-      REG_ID: '11H10602',
-      REG_SP: 'C',
-      REG_NAME: '구미'
-    },
-    {
-      REG_ID: '11H10604',
-      REG_SP: 'C',
-      REG_NAME: '고령'
-    },
-    {
-      REG_ID: '11H10605',
-      REG_SP: 'C',
-      REG_NAME: '성주'
-    },
-    {
-      REG_ID: '11H10701',
-      REG_SP: 'C',
-      REG_NAME: '대구'
-    },
-    {
-      REG_ID: '11F10000',
-      REG_SP: 'A',
-      REG_NAME: '전북자치도'
-    },
-    {
-      REG_ID: '11F10201',
-      REG_SP: 'C',
-      REG_NAME: '전주'
-    },
-    {
-      REG_ID: '11F10202',
-      REG_SP: 'C',
-      REG_NAME: '익산'
-    },
-    {
-      REG_ID: '11F10203',
-      REG_SP: 'C',
-      REG_NAME: '정읍'
-    },
-    {
-      REG_ID: '11F10204',
-      REG_SP: 'C',
-      REG_NAME: '완주'
-    },
-    {
-      REG_ID: '11F10301',
-      REG_SP: 'C',
-      REG_NAME: '장수'
-    },
-    {
-      REG_ID: '11F10302',
-      REG_SP: 'C',
-      REG_NAME: '무주'
-    },
-    {
-      REG_ID: '11F10303',
-      REG_SP: 'C',
-      REG_NAME: '진안'
-    },
-    {
-      REG_ID: '11B10101',
-      REG_SP: 'C',
-      REG_NAME: '서울'
-    },
-    {
-      REG_ID: '11B10102',
-      REG_SP: 'C',
-      REG_NAME: '과천'
-    },
-    {
-      REG_ID: '11B10103',
-      REG_SP: 'C',
-      REG_NAME: '광명'
-    },
-    {
-      REG_ID: '11B20101',
-      REG_SP: 'C',
-      REG_NAME: '강화'
-    },
-    {
-      REG_ID: '11B20102',
-      REG_SP: 'C',
-      REG_NAME: '김포'
-    },
-    {
-      REG_ID: '11B20201',
-      REG_SP: 'C',
-      REG_NAME: '인천'
-    },
-    {
-      REG_ID: '11B20202',
-      REG_SP: 'C',
-      REG_NAME: '시흥'
-    },
-    {
-      REG_ID: '11B20203',
-      REG_SP: 'C',
-      REG_NAME: '안산'
-    },
-    {
-      REG_ID: '11B20204',
-      REG_SP: 'C',
-      REG_NAME: '부천'
-    },
-    // 해상 중기예보 지역 (12X 접두사)
-    {
-      REG_ID: '12A00000',
-      REG_SP: 'I',
-      REG_NAME: '서해'
-    },
-    {
-      REG_ID: '12A10000',
-      REG_SP: 'I',
-      REG_NAME: '서해북부'
-    },
-    {
-      REG_ID: '12A20000',
-      REG_SP: 'I',
-      REG_NAME: '서해중부'
-    },
-    {
-      REG_ID: '12A30000',
-      REG_SP: 'I',
-      REG_NAME: '서해남부'
-    },
-    {
-      REG_ID: '12B00000',
-      REG_SP: 'I',
-      REG_NAME: '남해'
-    },
-    {
-      REG_ID: '12B10000',
-      REG_SP: 'I',
-      REG_NAME: '남해서부'
-    },
-    {
-      REG_ID: '12B10500',
-      REG_SP: 'I',
-      REG_NAME: '제주도해상'
-    },
-    {
-      REG_ID: '12B20000',
-      REG_SP: 'I',
-      REG_NAME: '남해동부'
-    },
-    {
-      REG_ID: '12C00000',
-      REG_SP: 'I',
-      REG_NAME: '동해'
-    },
-    {
-      REG_ID: '12C10000',
-      REG_SP: 'I',
-      REG_NAME: '동해남부'
-    },
-    {
-      REG_ID: '12C20000',
-      REG_SP: 'I',
-      REG_NAME: '동해중부'
-    },
-    {
-      REG_ID: '12C30000',
-      REG_SP: 'I',
-      REG_NAME: '동해북부'
-    },
-    {
-      REG_ID: '12D00000',
-      REG_SP: 'I',
-      REG_NAME: '대화퇴'
-    },
-    {
-      REG_ID: '12E00000',
-      REG_SP: 'I',
-      REG_NAME: '동중국해'
-    },
-    {
-      REG_ID: '12F00000',
-      REG_SP: 'I',
-      REG_NAME: '규슈'
-    },
-    {
-      REG_ID: '12F00100',
-      REG_SP: 'I',
-      REG_NAME: '규슈(서해)'
-    },
-    {
-      REG_ID: '12F00200',
-      REG_SP: 'I',
-      REG_NAME: '규슈(남해)'
-    },
-    {
-      REG_ID: '12G00000',
-      REG_SP: 'I',
-      REG_NAME: '연해주'
-    }
-  ];
-  for (const region of regionData){
-    regions.set(region.REG_ID, region);
+  for (let i = 0; i < id.length; i++) {
+    regions.set(id[i], {
+      REG_ID: id[i],
+      REG_SP: sp[i],
+      REG_NAME: name[i]
+    });
   }
-  return regions;
+  // regions[g] 지역의 관측소 = locations[offsets[g]:offsets[g + 1]]
+  const decodeGroup = (group)=>{
+    const mapping = {};
+    for (let g = 0; g < group.regions.length; g++) {
+      mapping[id[group.regions[g]]] = group.locations.slice(group.offsets[g], group.offsets[g + 1]).map((i)=>artifact.locations[i]);
+    }
+    return mapping;
+  };
+  return {
+    regions,
+    locationCodes: {
+      marine: decodeGroup(artifact.mappings.marine),
+      temperature: decodeGroup(artifact.mappings.temperature)
+    },
+    contentHash: artifact.content_hash
+  };
+}
+const medmMapping = decodeMedmMapping(medmMappingArtifact);
+console.log(`중기예보 매핑 로드: 지역 ${medmMapping.regions.size}개, content_hash ${medmMapping.contentHash}`);
+function getRegionInfo() {
+  return medmMapping.regions;
 }
 // 중기예보 API 호출 함수 (재시도 로직 포함)
 async function fetchMediumTermForecast(apiType, authKey, regionInfo) {
@@ -1359,72 +183,9 @@ async function fetchMediumTermForecast(apiType, authKey, regionInfo) {
     };
   });
 }
-// reg_id -> location_code 매핑 (tide_weather_region_rows.csv 전체 134개 기반)
+// reg_id -> location_code 매핑 (medm_mapping.json)
 function getLocationCodeMapping() {
-  // marine_reg_id -> location_codes 매핑 (전체 134개)
-const marineMapping = {
-  '12A10000': ['AD_0001', 'AD_0004', 'AD_0005', 'AD_0006', 'AD_0007', 'AD_0008', 'AD_0009', 'DT_0001', 'DT_0008', 'DT_0017', 'DT_0032', 'DT_0036', 'DT_0038', 'DT_0043', 'DT_0044', 'DT_0052', 'DT_0058', 'DT_0059', 'DT_0060', 'DT_0064', 'DT_0065', 'DT_0093', 'IE_0062', 'SO_0536', 'SO_0539', 'SO_0554', 'SO_0562', 'SO_0563', 'SO_0564'], // 서해북부,
-  '12A20000': ['AD_0002', 'AD_0003', 'AD_0010', 'AD_0011', 'AD_0012', 'AD_0013', 'AD_0014', 'AD_0015', 'AD_0016', 'AD_0018', 'AD_0019', 'AD_0020', 'AD_0021', 'AD_0022', 'AD_0023', 'AD_0024', 'AD_0025', 'DT_0002', 'DT_0018', 'DT_0024', 'DT_0025', 'DT_0030', 'DT_0034', 'DT_0037', 'DT_0045', 'DT_0050', 'DT_0051', 'DT_0067', 'DT_0068', 'SO_0547', 'SO_0574', 'SO_0699'], // 서해중부,
-  '12A30000': ['AD_0026', 'AD_0027', 'AD_0028', 'AD_0029', 'AD_0030', 'AD_0031', 'AD_0032', 'DT_0003', 'DT_0007', 'DT_0021', 'DT_0027', 'DT_0028', 'DT_0035', 'DT_0041', 'DT_0094', 'IE_0061', 'SO_0537', 'SO_0538', 'SO_0543', 'SO_0548', 'SO_0551', 'SO_0555', 'SO_0565', 'SO_0566', 'SO_0567', 'SO_0576', 'SO_0577', 'SO_0631', 'SO_0701', 'SO_0702', 'SO_0703', 'SO_0704', 'SO_0705', 'SO_0706', 'SO_0740', 'SO_0752', 'SO_0753', 'SO_0754', 'SO_0755', 'SO_0756'], // 서해남부,
-  '12B10000': ['AD_0033', 'AD_0034', 'AD_0035', 'AD_0036', 'AD_0037', 'AD_0038', 'DT_0010', 'DT_0016', 'DT_0022', 'DT_0023', 'DT_0026', 'DT_0031', 'DT_0047', 'DT_0049', 'DT_0092', 'IE_0060', 'SO_0550', 'SO_0568', 'SO_0707', 'SO_0708', 'SO_0709', 'SO_0710', 'SO_0738', 'SO_0739', 'SO_0757', 'SO_0758', 'SO_0761'], // 남해서부,
-  '12B10500': ['DT_0004'], // 제주도해상,
-  '12B20000': ['AD_0039', 'AD_0040', 'AD_0041', 'AD_0042', 'DT_0005', 'DT_0014', 'DT_0015', 'DT_0019', 'DT_0020', 'DT_0029', 'DT_0042', 'DT_0054', 'DT_0056', 'DT_0061', 'DT_0062', 'DT_0063', 'SO_0326', 'SO_0552', 'SO_0553', 'SO_0569', 'SO_0570', 'SO_0571', 'SO_0572', 'SO_0573', 'SO_0578', 'SO_0581', 'SO_0711', 'SO_0712', 'SO_0759'], // 남해동부,
-  '12C10000': ['DT_0009', 'DT_0011', 'DT_0039', 'DT_0057', 'DT_0091', 'SO_0736', 'SO_0737', 'SO_0760'], // 동해남부,
-  '12C20000': ['DT_0006', 'DT_0012', 'DT_0013', 'DT_0040', 'DT_0046', 'DT_0048', 'SO_0540', 'SO_0731', 'SO_0732', 'SO_0733', 'SO_0734', 'SO_0735'], // 동해중부
-};
-  
-  // temperature_reg_id -> location_codes 매핑 (전체 134개)
- const temperMapping = {
-  '11B20101': ['AD_0007', 'DT_0032', 'SO_0539'], // 강화,
-  '11B20201': ['DT_0058', 'DT_0064', 'DT_0093', 'DT_0001', 'AD_0009'], // 인천,
-  '11B20203': ['AD_0001', 'AD_0004', 'DT_0008', 'DT_0013'], // 안산,
-  '11B20604': ['AD_0005', 'AD_0006', 'AD_0008', 'SO_0564'], // 화성,
-  '11C20101': ['AD_0002', 'AD_0012', 'AD_0013', 'DT_0017'], // 서산,
-  '11C20102': ['AD_0014', 'AD_0016', 'AD_0018', 'AD_0019', 'AD_0020', 'AD_0021', 'AD_0022', 'DT_0034', 'DT_0045', 'DT_0050', 'DT_0067', 'SO_0574', 'SO_0699'], // 태안,
-  '11C20103': ['AD_0003', 'AD_0010', 'AD_0011', 'DT_0002'], // 당진,
-  '11C20104': ['AD_0015'], // 홍성,
-  '11C20201': ['AD_0023', 'AD_0024', 'DT_0025'], // 보령,
-  '11C20202': ['AD_0025', 'DT_0024', 'DT_0051'], // 서천,
-  '11D20401': ['DT_0012', 'DT_0048'], // 속초,
-  '11D20402': ['SO_0569', 'SO_0731'], // 고성,
-  '11D20403': ['SO_0732'], // 양양,
-  '11D20501': ['SO_0733'], // 강릉,
-  '11D20601': ['DT_0006', 'DT_0009', 'DT_0057', 'DT_0091', 'SO_0736', 'SO_0737'], // 동해,
-  '11D20602': ['SO_0540', 'SO_0734'], // 삼척,
-  '11E00102': ['DT_0040'], // 독도,
-  '11F20301': ['AD_0035', 'DT_0027', 'SO_0551', 'SO_0704', 'SO_0706', 'SO_0739', 'SO_0740', 'SO_0755'], // 완도,
-  '11F20302': ['AD_0033', 'AD_0034', 'SO_0576', 'SO_0703', 'SO_0754'], // 해남,
-  '11F20303': ['SO_0705', 'SO_0710', 'SO_0756'], // 강진,
-  '11F20304': ['AD_0036'], // 장흥,
-  '11F20401': ['DT_0016', 'DT_0031', 'DT_0042', 'SO_0568', 'SO_0708', 'SO_0709', 'SO_0758'], // 여수,
-  '11F20402': ['DT_0049'], // 광양,
-  '11F20403': ['AD_0037', 'DT_0026', 'DT_0092', 'SO_0550', 'SO_0707', 'SO_0738', 'SO_0757', 'SO_0761'], // 고흥,
-  '11F20405': ['AD_0038'], // 순천시,
-  '11G00101': ['DT_0022'], // 성산,
-  '11G00201': ['DT_0004', 'DT_0021'], // 제주,
-  '11G00401': ['DT_0010', 'DT_0023', 'DT_0047', 'IE_0060'], // 서귀포,
-  '11H10101': ['DT_0011', 'DT_0039', 'SO_0735', 'SO_0760'], // 울진,
-  '11H10201': ['SO_0573'], // 포항,
-  '11H10202': ['SO_0572'], // 경주,
-  '11H10701': ['SO_0553'], // 대구,
-  '11H10704': ['DT_0037'], // 청도,
-  '11H20101': ['DT_0020'], // 울산,
-  '11H20201': ['DT_0019', 'DT_0063', 'AD_0042'], // 부산,
-  '11H20301': ['DT_0015', 'DT_0054', 'DT_0056', 'DT_0062', 'SO_0570'], // 창원,
-  '11H20401': ['AD_0039', 'DT_0014', 'SO_0578', 'SO_0712', 'SO_0759'], // 통영,
-  '11H20402': ['DT_0061'], // 사천,
-  '11H20403': ['AD_0040', 'AD_0041', 'DT_0029', 'SO_0552', 'SO_0571'], // 거제,
-  '11H20405': ['SO_0326', 'SO_0711'], // 남해,
-  '21F10501': ['AD_0026', 'AD_0027', 'DT_0018', 'SO_0547'], // 군산,
-  '21F10601': ['AD_0029', 'AD_0030'], // 고창,
-  '21F10602': ['AD_0028', 'DT_0030', 'DT_0068'], // 부안,
-  '21F20102': ['AD_0031', 'DT_0003', 'SO_0538', 'SO_0565'], // 영광,
-  '21F20201': ['DT_0028', 'DT_0094', 'SO_0537', 'SO_0543', 'SO_0555', 'SO_0567', 'SO_0702'], // 진도,
-  '21F20801': ['DT_0007'], // 목포,
-  '21F20803': ['AD_0032', 'DT_0035', 'DT_0041', 'IE_0061', 'SO_0548', 'SO_0566', 'SO_0577', 'SO_0631', 'SO_0701', 'SO_0752', 'SO_0753'], // 신안
-};
-  
-  return { marine: marineMapping, temperature: temperMapping };
+  return medmMapping.locationCodes;
 }
 
 // 데이터베이스에 데이터 삽입 함수
@@ -1632,7 +393,7 @@ Deno.serve(async (req)=>{
     if (!authKey) {
       throw new Error('KMA_AUTH_KEY 환경변수가 설정되지 않았습니다');
     }
-    // 지역 정보 로드 (하드코딩)
+    // 지역 정보 (medm_mapping.json에서 로드)
     const regionInfo = getRegionInfo();
     const results = {
       temperature: {
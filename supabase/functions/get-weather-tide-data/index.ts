@@ -154,7 +154,7 @@ Deno.serve(async (req)=>{
     // 5. 병렬 데이터 조회 최적화 (3개씩 2그룹)
     console.log('Group 1: Fetching weather forecasts, tide data, and region IDs in parallel...');
     const [weatherResult, tideResult] = await Promise.all([
-      supabaseClient.from('weather_forecasts').select(`
+      supabaseClient.from('weather_forecasts_by_location').select(`
         fcst_datetime_kr,
         tmp, tmn, tmx, uuu, vvv, vec, wsd, sky, pty, pop, wav, pcp, reh, sno
       `).eq('location_code', locationCode).gte('fcst_datetime_kr', startDateKST).lt('fcst_datetime_kr', weatherExclusiveEndDateKST).order('fcst_datetime_kr', {
@@ -0,0 +1,99 @@
+-- 단기예보 격자(nx, ny) 단위 저장 테이블
+-- 생성일: 2026-01-28
+-- 목적: 같은 격자를 공유하는 관측소의 예보를 한 번만 저장하고,
+--       관측소별 예보는 tide_weather_region(code → nx, ny) 조인으로 조회
+-- 전환: get-kma-weather는 이 테이블에만 저장하고, 조회 함수(get-weather-tide-data,
+--       get-ad-weather-data, get-medm-weather-data)는 weather_forecasts_by_location 뷰를 읽음.
+--       기존 weather_forecasts 저장은 WRITE_LOCATION_FORECASTS=true로만 켜는 롤백 경로이며,
+--       남은 행은 cleanup-old-data 보존 기간이 지나면 정리됨
+-- 격자/관측소 매핑 현황: docs/03_get-kma(단기)/plan_grid_requests.py
+
+-- ============================================================================
+-- 1. 격자 단위 예보 테이블 (weather_forecasts_grid)
+-- ============================================================================
+
+CREATE TABLE IF NOT EXISTS public.weather_forecasts_grid (
+    nx integer NOT NULL,
+    ny integer NOT NULL,
+    base_date text,
+    base_time text,
+    fcst_datetime timestamptz NOT NULL,
+    fcst_datetime_kr timestamptz,
+    pop numeric,
+    pty numeric,
+    pcp text,
+    reh numeric,
+    sno text,
+    sky numeric,
+    tmp numeric,
+    tmn numeric,
+    tmx numeric,
+    uuu numeric,
+    vvv numeric,
+    wav numeric,
+    vec numeric,
+    wsd numeric,
+    updated_at timestamptz DEFAULT timezone('utc', now()),
+    updated_at_kr timestamptz,
+    CONSTRAINT weather_forecasts_grid_pkey PRIMARY KEY (fcst_datetime, nx, ny)
+);
+
+-- 관측소 조인 후 격자 + 예보 시각 범위 조회용
+CREATE INDEX IF NOT EXISTS idx_weather_forecasts_grid_cell_datetime_kr
+  ON public.weather_forecasts_grid(nx, ny, fcst_datetime_kr);
+
+-- 조인 키 (tide_weather_region → 격자)
+CREATE INDEX IF NOT EXISTS idx_tide_weather_region_nx_ny
+  ON public.tide_weather_region(nx, ny);
+
+COMMENT ON TABLE public.weather_forecasts_grid IS '단기예보 격자 단위 저장 (관측소별 조회는 weather_forecasts_by_location 뷰)';
+
+-- RLS: 읽기는 공개, 쓰기는 Service Role만 (weather_forecasts와 동일)
+ALTER TABLE public.weather_forecasts_grid ENABLE ROW LEVEL SECURITY;
+
+DROP POLICY IF EXISTS "Allow read access for all on weather_forecasts_grid" ON public.weather_forecasts_grid;
+DROP POLICY IF EXISTS "Allow write for service role on weather_forecasts_grid" ON public.weather_forecasts_grid;
+
+CREATE POLICY "Allow read access for all on weather_forecasts_grid" ON public.weather_forecasts_grid
+  FOR SELECT
+  USING (true);
+
+CREATE POLICY "Allow write for service role on weather_forecasts_grid" ON public.weather_forecasts_grid
+  FOR ALL
+  USING (auth.role() = 'service_role')
+  WITH CHECK (auth.role() = 'service_role');
+
+-- ============================================================================
+-- 2. 관측소별 조회 뷰 (weather_forecasts와 같은 컬럼)
+-- ============================================================================
+
+CREATE OR REPLACE VIEW public.weather_forecasts_by_location AS
+SELECT
+    g.nx,
+    g.ny,
+    r.name AS 한글지역명,
+    g.fcst_datetime_kr,
+    g.updated_at_kr,
+    g.base_date,
+    g.base_time,
+    g.fcst_datetime,
+    g.pop,
+    g.pty,
+    g.pcp,
+    g.reh,
+    g.sno,
+    g.sky,
+    g.tmp,
+    g.tmn,
+    g.tmx,
+    g.uuu,
+    g.vvv,
+    g.wav,
+    g.vec,
+    g.wsd,
+    g.updated_at,
+    r.code AS location_code
+FROM public.weather_forecasts_grid g
+JOIN public.tide_weather_region r ON r.nx = g.nx AND r.ny = g.ny;
+
+COMMENT ON VIEW public.weather_forecasts_by_location IS '격자 단위 예보를 관측소(location_code)별로 펼친 뷰';
@@ -1,12 +1,9 @@
 import csv
-import math
 import os
+import sys
 
-def calculate_distance(lat1, lon1, lat2, lon2):
-    """두 지점 간의 유클리드 거리를 계산합니다."""
-    if not all(isinstance(coord, (int, float)) for coord in [lat1, lon1, lat2, lon2]):
-        return float('inf')
-    return math.sqrt((lat1 - lat2)**2 + (lon1 - lon2)**2)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from station_index import StationIndex
 
 def load_abs_stations(filename):
     """
@@ -61,6 +58,10 @@ def find_closest_station_and_merge():
         print("오류: ABS 관측소 데이터 파일 중 하나 이상을 로드할 수 없거나 비어있습니다.")
         return
 
+    # 관측소 좌표 인덱스 (대원 거리 기준 최근접 검색)
+    index_a = StationIndex(abs_stations_a, lat_key='lat_float', lon_key='lon_float')
+    index_b = StationIndex(abs_stations_b, lat_key='lat_float', lon_key='lon_float')
+
     results = []
     original_fieldnames = []
     if not os.path.exists(tide_info_file):
@@ -76,8 +77,8 @@ def find_closest_station_and_merge():
                 tide_lat = float(tide_row['Latitude'])
                 tide_lon = float(tide_row['Longitude'])
 
-                closest_a = min(abs_stations_a, key=lambda s: calculate_distance(tide_lat, tide_lon, s['lat_float'], s['lon_float']))
-                closest_b = min(abs_stations_b, key=lambda s: calculate_distance(tide_lat, tide_lon, s['lat_float'], s['lon_float']))
+                closest_a, _ = index_a.nearest(tide_lat, tide_lon)[0]
+                closest_b, _ = index_b.nearest(tide_lat, tide_lon)[0]
 
                 tide_row['a_지역명(한글)'] = closest_a.get('지역명(한글)', '')
                 tide_row['a_STN ID'] = closest_a.get('STN ID', '')
@@ -1,12 +1,19 @@
+import argparse
 import csv
-import math
 import os
+import sys
 
-def calculate_distance(lat1, lon1, lat2, lon2):
-    """두 지점 간의 유클리드 거리를 계산합니다."""
-    if not all(isinstance(coord, (int, float)) for coord in [lat1, lon1, lat2, lon2]):
-        return float('inf')
-    return math.sqrt((lat1 - lat2)**2 + (lon1 - lon2)**2)
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from abs_availability_store import DEFAULT_DAYS, DEFAULT_MIN_RATIO, load_ab_stations
+from geodesy import chord_to_km, to_unit_vectors
+from station_index import StationIndex
+
+# 매칭 방식
+# - geodesic: 대원 거리 기준 최근접 (StationIndex, 기본값)
+# - euclidean: 위도/경도 차이의 유클리드 거리 기준 최근접 (기존 tide_abs_region 결과 재현/비교용)
+MATCH_MODES = ('geodesic', 'euclidean')
 
 def load_abs_stations(filename):
     """
@@ -40,27 +47,111 @@ def load_abs_stations(filename):
     
     return stations
 
-def find_closest_station_and_merge_new():
+def find_nearest_stations(stations, lats, lons, match_mode='geodesic'):
+    """
+    여러 지점에 대해 가장 가까운 관측소를 한 번에 찾습니다.
+    반환값: [(관측소 row, 거리 km), ...] (입력 지점 순서와 동일)
+    거리는 매칭 방식과 관계없이 대원 거리(km)입니다.
+    """
+    if not lats:
+        return []
+
+    if match_mode == 'geodesic':
+        index = StationIndex(stations, lat_key='lat_float', lon_key='lon_float')
+        idx, distances = index.nearest_batch(lats, lons, k=1)
+        return [(stations[i], float(d)) for i, d in zip(idx[:, 0], distances[:, 0])]
+
+    if match_mode == 'euclidean':
+        station_lats = np.array([s['lat_float'] for s in stations])
+        station_lons = np.array([s['lon_float'] for s in stations])
+        query_lats = np.asarray(lats, dtype=np.float64)
+        query_lons = np.asarray(lons, dtype=np.float64)
+        deg_dist = (query_lats[:, None] - station_lats[None, :]) ** 2 + (query_lons[:, None] - station_lons[None, :]) ** 2
+        idx = np.argmin(deg_dist, axis=1)
+        chord = np.linalg.norm(to_unit_vectors(query_lats, query_lons) - to_unit_vectors(station_lats[idx], station_lons[idx]), axis=1)
+        return [(stations[i], float(d)) for i, d in zip(idx, chord_to_km(chord))]
+
+    raise ValueError(f"알 수 없는 매칭 방식: {match_mode}")
+
+AB_FIELDNAMES = ['a_지역명(한글)', 'a_STN ID', 'a_위도(LAT)', 'a_경도(LON)', 'a_제공 정보', 'a_거리(km)',
+                 'b_지역명(한글)', 'b_STN ID', 'b_위도(LAT)', 'b_경도(LON)', 'b_제공 정보', 'b_거리(km)']
+
+def merge_closest_stations(tide_rows, abs_stations_a, abs_stations_b, match_mode='geodesic', source='tidedata'):
+    """
+    tide_rows 각 행에 가장 가까운 a/b 관측소 정보를 채워 넣습니다. (행 dict를 직접 수정)
+    좌표가 잘못된 행은 매칭 정보 없이 그대로 둡니다.
+    """
+    # 좌표가 올바른 행만 매칭 대상으로 모읍니다.
+    matched_rows = []
+    tide_lats = []
+    tide_lons = []
+    for tide_row in tide_rows:
+        try:
+            tide_lat = float(tide_row['Latitude'])
+            tide_lon = float(tide_row['Longitude'])
+            matched_rows.append(tide_row)
+            tide_lats.append(tide_lat)
+            tide_lons.append(tide_lon)
+
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"경고: '{source}' 파일의 행을 건너뜁니다. 누락/잘못된 데이터: {tide_row}, 오류: {e}")
+
+    nearest_a = find_nearest_stations(abs_stations_a, tide_lats, tide_lons, match_mode)
+    nearest_b = find_nearest_stations(abs_stations_b, tide_lats, tide_lons, match_mode)
+
+    for tide_row, (closest_a, distance_a), (closest_b, distance_b) in zip(matched_rows, nearest_a, nearest_b):
+        tide_row['a_지역명(한글)'] = closest_a.get('지역명(한글)', '')
+        tide_row['a_STN ID'] = closest_a.get('STN ID', '')
+        tide_row['a_위도(LAT)'] = closest_a.get('위도(LAT)', '')
+        tide_row['a_경도(LON)'] = closest_a.get('경도(LON)', '')
+        tide_row['a_제공 정보'] = closest_a.get('제공 정보', '')
+        tide_row['a_거리(km)'] = round(distance_a, 2)
+
+        tide_row['b_지역명(한글)'] = closest_b.get('지역명(한글)', '')
+        tide_row['b_STN ID'] = closest_b.get('STN ID', '')
+        tide_row['b_위도(LAT)'] = closest_b.get('위도(LAT)', '')
+        tide_row['b_경도(LON)'] = closest_b.get('경도(LON)', '')
+        tide_row['b_제공 정보'] = closest_b.get('제공 정보', '')
+        tide_row['b_거리(km)'] = round(distance_b, 2)
+
+    return tide_rows
+
+def merged_fieldnames(original_fieldnames):
+    """원본 컬럼 + a/b 매칭 컬럼 (원본에 이미 있는 컬럼은 제외)"""
+    return original_fieldnames + [fn for fn in AB_FIELDNAMES if fn not in original_fieldnames]
+
+def find_closest_station_and_merge_new(match_mode='geodesic', tide_info_file=None, abs_info_file_a=None,
+                                       abs_info_file_b=None, output_file=None, availability_store=None,
+                                       min_ratio=DEFAULT_MIN_RATIO, days=DEFAULT_DAYS):
     """
     tidedata 파일의 각 지역에 대해 abs_region_data_a.csv와 abs_region_data_b.csv에서
     가장 가까운 지역을 각각 찾아 정보를 병합합니다. (b_지역명(한글) 추가)
+    a/b 관측소별로 인덱스를 한 번만 만들고 전체 지역을 일괄 검색하며,
+    매칭된 관측소까지의 거리(km)를 a_거리(km), b_거리(km) 컬럼에 기록합니다.
+    availability_store를 주면 CSV 대신 제공률 저장소에서 최근 days일 제공률이
+    min_ratio 이상인 a/b 관측소를 고릅니다.
     """
     # 파일 경로를 스크립트 위치 기준으로 상대 경로 설정
     script_dir = os.path.dirname(__file__)
-    tide_info_file = os.path.join(script_dir, 'tidedata-station_info_rows.csv')
-    abs_info_file_a = os.path.join(script_dir, 'abs_region_data_a.csv')
-    abs_info_file_b = os.path.join(script_dir, 'abs_region_data_b.csv')
-    output_file = os.path.join(script_dir, 'tide-abs_info_ab_new.csv')
-
-    abs_stations_a = load_abs_stations(abs_info_file_a)
-    abs_stations_b = load_abs_stations(abs_info_file_b)
+    tide_info_file = tide_info_file or os.path.join(script_dir, 'tidedata-station_info_rows.csv')
+    abs_info_file_a = abs_info_file_a or os.path.join(script_dir, 'abs_region_data_a.csv')
+    abs_info_file_b = abs_info_file_b or os.path.join(script_dir, 'abs_region_data_b.csv')
+    output_file = output_file or os.path.join(script_dir, 'tide-abs_info_ab_new.csv')
+
+    if availability_store:
+        try:
+            abs_stations_a, abs_stations_b = load_ab_stations(availability_store, min_ratio, days)
+        except (OSError, ValueError, KeyError) as e:
+            print(f"오류: 제공률 저장소 '{availability_store}'를 읽을 수 없습니다. 오류: {e}")
+            return
+    else:
+        abs_stations_a = load_abs_stations(abs_info_file_a)
+        abs_stations_b = load_abs_stations(abs_info_file_b)
 
     if not abs_stations_a or not abs_stations_b:
         print("오류: ABS 관측소 데이터 파일 중 하나 이상을 로드할 수 없거나 비어있습니다.")
         return
 
-    results = []
-    original_fieldnames = []
     if not os.path.exists(tide_info_file):
         print(f"오류: '{tide_info_file}' 파일을 찾을 수 없습니다.")
         return
@@ -68,52 +159,33 @@ def find_closest_station_and_merge_new():
     with open(tide_info_file, 'r', encoding='utf-8') as f:
         reader = csv.DictReader(f)
         original_fieldnames = reader.fieldnames or []
-
-        for tide_row in reader:
-            try:
-                tide_lat = float(tide_row['Latitude'])
-                tide_lon = float(tide_row['Longitude'])
-
-                closest_a = min(abs_stations_a, key=lambda s: calculate_distance(tide_lat, tide_lon, s['lat_float'], s['lon_float']))
-                closest_b = min(abs_stations_b, key=lambda s: calculate_distance(tide_lat, tide_lon, s['lat_float'], s['lon_float']))
-
-                tide_row['a_지역명(한글)'] = closest_a.get('지역명(한글)', '')
-                tide_row['a_STN ID'] = closest_a.get('STN ID', '')
-                tide_row['a_위도(LAT)'] = closest_a.get('위도(LAT)', '')
-                tide_row['a_경도(LON)'] = closest_a.get('경도(LON)', '')
-                tide_row['a_제공 정보'] = closest_a.get('제공 정보', '')
-
-                tide_row['b_지역명(한글)'] = closest_b.get('지역명(한글)', '')
-                tide_row['b_STN ID'] = closest_b.get('STN ID', '')
-                tide_row['b_위도(LAT)'] = closest_b.get('위도(LAT)', '')
-                tide_row['b_경도(LON)'] = closest_b.get('경도(LON)', '')
-                tide_row['b_제공 정보'] = closest_b.get('제공 정보', '')
-                
-                results.append(tide_row)
-
-            except (ValueError, KeyError) as e:
-                print(f"경고: '{tide_info_file}' 파일의 행을 건너뜁니다. 누락/잘못된 데이터: {tide_row}, 오류: {e}")
-                results.append(tide_row)
+        results = merge_closest_stations(list(reader), abs_stations_a, abs_stations_b, match_mode, tide_info_file)
 
     if not results:
         print("결과 데이터가 없습니다.")
         return
-        
-    new_fieldnames_a = ['a_지역명(한글)', 'a_STN ID', 'a_위도(LAT)', 'a_경도(LON)', 'a_제공 정보']
-    new_fieldnames_b = ['b_지역명(한글)', 'b_STN ID', 'b_위도(LAT)', 'b_경도(LON)', 'b_제공 정보']
-    
-    output_fieldnames = original_fieldnames + \
-                        [fn for fn in new_fieldnames_a if fn not in original_fieldnames] + \
-                        [fn for fn in new_fieldnames_b if fn not in original_fieldnames]
+
+    output_fieldnames = merged_fieldnames(original_fieldnames)
 
     try:
         with open(output_file, 'w', newline='', encoding='utf-8-sig') as f:
             writer = csv.DictWriter(f, fieldnames=output_fieldnames, extrasaction='ignore')
             writer.writeheader()
             writer.writerows(results)
-        print(f"성공적으로 '{os.path.basename(output_file)}' 파일을 생성했습니다.")
+        print(f"성공적으로 '{os.path.basename(output_file)}' 파일을 생성했습니다. (매칭 방식: {match_mode})")
     except IOError as e:
         print(f"오류: '{os.path.basename(output_file)}' 파일에 쓸 수 없습니다. 오류: {e}")
 
 if __name__ == "__main__":
-    find_closest_station_and_merge_new()
+    parser = argparse.ArgumentParser(description='조위 관측소별 최근접 a/b 해양관측소 매칭')
+    parser.add_argument('--mode', choices=MATCH_MODES, default='geodesic',
+                        help='매칭 방식 (geodesic: 대원 거리, euclidean: 기존 위경도 유클리드 거리)')
+    parser.add_argument('--availability-store', metavar='NPZ',
+                        help='abs_region_data_a/b.csv 대신 제공률 저장소(abs_availability_store.py) 사용')
+    parser.add_argument('--min-ratio', type=float, default=DEFAULT_MIN_RATIO,
+                        help='--availability-store 사용 시 항목별 최소 제공률')
+    parser.add_argument('--days', type=float, default=DEFAULT_DAYS,
+                        help='--availability-store 사용 시 제공률 계산 기간(일)')
+    args = parser.parse_args()
+    find_closest_station_and_merge_new(match_mode=args.mode, availability_store=args.availability_store,
+                                       min_ratio=args.min_ratio, days=args.days)
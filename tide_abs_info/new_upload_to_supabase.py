@@ -1,11 +1,14 @@
+import argparse
 import os
 import csv
 from dotenv import load_dotenv
 from supabase import create_client, Client
 
-def upload_new_csv_to_supabase():
+def upload_new_csv_to_supabase(csv_file_path=None):
     """
     tide-abs_info_ab_new.csv 파일의 데이터를 Supabase의 tide_abs_region 테이블에 업로드합니다.
+    csv_file_path를 지정하면 해당 파일을 업로드합니다.
+    (예: match_stations.py --per-variable 로 만든 tide_abs_region_individual_obs.csv)
     """
     # .env 파일에서 환경 변수 로드
     # 이 스크립트 파일이 있는 폴더의 상위 폴더(프로젝트 루트)에서 .env를 찾습니다.
@@ -26,7 +29,7 @@ def upload_new_csv_to_supabase():
     table_name = "tide_abs_region"
     # 스크립트와 동일한 디렉토리에 있는 CSV 파일을 대상으로 경로를 설정합니다.
     script_dir = os.path.dirname(__file__)
-    csv_file_path = os.path.join(script_dir, "tide-abs_info_ab_new.csv")
+    csv_file_path = csv_file_path or os.path.join(script_dir, "tide-abs_info_ab_new.csv")
 
     # CSV 파일 읽기 및 데이터 업로드
     try:
@@ -43,12 +46,14 @@ def upload_new_csv_to_supabase():
                 row = cleaned_row
 
                 # 테이블에 없는 컬럼 제거 (필요 시)
-                columns_to_remove = ['AddressA', 'AddressB', 'AddressC', 'marine_reg_name']
+                columns_to_remove = ['AddressA', 'AddressB', 'AddressC', 'marine_reg_name', 'a_거리(km)', 'b_거리(km)']
                 for col in columns_to_remove:
                     row.pop(col, None)
 
                 # 숫자 필드에 대해 빈 문자열을 None으로 변환
-                for field in ["Latitude", "Longitude", "a_위도(LAT)", "a_경도(LON)", "b_위도(LAT)", "b_경도(LON)"]:
+                numeric_fields = ["Latitude", "Longitude", "a_위도(LAT)", "a_경도(LON)", "b_위도(LAT)", "b_경도(LON)"]
+                numeric_fields += [f"{obs}_{col}" for obs in ("wt", "swh", "at", "wd", "ws") for col in ("위도(LAT)", "경도(LON)")]
+                for field in numeric_fields:
                     if row.get(field) == '':
                         row[field] = None
 
@@ -75,4 +80,7 @@ def upload_new_csv_to_supabase():
         print(f"작업 중 오류가 발생했습니다: {e}")
 
 if __name__ == "__main__":
-    upload_new_csv_to_supabase()
+    parser = argparse.ArgumentParser(description='tide_abs_region 테이블 업로드')
+    parser.add_argument('--csv', help='업로드할 CSV 파일 경로 (기본값: tide-abs_info_ab_new.csv)')
+    args = parser.parse_args()
+    upload_new_csv_to_supabase(args.csv)
@@ -4,22 +4,9 @@
 먼 관측소가 추천되는 문제를 디버깅
 """
 
-import math
 import json
 
-def haversine_distance(lat1, lon1, lat2, lon2):
-    """Haversine formula로 두 지점 간 거리 계산 (km)"""
-    R = 6371  # 지구 반지름 (km)
-
-    dLat = math.radians(lat2 - lat1)
-    dLon = math.radians(lon2 - lon1)
-
-    a = (math.sin(dLat/2) * math.sin(dLat/2) +
-         math.cos(math.radians(lat1)) * math.cos(math.radians(lat2)) *
-         math.sin(dLon/2) * math.sin(dLon/2))
-    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1-a))
-
-    return R * c
+from station_index import StationIndex
 
 # A지점 샘플 (파고, 수온 제공)
 a_stations = [
@@ -41,6 +28,8 @@ tide_stations = [
     {"code": "DT_0005", "name": "부산", "lat": 35.096389, "lon": 129.035278, "marine_reg": "남해동부"},
 ]
 
+tide_index = StationIndex(tide_stations)
+
 print("=" * 100)
 print("해양관측소 → 조석관측소 매칭 검증")
 print("=" * 100)
@@ -49,17 +38,11 @@ for marine in a_stations:
     print(f"\n🌊 {marine['name']} A지점 ({marine['id']}) - 위도: {marine['lat']:.4f}, 경도: {marine['lon']:.4f}")
     print("-" * 100)
 
-    # 모든 조석관측소와의 거리 계산
-    distances = []
-    for tide in tide_stations:
-        dist = haversine_distance(marine['lat'], marine['lon'], tide['lat'], tide['lon'])
-        distances.append({
-            'tide': tide,
-            'distance': dist
-        })
-
-    # 거리순 정렬
-    distances.sort(key=lambda x: x['distance'])
+    # 모든 조석관측소를 거리순으로 조회
+    distances = [
+        {'tide': tide, 'distance': dist}
+        for tide, dist in tide_index.nearest(marine['lat'], marine['lon'], k=len(tide_index))
+    ]
 
     # TOP 5 출력
     print(f"{'순위':<5} {'조석관측소':<15} {'코드':<12} {'거리(km)':<12} {'해역':<15} {'판정':<10}")